@@ -1,4 +1,4 @@
-import React, { useCallback, useEffect, useMemo, useRef, useState } from "react";
+import React, { useCallback, useEffect, useMemo, useState } from "react";
 import { motion } from "framer-motion";
 
 import Header from "./components/ui/Header";
@@ -8,6 +8,7 @@ import {
   deleteReservation,
   listReservationsBySession,
   loginAdmin,
+  subscribeReservationStream,
 } from "./api/client";
 import type { SessionReservations } from "./api/types";
 import { slotsOfDay } from "./utils/time";
@@ -32,7 +33,6 @@ export default function App() {
   const [layoutMode, setLayoutMode] = useState<"grid" | "list">("grid");
 
   const [autoRefresh, setAutoRefresh] = useState(true);
-  const intervalRef = useRef<number | null>(null);
 
   const goToStep = useCallback((next: Step) => {
     setError(null);
@@ -95,34 +95,10 @@ export default function App() {
   }, [date, step, token, load]);
 
   useEffect(() => {
-    if (step !== 2 || !token) return;
-
-    if (autoRefresh) {
-      if (intervalRef.current) {
-        window.clearInterval(intervalRef.current);
-      }
-      intervalRef.current = window.setInterval(load, 15000);
-      return () => {
-        if (intervalRef.current) {
-          window.clearInterval(intervalRef.current);
-          intervalRef.current = null;
-        }
-      };
-    }
-
-    if (intervalRef.current) {
-      window.clearInterval(intervalRef.current);
-      intervalRef.current = null;
-    }
-  }, [autoRefresh, step, token, load]);
-
-  useEffect(() => {
-    return () => {
-      if (intervalRef.current) {
-        window.clearInterval(intervalRef.current);
-      }
-    };
-  }, []);
+    if (step !== 2 || !token || !autoRefresh) return;
+    // Refetch when the server reports a change (the ETag keeps unchanged days cheap).
+    return subscribeReservationStream(date, load);
+  }, [autoRefresh, date, step, token, load]);
 
   const kpi = useMemo(() => {
     const totalReservations = sessions.reduce((acc, session) => acc + session.reservations.length, 0);
@@ -73,3 +73,36 @@ export async function deleteReservation(
   }
   return (await res.json()) as DeleteReservationResponse;
 }
+
+/**
+ * Subscribe to committed reservation changes for one day. `onChange` fires for every
+ * created/deleted/status event and whenever the stream (re)connects, so callers can
+ * refetch and never miss a change made while disconnected.
+ */
+export function subscribeReservationStream(dateISO: string, onChange: () => void): () => void {
+  let closed = false;
+  let source: EventSource | null = null;
+
+  const connect = () => {
+    if (closed) return;
+    const current = new EventSource(
+      `${API_BASE}/api/reservations/stream?date=${encodeURIComponent(dateISO)}`
+    );
+    current.onopen = () => onChange();
+    for (const type of ["created", "deleted", "status"]) {
+      current.addEventListener(type, () => onChange());
+    }
+    // The server cut us off as a slow consumer: reconnect with a fresh stream.
+    current.addEventListener("dropped", () => {
+      current.close();
+      window.setTimeout(connect, 1000);
+    });
+    source = current;
+  };
+
+  connect();
+  return () => {
+    closed = true;
+    source?.close();
+  };
+}
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Optional
+
+from sqlalchemy import Select, and_, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from .fast_json import business_local, reservation_dict
+from .live_events import stage_event
+from .models import Reservation, ReservationChange, ReservationStatus
+from .time_utils import UTC
+
+
+def record_reservation_change(session: Session, *, kind: str, reservation: Reservation) -> None:
+    """
+    Append a ``created``/``deleted`` entry in the caller's transaction and stage the
+    matching live event. ``reservation`` must be flushed (or still loaded, for deletes).
+    """
+    payload = reservation_dict(reservation)
+    business_date = date.fromisoformat(payload["date"])
+    session.add(
+        ReservationChange(
+            kind=kind,
+            reservation_id=reservation.id,
+            session_id=reservation.session_id,
+            business_date=business_date,
+            status=reservation.status,
+            payload=payload,
+        )
+    )
+    stage_event(session, kind, business_date, payload)
+
+
+def record_status_changes(
+    session: Session, *, rows: list[tuple], status: ReservationStatus
+) -> None:
+    """Append ``status`` entries for ``(id, session_id, start_time)`` rows with one INSERT."""
+    changed_at = datetime.now(UTC)
+    entries: list[dict[str, Any]] = []
+    for reservation_id, session_id, start_time in rows:
+        business_date = business_local(start_time).date()
+        entries.append(
+            {
+                "kind": "status",
+                "reservation_id": reservation_id,
+                "session_id": session_id,
+                "business_date": business_date,
+                "status": status,
+                "payload": None,
+                "changed_at": changed_at,
+            }
+        )
+        stage_event(
+            session,
+            "status",
+            business_date,
+            {
+                "id": reservation_id,
+                "sessionId": session_id,
+                "date": business_date.isoformat(),
+                "status": status.value,
+            },
+        )
+    if entries:
+        session.execute(insert(ReservationChange), entries)
+
+
+def latest_change_seq_stmt() -> Select:
+    return select(func.max(ReservationChange.seq))
+
+
+def latest_change_seq(session: Session) -> int:
+    return session.scalar(latest_change_seq_stmt()) or 0
+
+
+def oldest_change_seq(session: Session) -> Optional[int]:
+    return session.scalar(select(func.min(ReservationChange.seq)))
+
+
+def changes_since(
+    session: Session, *, since: int, limit: int, business_date: date | None = None
+) -> list[ReservationChange]:
+    conditions = [ReservationChange.seq > since]
+    if business_date is not None:
+        conditions.append(ReservationChange.business_date == business_date)
+    stmt = (
+        select(ReservationChange)
+        .where(and_(*conditions))
+        .order_by(ReservationChange.seq)
+        .limit(limit)
+    )
+    return session.scalars(stmt).all()
+
+
+def compact_changes(session: Session, *, before: datetime) -> int:
+    """
+    Drop entries recorded before ``before``. The newest entry is always kept so
+    ``oldest_change_seq`` can still tell clients whether their cursor fell behind.
+    The caller commits.
+    """
+    newest = latest_change_seq(session)
+    result = session.execute(
+        delete(ReservationChange)
+        .where(ReservationChange.changed_at < before, ReservationChange.seq < newest)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount or 0
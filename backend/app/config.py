@@ -68,6 +68,136 @@ class Settings(BaseModel):
         default=os.getenv("AUTO_SEED_SESSIONS", "0").lower()
         in {"1", "true", "yes", "on"}
     )
+    # Serve the hot read endpoints from async handlers on an asyncio engine
+    # (aiosqlite / asyncpg) instead of sync handlers in the threadpool.
+    database_async: bool = Field(
+        default=os.getenv("DATABASE_ASYNC", "0").lower()
+        in {"1", "true", "yes", "on"}
+    )
+    # In-process bitmap of occupied slots used for overlap checks. Disable when
+    # several worker processes write to the same database.
+    slot_index_enabled: bool = Field(
+        default=os.getenv("SLOT_INDEX_ENABLED", "1").lower()
+        in {"1", "true", "yes", "on"}
+    )
+    # Serve /api/plates/match from an in-memory index of yesterday..tomorrow.
+    plate_match_cache_enabled: bool = Field(
+        default=os.getenv("PLATE_MATCH_CACHE_ENABLED", "1").lower()
+        in {"1", "true", "yes", "on"}
+    )
+    # Largest weighted edit distance accepted by fuzzy plate matching; a likely OCR
+    # confusion (e.g. 두/무, 0/8) costs 0.5, any other edit 1.0. The default allows one
+    # known confusion only; larger values can match another car's reservation.
+    plate_fuzzy_max_distance: float = Field(
+        default=float(os.getenv("PLATE_FUZZY_MAX_DISTANCE", "0.5"))
+    )
+    # Reservation insert strategy:
+    # - pessimistic : lock the session and check overlaps before inserting
+    # - optimistic  : insert in a SAVEPOINT and decode unique-constraint errors (skips
+    #                 the slot index too; not faster on SQLite, see README)
+    reservation_insert_mode: str = Field(
+        default=os.getenv("RESERVATION_INSERT_MODE", "pessimistic").lower()
+    )
+    # Reservation writes are queued per charging session and committed in groups.
+    write_group_max: int = Field(default=int(os.getenv("WRITE_GROUP_MAX", "32")))
+    write_retry_attempts: int = Field(default=int(os.getenv("WRITE_RETRY_ATTEMPTS", "5")))
+    # Serialize the reservation list endpoints straight to bytes with orjson
+    # (same wire format, skips per-row Pydantic models). Needs orjson installed.
+    fast_json_responses: bool = Field(
+        default=os.getenv("FAST_JSON_RESPONSES", "0").lower()
+        in {"1", "true", "yes", "on"}
+    )
+    # /api/reservations/stream: heartbeat interval and per-client event backlog;
+    # a client whose backlog fills up is disconnected.
+    sse_heartbeat_seconds: float = Field(default=float(os.getenv("SSE_HEARTBEAT_SECONDS", "15")))
+    sse_client_queue_size: int = Field(default=int(os.getenv("SSE_CLIENT_QUEUE_SIZE", "100")))
+    # reservation_changes entries older than this are compacted by the status sweeper.
+    change_log_retention_days: int = Field(
+        default=int(os.getenv("CHANGE_LOG_RETENTION_DAYS", "7"))
+    )
+    # Shared connection pool for the plate recognition upstreams (OpenAI / LP service).
+    # HTTP/2 is used when the h2 package is installed and the upstream negotiates it.
+    upstream_max_connections: int = Field(
+        default=int(os.getenv("UPSTREAM_MAX_CONNECTIONS", "20"))
+    )
+    upstream_max_keepalive: int = Field(default=int(os.getenv("UPSTREAM_MAX_KEEPALIVE", "10")))
+    upstream_keepalive_seconds: float = Field(
+        default=float(os.getenv("UPSTREAM_KEEPALIVE_SECONDS", "120"))
+    )
+    upstream_http2: bool = Field(
+        default=os.getenv("UPSTREAM_HTTP2", "1").lower() in {"1", "true", "yes", "on"}
+    )
+    # Ping the active upstream this often so an idle connection stays open (0 = off).
+    upstream_warm_interval_seconds: float = Field(
+        default=float(os.getenv("UPSTREAM_WARM_INTERVAL_SECONDS", "0"))
+    )
+    # POST /api/license-plates/jobs: background workers, pending-job bound (503 beyond
+    # it) and how long finished jobs stay fetchable.
+    recognition_job_workers: int = Field(default=int(os.getenv("RECOGNITION_JOB_WORKERS", "4")))
+    recognition_job_queue_size: int = Field(
+        default=int(os.getenv("RECOGNITION_JOB_QUEUE_SIZE", "100"))
+    )
+    recognition_job_retention_seconds: float = Field(
+        default=float(os.getenv("RECOGNITION_JOB_RETENTION_SECONDS", "600"))
+    )
+    # Hosts callbackUrl may point at (comma separated). Empty: any host whose
+    # addresses are all public; loopback, private and link-local targets are refused.
+    recognition_job_callback_hosts: list[str] = Field(
+        default_factory=lambda: [
+            host.strip().lower()
+            for host in os.getenv("RECOGNITION_JOB_CALLBACK_HOSTS", "").split(",")
+            if host.strip()
+        ]
+    )
+    # Callbacks use their own small connection pool, not the upstream one.
+    recognition_job_callback_connections: int = Field(
+        default=int(os.getenv("RECOGNITION_JOB_CALLBACK_CONNECTIONS", "4"))
+    )
+    # Recognition admission: concurrent recognitions, requests allowed to wait for a
+    # slot, and how long the oldest may have waited before new ones get 503 +
+    # Retry-After. Image preprocessing runs on RECOGNITION_THREADS private threads.
+    recognition_max_concurrent: int = Field(
+        default=int(os.getenv("RECOGNITION_MAX_CONCURRENT", "8"))
+    )
+    recognition_max_waiting: int = Field(default=int(os.getenv("RECOGNITION_MAX_WAITING", "32")))
+    recognition_wait_budget_seconds: float = Field(
+        default=float(os.getenv("RECOGNITION_WAIT_BUDGET_SECONDS", "2"))
+    )
+    recognition_threads: int = Field(default=int(os.getenv("RECOGNITION_THREADS", "2")))
+    # Shrink uploads before recognition: decode once (EXIF orientation applied), fit
+    # the longer edge into PLATE_PREPROCESS_MAX_EDGE, optionally drop colour, re-encode.
+    plate_preprocess_enabled: bool = Field(
+        default=os.getenv("PLATE_PREPROCESS_ENABLED", "1").lower()
+        in {"1", "true", "yes", "on"}
+    )
+    plate_preprocess_max_edge: int = Field(
+        default=int(os.getenv("PLATE_PREPROCESS_MAX_EDGE", "1280"))
+    )
+    plate_preprocess_grayscale: bool = Field(
+        default=os.getenv("PLATE_PREPROCESS_GRAYSCALE", "0").lower()
+        in {"1", "true", "yes", "on"}
+    )
+    plate_preprocess_jpeg_quality: int = Field(
+        default=int(os.getenv("PLATE_PREPROCESS_JPEG_QUALITY", "85"))
+    )
+    # Reuse recognition results for repeated frames: exact SHA-256 match first, then
+    # the nearest perceptual hash within RECOGNITION_CACHE_MAX_DISTANCE bits (of 256).
+    # A "similar" hit returns the earlier frame's plate, which can be another car parked
+    # in the same bay, so the default stays conservative; raise it only after measuring
+    # real frames with tools/check_recognition_cache_distance.py.
+    recognition_cache_enabled: bool = Field(
+        default=os.getenv("RECOGNITION_CACHE_ENABLED", "1").lower()
+        in {"1", "true", "yes", "on"}
+    )
+    recognition_cache_size: int = Field(default=int(os.getenv("RECOGNITION_CACHE_SIZE", "256")))
+    recognition_cache_ttl_seconds: float = Field(
+        default=float(os.getenv("RECOGNITION_CACHE_TTL_SECONDS", "120"))
+    )
+    recognition_cache_max_distance: int = Field(
+        default=int(os.getenv("RECOGNITION_CACHE_MAX_DISTANCE", "4"))
+    )
+    # Optional JSON file the cache is loaded from at startup and saved to at shutdown.
+    recognition_cache_path: str = Field(default=os.getenv("RECOGNITION_CACHE_PATH", ""))
     cors_origins: list[str] = Field(
         default_factory=lambda: [
             origin.strip()
@@ -100,6 +230,17 @@ class Settings(BaseModel):
             ),
         )
     )
+    # gptapi only: ask on a PLATE_TIER1_MAX_EDGE thumbnail at low detail first and
+    # escalate (full image at high detail, then PLATE_OPENAI_ESCALATION_MODEL) only
+    # when the answer does not parse as a Korean plate.
+    plate_recognition_tiered: bool = Field(
+        default=os.getenv("PLATE_RECOGNITION_TIERED", "0").lower()
+        in {"1", "true", "yes", "on"}
+    )
+    plate_tier1_max_edge: int = Field(default=int(os.getenv("PLATE_TIER1_MAX_EDGE", "512")))
+    plate_openai_escalation_model: str = Field(
+        default=os.getenv("PLATE_OPENAI_ESCALATION_MODEL", "")
+    )
     openai_api_key: str = Field(default=os.getenv("OPENAI_API_KEY", ""))
     battery_rtdb_url: str = Field(
         default=os.getenv(
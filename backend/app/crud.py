@@ -1,25 +1,52 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from datetime import date, datetime, timedelta
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Sequence
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, selectinload
 
-from .models import ChargingSession, Reservation, ReservationSlot, ReservationStatus
+from .config import get_settings
+from .models import (
+    LIVE_STATUSES,
+    ChargingSession,
+    Reservation,
+    ReservationSlot,
+    ReservationStatus,
+    ScheduleVersion,
+)
+from .change_log import record_reservation_change, record_status_changes
+from .plate_cache import plate_match_cache, plate_match_cache_enabled, record_plate_change
+from .plate_fuzzy import EDIT_COST, plate_distance_units
+from .slot_index import (
+    load_bitmaps,
+    masks_for_slots,
+    record_add,
+    record_remove,
+    slot_index,
+    slot_index_enabled,
+)
 from .time_utils import (
     UTC,
     business_day_bounds_utc,
     business_timezone,
     ensure_utc,
+    to_business_local,
 )
 
 SLOT_INTERVAL_MINUTES = 30
+MIGRATION_CHUNK_SIZE = 500
 OVERLAP_ERROR_MESSAGE = "해당 시간대 이미 예약이 존재합니다."
 
 
+def optimistic_inserts_enabled() -> bool:
+    return get_settings().reservation_insert_mode == "optimistic"
+
+
 def _lock_session(session: Session, *, session_id: int) -> None:
     """
     Acquire a row-level lock for the target charging session so that concurrent
@@ -49,8 +76,60 @@ def ensure_base_sessions(session: Session, *, names: Iterable[str]) -> None:
     session.commit()
 
 
-def list_sessions(session: Session) -> list[ChargingSession]:
-    return session.scalars(select(ChargingSession).order_by(ChargingSession.id)).all()
+def list_sessions_stmt(*, limit: int | None = None, offset: int = 0) -> Select:
+    stmt = select(ChargingSession).order_by(ChargingSession.id).offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def list_sessions(
+    session: Session, *, limit: int | None = None, offset: int = 0
+) -> list[ChargingSession]:
+    return session.scalars(list_sessions_stmt(limit=limit, offset=offset)).all()
+
+
+def reservations_in_range_stmt(
+    *,
+    start: datetime,
+    end: datetime,
+    session_ids: Iterable[int] | None = None,
+    status: ReservationStatus | None = None,
+) -> Select:
+    """Reservations starting in ``[start, end)``, ordered by session_id then start_time."""
+    conditions = [Reservation.start_time >= start, Reservation.start_time < end]
+    if session_ids is not None:
+        conditions.append(Reservation.session_id.in_(list(session_ids)))
+    if status is not None:
+        conditions.append(Reservation.status == status)
+    return (
+        select(Reservation)
+        .where(and_(*conditions))
+        .order_by(Reservation.session_id, Reservation.start_time)
+    )
+
+
+def group_by_session(reservations: Iterable[Reservation]) -> dict[int, list[Reservation]]:
+    grouped: dict[int, list[Reservation]] = defaultdict(list)
+    for reservation in reservations:
+        grouped[reservation.session_id].append(reservation)
+    return grouped
+
+
+def reservations_grouped_by_session(
+    session: Session,
+    *,
+    start: datetime,
+    end: datetime,
+    session_ids: Iterable[int] | None = None,
+    status: ReservationStatus | None = None,
+) -> dict[int, list[Reservation]]:
+    """
+    Fetch reservations starting in ``[start, end)`` with a single query and bucket
+    them by session_id, each bucket ordered by start_time.
+    """
+    stmt = reservations_in_range_stmt(start=start, end=end, session_ids=session_ids, status=status)
+    return group_by_session(session.scalars(stmt))
 
 
 def reservations_by_date(session: Session, *, date_value: date) -> list[Reservation]:
@@ -81,6 +160,25 @@ def reservations_by_session_and_date(
     return session.scalars(stmt).all()
 
 
+def reservations_by_date_grouped(
+    session: Session, *, date_value: date, status: ReservationStatus | None = None
+) -> dict[int, list[Reservation]]:
+    """Return every session's reservations for the business day, keyed by session_id."""
+    start, end = business_day_bounds_utc(date_value)
+    return reservations_grouped_by_session(session, start=start, end=end, status=status)
+
+
+def slot_bitmaps_by_date(
+    session: Session, *, session_ids: Iterable[int], date_value: date
+) -> dict[int, int]:
+    """Return a bitmap of occupied 30-minute slots per session for the business day."""
+    if slot_index_enabled():
+        return slot_index.occupied_for_day(
+            session, session_ids=session_ids, business_date=date_value
+        )
+    return load_bitmaps(session, session_ids=session_ids, business_date=date_value)
+
+
 def create_reservation(
     session: Session,
     *,
@@ -89,9 +187,22 @@ def create_reservation(
     start_time: datetime,
     end_time: datetime,
     contact_email: str | None = None,
+    optimistic: bool | None = None,
 ) -> Reservation:
-    # Prevent concurrent reservation creation on the same session.
-    _lock_session(session, session_id=session_id)
+    """
+    Insert a reservation and its slots.
+
+    The default pessimistic path locks the session and checks overlaps before
+    inserting. The optimistic path skips both (including the slot index), inserts
+    inside a SAVEPOINT and lets ``uq_session_slot`` / ``uq_reservation_session_start``
+    reject conflicts; it issues as many statements, with SAVEPOINT/RELEASE in place
+    of the lock and overlap reads.
+    """
+    if optimistic is None:
+        optimistic = optimistic_inserts_enabled()
+    if not optimistic:
+        # Prevent concurrent reservation creation on the same session.
+        _lock_session(session, session_id=session_id)
 
     start_time_utc = ensure_utc(start_time)
     end_time_utc = ensure_utc(end_time)
@@ -101,7 +212,8 @@ def create_reservation(
         raise ValueError("종료 시간이 시작 시간 이후여야 합니다.")
 
     normalized_plate = normalize_plate(plate)
-    ensure_no_overlap(session, session_id=session_id, start=start_time_utc, end=end_time_utc)
+    if not optimistic:
+        ensure_no_overlap(session, session_id=session_id, start=start_time_utc, end=end_time_utc)
     ensure_no_conflict_for_plate(
         session, plate=normalized_plate, start=start_time_utc, end=end_time_utc
     )
@@ -116,31 +228,240 @@ def create_reservation(
         plate_normalized=normalized_plate,
         start_time=start_time_utc,
         end_time=end_time_utc,
-        status=ReservationStatus.CONFIRMED,
+        status=initial_status(start_time_utc, end_time_utc),
         contact_email=(contact_email.strip().lower() if contact_email else None),
     )
     reservation.slots = [
         ReservationSlot(session_id=session_id, slot_start=slot_start) for slot_start in slot_starts
     ]
+    if optimistic:
+        try:
+            with session.begin_nested():
+                session.add(reservation)
+        except IntegrityError as exc:
+            slot_index.invalidate(masks_for_slots(session_id, slot_starts))
+            raise ValueError(_integrity_error_message(exc)) from exc
+        _normalize_reservation_times(reservation)
+        touch_schedule(session, start_times=[start_time_utc])
+        record_add(session, session_id=session_id, slot_starts=slot_starts)
+        record_plate_change(session, plate=normalized_plate)
+        record_reservation_change(session, kind="created", reservation=reservation)
+        return reservation
+
     session.add(reservation)
     try:
         session.flush()
-        normalized_start = ensure_utc(reservation.start_time)
-        normalized_end = ensure_utc(reservation.end_time)
-        if normalized_start is not None:
-            reservation.start_time = normalized_start
-        if normalized_end is not None:
-            reservation.end_time = normalized_end
-        for slot in reservation.slots:
-            normalized_slot = ensure_utc(slot.slot_start)
-            if normalized_slot is not None:
-                slot.slot_start = normalized_slot
+        _normalize_reservation_times(reservation)
     except IntegrityError as exc:
-        session.rollback()
+        _rollback_failed_write(session)
+        # Another writer got there first; drop the cached bitmaps so they reload.
+        slot_index.invalidate(masks_for_slots(session_id, slot_starts))
         raise ValueError(OVERLAP_ERROR_MESSAGE) from exc
+    touch_schedule(session, start_times=[start_time_utc])
+    record_add(session, session_id=session_id, slot_starts=slot_starts)
+    record_plate_change(session, plate=normalized_plate)
+    record_reservation_change(session, kind="created", reservation=reservation)
     return reservation
 
 
+def initial_status(
+    start: datetime, end: datetime, *, now: datetime | None = None
+) -> ReservationStatus:
+    """Status a new reservation is stored with; the sweeper advances it from there."""
+    now = now or datetime.now(UTC)
+    if end <= now:
+        return ReservationStatus.COMPLETED
+    if start <= now:
+        return ReservationStatus.IN_PROGRESS
+    return ReservationStatus.CONFIRMED
+
+
+def sweep_reservation_statuses(session: Session, *, now: datetime | None = None) -> int:
+    """
+    Advance stored statuses to match ``now`` with two set-based UPDATEs:
+    CONFIRMED/IN_PROGRESS reservations that have ended become COMPLETED, CONFIRMED
+    ones that have started become IN_PROGRESS. Returns the number of rows changed.
+    The caller commits.
+    """
+    now = now or datetime.now(UTC)
+    transitions = [
+        (
+            and_(
+                Reservation.status.in_([ReservationStatus.CONFIRMED, ReservationStatus.IN_PROGRESS]),
+                Reservation.end_time <= now,
+            ),
+            ReservationStatus.COMPLETED,
+        ),
+        (
+            and_(
+                Reservation.status == ReservationStatus.CONFIRMED,
+                Reservation.start_time <= now,
+                Reservation.end_time > now,
+            ),
+            ReservationStatus.IN_PROGRESS,
+        ),
+    ]
+    changed = 0
+    for condition, new_status in transitions:
+        # The affected rows tell which business days' schedules changed.
+        rows = session.execute(
+            select(Reservation.id, Reservation.session_id, Reservation.start_time).where(condition)
+        ).all()
+        if not rows:
+            continue
+        changed += session.execute(
+            update(Reservation)
+            .where(condition)
+            .values(status=new_status)
+            .execution_options(synchronize_session=False)
+        ).rowcount or 0
+        touch_schedule(session, start_times=[start_time for _, _, start_time in rows])
+        record_status_changes(session, rows=rows, status=new_status)
+    return changed
+
+
+def schedule_version_stmt(*, date_value: date) -> Select:
+    return select(ScheduleVersion.version).where(ScheduleVersion.business_date == date_value)
+
+
+def schedule_version(session: Session, *, date_value: date) -> int:
+    """Current change counter of a business day's schedule (0 before its first write)."""
+    return session.scalar(schedule_version_stmt(date_value=date_value)) or 0
+
+
+def touch_schedule(session: Session, *, start_times: Iterable[datetime]) -> None:
+    """Bump the schedule version of every business day a changed reservation starts on."""
+    dates = sorted({to_business_local(ensure_utc(start)).date() for start in start_times})
+    dialect = session.get_bind().dialect.name
+    for business_date in dates:
+        if dialect in ("sqlite", "postgresql"):
+            insert_fn = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            session.execute(
+                insert_fn(ScheduleVersion)
+                .values(business_date=business_date, version=1)
+                .on_conflict_do_update(
+                    index_elements=[ScheduleVersion.business_date],
+                    set_={"version": ScheduleVersion.version + 1},
+                )
+            )
+            continue
+        bumped = session.execute(
+            update(ScheduleVersion)
+            .where(ScheduleVersion.business_date == business_date)
+            .values(version=ScheduleVersion.version + 1)
+        ).rowcount
+        if not bumped:
+            session.add(ScheduleVersion(business_date=business_date, version=1))
+            session.flush()
+
+
+def _normalize_reservation_times(reservation: Reservation) -> None:
+    normalized_start = ensure_utc(reservation.start_time)
+    normalized_end = ensure_utc(reservation.end_time)
+    if normalized_start is not None:
+        reservation.start_time = normalized_start
+    if normalized_end is not None:
+        reservation.end_time = normalized_end
+    for slot in reservation.slots:
+        normalized_slot = ensure_utc(slot.slot_start)
+        if normalized_slot is not None:
+            slot.slot_start = normalized_slot
+
+
+def _integrity_error_message(exc: IntegrityError) -> str:
+    """Map a unique-constraint violation to the message the pessimistic checks raise."""
+    detail = str(exc.orig)
+    # PostgreSQL reports the constraint name; SQLite only lists the columns.
+    for marker in (
+        "uq_session_slot",
+        "uq_reservation_session_start",
+        "reservation_slots.session_id, reservation_slots.slot_start",
+        "reservations.session_id, reservations.start_time",
+    ):
+        if marker in detail:
+            return OVERLAP_ERROR_MESSAGE
+    return "예약을 저장하지 못했습니다."
+
+
+def create_reservations_bulk(
+    session: Session,
+    *,
+    session_id: int,
+    plate: str,
+    windows: Iterable[tuple[datetime, datetime]],
+    contact_email: str | None = None,
+) -> list[Reservation]:
+    """
+    Create several reservations for one session and plate in a single pass:
+    one lock, one conflict check over the union of all slots, one flush.
+    """
+    _lock_session(session, session_id=session_id)
+
+    normalized_windows: list[tuple[datetime, datetime]] = []
+    for start_time, end_time in windows:
+        start_time_utc = ensure_utc(start_time)
+        end_time_utc = ensure_utc(end_time)
+        if start_time_utc is None or end_time_utc is None:
+            raise ValueError("예약 시간 정보가 올바르지 않습니다.")
+        if end_time_utc <= start_time_utc:
+            raise ValueError("종료 시간이 시작 시간 이후여야 합니다.")
+        normalized_windows.append((start_time_utc, end_time_utc))
+    if not normalized_windows:
+        return []
+    normalized_windows.sort()
+
+    slots_per_window = [_generate_slot_starts(start, end) for start, end in normalized_windows]
+    all_slots = [slot_start for slot_starts in slots_per_window for slot_start in slot_starts]
+    if len(set(all_slots)) != len(all_slots):
+        # Requested windows overlap each other.
+        raise ValueError(OVERLAP_ERROR_MESSAGE)
+
+    normalized_plate = normalize_plate(plate)
+    _ensure_slots_free(session, session_id=session_id, slot_starts=all_slots)
+    _ensure_no_conflict_for_plate_windows(
+        session, plate=normalized_plate, windows=normalized_windows
+    )
+
+    email = contact_email.strip().lower() if contact_email else None
+    reservations: list[Reservation] = []
+    for (start_time_utc, end_time_utc), slot_starts in zip(normalized_windows, slots_per_window):
+        reservation = Reservation(
+            session_id=session_id,
+            plate=plate.strip(),
+            plate_normalized=normalized_plate,
+            start_time=start_time_utc,
+            end_time=end_time_utc,
+            status=initial_status(start_time_utc, end_time_utc),
+            contact_email=email,
+        )
+        reservation.slots = [
+            ReservationSlot(session_id=session_id, slot_start=slot_start)
+            for slot_start in slot_starts
+        ]
+        reservations.append(reservation)
+    session.add_all(reservations)
+    try:
+        # A single flush lets SQLAlchemy batch the rows into multi-row INSERTs.
+        session.flush()
+    except IntegrityError as exc:
+        _rollback_failed_write(session)
+        slot_index.invalidate(masks_for_slots(session_id, all_slots))
+        raise ValueError(OVERLAP_ERROR_MESSAGE) from exc
+    touch_schedule(session, start_times=[start for start, _ in normalized_windows])
+    record_add(session, session_id=session_id, slot_starts=all_slots)
+    record_plate_change(session, plate=normalized_plate)
+    for reservation in reservations:
+        record_reservation_change(session, kind="created", reservation=reservation)
+    return reservations
+
+
+def _rollback_failed_write(session: Session) -> None:
+    # Inside a SAVEPOINT (group commit) the caller's begin_nested() block rolls back
+    # just this write; a full rollback would discard the rest of the group.
+    if not session.in_nested_transaction():
+        session.rollback()
+
+
 def ensure_no_overlap(
     session: Session,
     *,
@@ -150,10 +471,25 @@ def ensure_no_overlap(
 ) -> None:
     start_utc = ensure_utc(start)
     end_utc = ensure_utc(end)
-    slot_starts = _generate_slot_starts(start_utc, end_utc)
+    _ensure_slots_free(
+        session, session_id=session_id, slot_starts=_generate_slot_starts(start_utc, end_utc)
+    )
+
+
+def _ensure_slots_free(
+    session: Session,
+    *,
+    session_id: int,
+    slot_starts: list[datetime],
+) -> None:
     if not slot_starts:
         return
 
+    if slot_index_enabled():
+        if slot_index.has_conflict(session, session_id=session_id, slot_starts=slot_starts):
+            raise ValueError(OVERLAP_ERROR_MESSAGE)
+        return
+
     overlap_stmt = (
         select(ReservationSlot.slot_start)
         .where(
@@ -168,6 +504,7 @@ def ensure_no_overlap(
     if conflict:
         raise ValueError(OVERLAP_ERROR_MESSAGE)
 
+
 def ensure_no_conflict_for_plate(
     session: Session,
     *,
@@ -183,7 +520,7 @@ def ensure_no_conflict_for_plate(
         .where(
             and_(
                 Reservation.plate_normalized == plate,
-                Reservation.status != ReservationStatus.CANCELLED,
+                Reservation.status.in_(LIVE_STATUSES),
                 Reservation.start_time < end_utc,
                 Reservation.end_time > start_utc,
             )
@@ -195,6 +532,34 @@ def ensure_no_conflict_for_plate(
         raise ValueError("해당 차량은 다른 시간대에 이미 예약되어 있습니다.")
 
 
+def _ensure_no_conflict_for_plate_windows(
+    session: Session,
+    *,
+    plate: str,
+    windows: list[tuple[datetime, datetime]],
+) -> None:
+    """Check every window with one query over their hull, then filter the gaps in Python."""
+    hull_start = min(start for start, _ in windows)
+    hull_end = max(end for _, end in windows)
+    stmt = (
+        select(Reservation.start_time, Reservation.end_time)
+        .where(
+            and_(
+                Reservation.plate_normalized == plate,
+                Reservation.status.in_(LIVE_STATUSES),
+                Reservation.start_time < hull_end,
+                Reservation.end_time > hull_start,
+            )
+        )
+        .with_for_update()
+    )
+    for existing_start, existing_end in session.execute(stmt):
+        existing_start = ensure_utc(existing_start)
+        existing_end = ensure_utc(existing_end)
+        if any(existing_start < end and existing_end > start for start, end in windows):
+            raise ValueError("해당 차량은 다른 시간대에 이미 예약되어 있습니다.")
+
+
 def find_conflicting_plate_reservation(
     session: Session,
     *,
@@ -209,7 +574,7 @@ def find_conflicting_plate_reservation(
         end_utc = ensure_utc(end)
         stmt = stmt.where(
             and_(
-                Reservation.status != ReservationStatus.CANCELLED,
+                Reservation.status.in_(LIVE_STATUSES),
                 Reservation.start_time < end_utc,
                 Reservation.end_time > start_utc,
             )
@@ -229,12 +594,19 @@ def find_active_reservation_by_plate(
     if moment is None:
         return None
 
+    if plate_match_cache_enabled():
+        covered, reservation = plate_match_cache.lookup(
+            session, plate=normalized_plate, when=moment
+        )
+        if covered:
+            return reservation
+
     stmt = (
         select(Reservation)
         .where(
             and_(
                 Reservation.plate_normalized == normalized_plate,
-                Reservation.status != ReservationStatus.CANCELLED,
+                Reservation.status.in_(LIVE_STATUSES),
                 Reservation.start_time <= moment,
                 Reservation.end_time > moment,
             )
@@ -244,20 +616,124 @@ def find_active_reservation_by_plate(
     return session.scalars(stmt).first()
 
 
+def find_active_reservations_by_plates(
+    session: Session,
+    *,
+    candidates: Sequence[tuple[str, datetime]],
+) -> list[Optional[Reservation]]:
+    """
+    Resolve several ``(plate, when)`` readings at once, in order. Candidates the
+    plate cache cannot answer share a single ``plate_normalized IN (...)`` query
+    spanning all of their timestamps.
+    """
+    results: list[Optional[Reservation]] = [None] * len(candidates)
+    pending: list[tuple[int, str, datetime]] = []
+    for idx, (plate, when) in enumerate(candidates):
+        moment = ensure_utc(when)
+        if moment is None:
+            continue
+        normalized_plate = normalize_plate(plate)
+        if plate_match_cache_enabled():
+            covered, reservation = plate_match_cache.lookup(
+                session, plate=normalized_plate, when=moment
+            )
+            if covered:
+                results[idx] = reservation
+                continue
+        pending.append((idx, normalized_plate, moment))
+    if not pending:
+        return results
+
+    stmt = (
+        select(Reservation)
+        .where(
+            and_(
+                Reservation.plate_normalized.in_({plate for _, plate, _ in pending}),
+                Reservation.status.in_(LIVE_STATUSES),
+                Reservation.start_time <= max(moment for _, _, moment in pending),
+                Reservation.end_time > min(moment for _, _, moment in pending),
+            )
+        )
+        .order_by(Reservation.start_time.asc())
+    )
+    rows = session.scalars(stmt).all()
+    for idx, normalized_plate, moment in pending:
+        results[idx] = next(
+            (
+                row
+                for row in rows
+                if row.plate_normalized == normalized_plate
+                and ensure_utc(row.start_time) <= moment < ensure_utc(row.end_time)
+            ),
+            None,
+        )
+    return results
+
+
+def find_active_reservation_by_plate_fuzzy(
+    session: Session,
+    *,
+    plate: str,
+    when: datetime,
+    max_distance: float | None = None,
+) -> tuple[Optional[Reservation], Optional[float]]:
+    """
+    Match an OCR reading that may have a misread character. Returns the closest
+    active reservation within ``max_distance`` (weighted edits) and its distance;
+    an exact tie between two plates is treated as no match.
+    """
+    normalized_plate = normalize_plate(plate)
+    moment = ensure_utc(when)
+    if moment is None:
+        return None, None
+    if max_distance is None:
+        max_distance = get_settings().plate_fuzzy_max_distance
+    max_units = int(max_distance * EDIT_COST)
+
+    if plate_match_cache_enabled():
+        covered, reservation, units = plate_match_cache.fuzzy_lookup(
+            session, plate=normalized_plate, when=moment, max_units=max_units
+        )
+        if covered:
+            return reservation, (units / EDIT_COST if reservation is not None else None)
+
+    # Outside the cached window: only reservations active at ``moment`` can match,
+    # and there are at most as many of those as charging sessions.
+    stmt = select(Reservation).where(
+        and_(
+            Reservation.status.in_(LIVE_STATUSES),
+            Reservation.start_time <= moment,
+            Reservation.end_time > moment,
+        )
+    )
+    scored = sorted(
+        (plate_distance_units(normalized_plate, reservation.plate_normalized), reservation.id, reservation)
+        for reservation in session.scalars(stmt)
+    )
+    scored = [entry for entry in scored if entry[0] <= max_units]
+    if not scored:
+        return None, None
+    units, _, reservation = scored[0]
+    if units > 0 and len(scored) > 1 and scored[1][0] == units:
+        # Two plates are equally close: refuse to guess.
+        return None, None
+    return reservation, units / EDIT_COST
+
+
 def delete_reservation(session: Session, reservation_id: str) -> bool:
     reservation = session.get(Reservation, reservation_id)
     if not reservation:
         return False
-    session.delete(reservation)
+    _delete_with_slots(session, reservation)
     return True
 
 
-def reservations_for_user(
-    session: Session,
+def reservations_for_user_stmt(
     *,
     email: str | None = None,
     plate: str | None = None,
-) -> list[Reservation]:
+    status: ReservationStatus | None = None,
+) -> Select:
     if not email and not plate:
         raise ValueError("email 또는 plate 중 하나는 반드시 제공해야 합니다.")
 
@@ -267,8 +743,21 @@ def reservations_for_user(
         conditions.append(func.lower(Reservation.contact_email) == email.lower())
     if plate:
         conditions.append(Reservation.plate_normalized == normalize_plate(plate))
+    if status is not None:
+        conditions.append(Reservation.status == status)
     if conditions:
         stmt = stmt.where(and_(*conditions))
+    return stmt
+
+
+def reservations_for_user(
+    session: Session,
+    *,
+    email: str | None = None,
+    plate: str | None = None,
+    status: ReservationStatus | None = None,
+) -> list[Reservation]:
+    stmt = reservations_for_user_stmt(email=email, plate=plate, status=status)
     return session.scalars(stmt).all()
 
 
@@ -291,100 +780,158 @@ def delete_reservation_for_user(
     reservation = session.scalars(stmt).first()
     if reservation is None:
         return False
-    session.delete(reservation)
+    _delete_with_slots(session, reservation)
     return True
 
 
-def migrate_reservation_times_to_utc(session: Session) -> None:
-    """Backfill reservations/slots to UTC; skip rows that would violate unique keys."""
+def _delete_with_slots(session: Session, reservation: Reservation) -> None:
+    record_remove(
+        session,
+        session_id=reservation.session_id,
+        slot_starts=_generate_slot_starts(reservation.start_time, reservation.end_time),
+    )
+    record_plate_change(session, plate=reservation.plate_normalized)
+    touch_schedule(session, start_times=[reservation.start_time])
+    record_reservation_change(session, kind="deleted", reservation=reservation)
+    session.delete(reservation)
+    # Flush now: the unit of work runs INSERTs before DELETEs, so rebooking the same
+    # slot later in this transaction would otherwise hit the unique constraints.
+    session.flush()
+
+
+def _needs_utc_rewrite(dt: datetime | None) -> bool:
+    """True for aware datetimes stored with a non-UTC offset; naive values are already UTC."""
+    return dt is not None and dt.tzinfo is not None and dt.utcoffset() != timedelta(0)
+
+
+def _reservation_chunk(
+    session: Session, *, after_id: str | None, limit: int, include_cancelled: bool = True
+) -> list[Reservation]:
+    stmt = (
+        select(Reservation)
+        .options(selectinload(Reservation.slots))
+        .order_by(Reservation.id)
+        .limit(limit)
+    )
+    if after_id is not None:
+        stmt = stmt.where(Reservation.id > after_id)
+    if not include_cancelled:
+        stmt = stmt.where(Reservation.status.in_(LIVE_STATUSES))
+    return session.scalars(stmt).all()
+
+
+def migrate_reservation_times_to_utc(
+    session: Session,
+    *,
+    after_id: str | None = None,
+    limit: int = MIGRATION_CHUNK_SIZE,
+) -> str | None:
+    """
+    Backfill one chunk of reservations/slots (ordered by id, after ``after_id``) to UTC;
+    skip rows that would violate unique keys. Returns the last id processed, or None
+    once there is nothing left.
+    """
     logger = logging.getLogger(__name__)
-    def _to_utc(dt: datetime | None) -> datetime | None:
-        if dt is None:
-            return None
-        if dt.tzinfo is None:
-            # SQLite drops tzinfo even when timezone=True. Treat stored values as UTC
-            # to avoid re-shifting on every startup.
-            return dt.replace(tzinfo=UTC)
-        return dt.astimezone(UTC)
 
     def _to_naive(dt: datetime | None) -> datetime | None:
         return dt.replace(tzinfo=None) if dt else None
 
-    reservations = session.scalars(
-        select(Reservation).options(selectinload(Reservation.slots))
-    ).all()
+    reservations = _reservation_chunk(session, after_id=after_id, limit=limit)
+    if not reservations:
+        return None
+
+    # Look up potential unique-key collisions for the whole chunk in one query.
+    shifted = [reservation for reservation in reservations if _needs_utc_rewrite(reservation.start_time)]
+    taken: dict[tuple[int, datetime | None], set[str]] = defaultdict(set)
+    if shifted:
+        rows = session.execute(
+            select(Reservation.id, Reservation.session_id, Reservation.start_time).where(
+                Reservation.session_id.in_({reservation.session_id for reservation in shifted}),
+                Reservation.start_time.in_(
+                    [_to_naive(ensure_utc(reservation.start_time)) for reservation in shifted]
+                ),
+            )
+        )
+        for other_id, session_id, start_time in rows:
+            taken[(session_id, _to_naive(ensure_utc(start_time)))].add(other_id)
 
-    updated = False
     skipped_ids: list[str] = []
     seen_keys: set[tuple[int, datetime | None]] = set()
+    candidates: list[Reservation] = []
 
     for reservation in reservations:
-        new_start = _to_utc(reservation.start_time)
-        new_end = _to_utc(reservation.end_time)
-        new_created = _to_utc(reservation.created_at)
-        new_updated = _to_utc(reservation.updated_at)
-        start_key = (reservation.session_id, _to_naive(new_start))
-
-        conflict = False
-        if start_key[1] is not None:
-            if start_key in seen_keys:
-                conflict = True
-            else:
-                other = session.scalar(
-                    select(Reservation.id).where(
-                        Reservation.id != reservation.id,
-                        Reservation.session_id == reservation.session_id,
-                        Reservation.start_time == start_key[1],
-                    )
-                )
-                conflict = other is not None
-
-        if conflict:
-            skipped_ids.append(reservation.id)
-            continue
-
-        seen_keys.add(start_key)
-
-        if reservation.start_time != new_start and new_start is not None:
-            reservation.start_time = new_start
-            updated = True
-        if reservation.end_time != new_end and new_end is not None:
-            reservation.end_time = new_end
-            updated = True
-        if reservation.created_at and new_created and reservation.created_at != new_created:
-            reservation.created_at = new_created
-            updated = True
-        if reservation.updated_at and new_updated and reservation.updated_at != new_updated:
-            reservation.updated_at = new_updated
-            updated = True
+        if _needs_utc_rewrite(reservation.start_time):
+            start_key = (reservation.session_id, _to_naive(ensure_utc(reservation.start_time)))
+            if start_key in seen_keys or taken[start_key] - {reservation.id}:
+                skipped_ids.append(reservation.id)
+                continue
+            seen_keys.add(start_key)
+        candidates.append(reservation)
 
-        for slot in reservation.slots:
-            normalized_slot = _to_utc(slot.slot_start)
-            if normalized_slot and slot.slot_start != normalized_slot:
-                slot.slot_start = normalized_slot
-                updated = True
+    updated = False
+    for reservation in candidates:
+        updated = _rewrite_reservation_to_utc(reservation) or updated
 
     if updated:
         try:
             session.flush()
-        except IntegrityError as exc:  # pragma: no cover - defensive
+        except IntegrityError as exc:
+            # A conflict the lookup above cannot see (e.g. overlapping slot rows).
+            # Redo the chunk one reservation per SAVEPOINT so only the conflicting
+            # rows are skipped; the caller records this chunk as done.
             session.rollback()
             logger.warning(
-                "UTC migration skipped due to remaining unique conflicts: %s", exc
+                "UTC migration chunk after %s hit a unique conflict; converting row by row: %s",
+                after_id,
+                exc.orig,
             )
+            for reservation in candidates:
+                try:
+                    with session.begin_nested():
+                        if _rewrite_reservation_to_utc(reservation):
+                            session.flush()
+                except IntegrityError:
+                    skipped_ids.append(reservation.id)
     if skipped_ids:
         logger.info(
-            "UTC migration skipped %d reservations because converted start_time would duplicate existing rows.",
+            "UTC migration skipped %d reservations because converted times would duplicate existing rows.",
             len(skipped_ids),
         )
+    return reservations[-1].id
 
 
-def ensure_reservation_slots(session: Session) -> None:
-    reservations = session.scalars(
-        select(Reservation)
-        .where(Reservation.status != ReservationStatus.CANCELLED)
-        .options(selectinload(Reservation.slots))
-    ).all()
+def _rewrite_reservation_to_utc(reservation: Reservation) -> bool:
+    """Convert a reservation's offset-aware columns and slots to UTC; True if any changed."""
+    updated = False
+    for column in ("start_time", "end_time", "created_at", "updated_at"):
+        value = getattr(reservation, column)
+        if _needs_utc_rewrite(value):
+            setattr(reservation, column, ensure_utc(value))
+            updated = True
+
+    for slot in reservation.slots:
+        if _needs_utc_rewrite(slot.slot_start):
+            slot.slot_start = ensure_utc(slot.slot_start)
+            updated = True
+    return updated
+
+
+def ensure_reservation_slots(
+    session: Session,
+    *,
+    after_id: str | None = None,
+    limit: int = MIGRATION_CHUNK_SIZE,
+) -> str | None:
+    """
+    Create missing slot rows for one chunk of active reservations (ordered by id,
+    after ``after_id``). Returns the last id processed, or None once there is
+    nothing left.
+    """
+    reservations = _reservation_chunk(
+        session, after_id=after_id, limit=limit, include_cancelled=False
+    )
+    if not reservations:
+        return None
 
     updated = False
     for reservation in reservations:
@@ -393,27 +940,11 @@ def ensure_reservation_slots(session: Session) -> None:
         if start_utc is None or end_utc is None:
             continue
 
-        if reservation.start_time != start_utc:
-            reservation.start_time = start_utc
-            updated = True
-        if reservation.end_time != end_utc:
-            reservation.end_time = end_utc
-            updated = True
-
         slot_starts = _generate_slot_starts(start_utc, end_utc)
         if not slot_starts:
             continue
 
-        existing: set[datetime] = set()
-        for slot in reservation.slots:
-            normalized_slot = ensure_utc(slot.slot_start)
-            if normalized_slot is None:
-                continue
-            if slot.slot_start != normalized_slot:
-                slot.slot_start = normalized_slot
-                updated = True
-            existing.add(normalized_slot)
-
+        existing = {ensure_utc(slot.slot_start) for slot in reservation.slots}
         missing = [slot_start for slot_start in slot_starts if slot_start not in existing]
         if not missing:
             continue
@@ -426,6 +957,7 @@ def ensure_reservation_slots(session: Session) -> None:
 
     if updated:
         session.flush()
+    return reservations[-1].id
 
 
 def _generate_slot_starts(start: datetime, end: datetime) -> list[datetime]:
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import change_log, crud
+from .models import ChargingSession, Reservation, ReservationStatus
+from .time_utils import business_day_bounds_utc
+
+# Async counterparts of the hot read paths in ``crud`` for DATABASE_ASYNC=1. The
+# statements are shared with ``crud`` so both modes issue the same SQL; lookups that
+# go through the in-process plate cache run the sync implementation on the async
+# connection via ``AsyncSession.run_sync`` instead of duplicating the cache logic.
+
+
+async def list_sessions(
+    session: AsyncSession, *, limit: int | None = None, offset: int = 0
+) -> list[ChargingSession]:
+    result = await session.scalars(crud.list_sessions_stmt(limit=limit, offset=offset))
+    return result.all()
+
+
+async def reservations_grouped_by_session(
+    session: AsyncSession,
+    *,
+    start: datetime,
+    end: datetime,
+    session_ids: Iterable[int] | None = None,
+    status: ReservationStatus | None = None,
+) -> dict[int, list[Reservation]]:
+    stmt = crud.reservations_in_range_stmt(
+        start=start, end=end, session_ids=session_ids, status=status
+    )
+    return crud.group_by_session(await session.scalars(stmt))
+
+
+async def reservations_by_date_grouped(
+    session: AsyncSession, *, date_value: date, status: ReservationStatus | None = None
+) -> dict[int, list[Reservation]]:
+    start, end = business_day_bounds_utc(date_value)
+    return await reservations_grouped_by_session(session, start=start, end=end, status=status)
+
+
+async def reservations_for_user(
+    session: AsyncSession,
+    *,
+    email: str | None = None,
+    plate: str | None = None,
+    status: ReservationStatus | None = None,
+) -> list[Reservation]:
+    stmt = crud.reservations_for_user_stmt(email=email, plate=plate, status=status)
+    return (await session.scalars(stmt)).all()
+
+
+async def schedule_version(session: AsyncSession, *, date_value: date) -> int:
+    return await session.scalar(crud.schedule_version_stmt(date_value=date_value)) or 0
+
+
+async def latest_change_seq(session: AsyncSession) -> int:
+    return await session.scalar(change_log.latest_change_seq_stmt()) or 0
+
+
+async def find_active_reservation_by_plate(
+    session: AsyncSession, *, plate: str, when: datetime
+) -> Optional[Reservation]:
+    return await session.run_sync(
+        lambda sync_session: crud.find_active_reservation_by_plate(
+            sync_session, plate=plate, when=when
+        )
+    )
+
+
+async def find_active_reservations_by_plates(
+    session: AsyncSession, *, candidates: Sequence[tuple[str, datetime]]
+) -> list[Optional[Reservation]]:
+    return await session.run_sync(
+        lambda sync_session: crud.find_active_reservations_by_plates(
+            sync_session, candidates=candidates
+        )
+    )
+
+
+async def find_active_reservation_by_plate_fuzzy(
+    session: AsyncSession, *, plate: str, when: datetime, max_distance: float | None = None
+) -> tuple[Optional[Reservation], Optional[float]]:
+    return await session.run_sync(
+        lambda sync_session: crud.find_active_reservation_by_plate_fuzzy(
+            sync_session, plate=plate, when=when, max_distance=max_distance
+        )
+    )
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Iterable, Mapping
+
+from fastapi import Response
+
+from .config import get_settings
+from .models import ChargingSession, Reservation
+from .time_utils import UTC, business_timezone
+
+try:  # Optional dependency: without it every endpoint keeps the Pydantic path.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def fast_json_enabled() -> bool:
+    return orjson is not None and get_settings().fast_json_responses
+
+
+class FastJSONResponse(Response):
+    """Response whose body is already serialized (see ``dumps``)."""
+
+    media_type = "application/json"
+
+
+@lru_cache(maxsize=4096)
+def _business_offset(utc_hour: datetime) -> timedelta | None:
+    # One zone lookup serves every row in the UTC hour, unless the offset changes
+    # inside it: zones with half- or quarter-hour offsets (Asia/Kolkata,
+    # Australia/Adelaide, Asia/Kathmandu, ...) switch at e.g. 16:30 UTC. Those hours
+    # return None and the caller converts each value on its own.
+    zone = business_timezone()
+    start = utc_hour.replace(tzinfo=UTC)
+    offset = start.astimezone(zone).utcoffset()
+    last = start + timedelta(hours=1, microseconds=-1)
+    return offset if last.astimezone(zone).utcoffset() == offset else None
+
+
+def business_local(value: datetime) -> datetime:
+    """Naive business-local wall time for a stored (naive UTC or aware) datetime."""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    offset = _business_offset(value.replace(minute=0, second=0, microsecond=0))
+    if offset is None:
+        return value.replace(tzinfo=UTC).astimezone(business_timezone()).replace(tzinfo=None)
+    return value + offset
+
+
+def reservation_dict(reservation: Reservation) -> dict[str, Any]:
+    """Same keys, order and formatting as ``ReservationPublic`` serialized by FastAPI."""
+    start_local = business_local(reservation.start_time)
+    end_local = business_local(reservation.end_time)
+    return {
+        "id": reservation.id,
+        "sessionId": reservation.session_id,
+        "plate": reservation.plate,
+        "date": start_local.date().isoformat(),
+        "startTime": f"{start_local.hour:02d}:{start_local.minute:02d}",
+        "endTime": f"{end_local.hour:02d}:{end_local.minute:02d}",
+        "status": reservation.status.value,
+        "contactEmail": reservation.contact_email,
+    }
+
+
+def dumps(payload: Any) -> FastJSONResponse:
+    return FastJSONResponse(orjson.dumps(payload))
+
+
+def reservations_response(reservations: Iterable[Reservation]) -> FastJSONResponse:
+    return dumps([reservation_dict(reservation) for reservation in reservations])
+
+
+def sessions_response(
+    sessions: Iterable[ChargingSession], grouped: Mapping[int, list[Reservation]]
+) -> FastJSONResponse:
+    """Body of ``SessionsResponse`` for the given sessions and their grouped reservations."""
+    return dumps(
+        {
+            "sessions": [
+                {
+                    "sessionId": session_obj.id,
+                    "name": session_obj.name,
+                    "reservations": [
+                        reservation_dict(reservation)
+                        for reservation in grouped.get(session_obj.id, [])
+                    ],
+                }
+                for session_obj in sessions
+            ]
+        }
+    )
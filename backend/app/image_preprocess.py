@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+try:  # opencv-python (+ numpy) decodes uploads; without it images pass through as-is.
+    import cv2
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    cv2 = None
+    np = None
+
+IMAGE_DECODING_AVAILABLE = cv2 is not None
+
+# dHash grid: HASH_SIZE x HASH_SIZE gradient bits (256). Frames come from a fixed
+# camera, so the background dominates; a finer grid keeps different cars apart.
+HASH_SIZE = 16
+
+
+@dataclass
+class PreprocessedImage:
+    """Recognition input after preprocessing, with per-stage timings in milliseconds."""
+
+    content: bytes
+    content_type: str
+    width: int = 0
+    height: int = 0
+    phash: Optional[int] = None
+    # Smaller JPEG for a cheap first recognition attempt (tiered mode only).
+    thumbnail: Optional[bytes] = None
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def server_timing(self) -> str:
+        return ", ".join(f"{stage};dur={duration:.1f}" for stage, duration in self.timings.items())
+
+
+def dhash(gray: Any) -> int:
+    """Difference hash of a decoded grayscale image."""
+    small = cv2.resize(gray, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def perceptual_hash(content: bytes) -> Optional[int]:
+    """dHash of an encoded image, or None when it cannot be decoded (or cv2 is missing)."""
+    if cv2 is None:
+        return None
+    # A reduced decode is several times faster and loses nothing at hash resolution.
+    gray = cv2.imdecode(np.frombuffer(content, dtype=np.uint8), cv2.IMREAD_REDUCED_GRAYSCALE_4)
+    if gray is None:
+        return None
+    return dhash(gray)
+
+
+def _jpeg_dimensions(content: bytes) -> Optional[tuple[int, int]]:
+    """``(width, height)`` from a JPEG's SOF header, without decoding it."""
+    if content[:2] != b"\xff\xd8":
+        return None
+    index = 2
+    while index + 9 <= len(content):
+        if content[index] != 0xFF:
+            return None
+        marker = content[index + 1]
+        if marker == 0xFF:
+            index += 1
+            continue
+        # SOF0..SOF15, minus DHT (C4), JPG (C8) and DAC (CC) which share the range.
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height = int.from_bytes(content[index + 5:index + 7], "big")
+            width = int.from_bytes(content[index + 7:index + 9], "big")
+            return width, height
+        index += 2 + int.from_bytes(content[index + 2:index + 4], "big")
+    return None
+
+
+def _decode_flags(content: bytes, *, max_edge: int, grayscale: bool) -> int:
+    """Pick the cheapest JPEG decode (1/8, 1/4, 1/2 scale) that still covers ``max_edge``."""
+    dimensions = _jpeg_dimensions(content) if max_edge > 0 else None
+    if dimensions is not None:
+        longest = max(dimensions)
+        for factor, color_flag, gray_flag in (
+            (8, cv2.IMREAD_REDUCED_COLOR_8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+            (4, cv2.IMREAD_REDUCED_COLOR_4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+            (2, cv2.IMREAD_REDUCED_COLOR_2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+        ):
+            if longest // factor >= max_edge:
+                return gray_flag if grayscale else color_flag
+    return cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+def preprocess_image(
+    content: bytes,
+    content_type: str | None,
+    *,
+    max_edge: int,
+    grayscale: bool,
+    jpeg_quality: int,
+    thumbnail_edge: int = 0,
+) -> PreprocessedImage:
+    """
+    Decode ``content`` once, shrink it to ``max_edge`` and re-encode it as JPEG.
+
+    Large JPEGs are decoded straight at a reduced scale that still covers
+    ``max_edge``. ``cv2.imdecode`` applies the EXIF orientation while decoding, so
+    the upstream always sees the image upright. The dHash used by the recognition
+    cache comes from the same decoded pixels. Uploads that cannot be decoded (or
+    when opencv-python is missing) are passed through unchanged, and a re-encode
+    that would not shrink an already small image keeps the original bytes. With
+    ``thumbnail_edge`` a second, smaller JPEG is produced from the same pixels.
+    CPU bound; call it from a worker thread.
+    """
+    if cv2 is None:
+        return PreprocessedImage(content=content, content_type=content_type or "image/jpeg")
+
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
+    flags = _decode_flags(content, max_edge=max_edge, grayscale=grayscale)
+    image = cv2.imdecode(np.frombuffer(content, dtype=np.uint8), flags)
+    timings["decode"] = _elapsed_ms(started)
+    if image is None:
+        return PreprocessedImage(
+            content=content, content_type=content_type or "image/jpeg", timings=timings
+        )
+
+    height, width = image.shape[:2]
+    scale = max_edge / max(height, width) if max_edge > 0 else 1.0
+    if scale < 1.0:
+        started = time.perf_counter()
+        width, height = max(1, round(width * scale)), max(1, round(height * scale))
+        image = cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+        timings["resize"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    phash = dhash(gray)
+    timings["hash"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality])
+    timings["encode"] = _elapsed_ms(started)
+    output = encoded.tobytes() if ok else content
+
+    thumbnail = None
+    if ok and 0 < thumbnail_edge < max(height, width):
+        started = time.perf_counter()
+        thumb_scale = thumbnail_edge / max(height, width)
+        small = cv2.resize(
+            image,
+            (max(1, round(width * thumb_scale)), max(1, round(height * thumb_scale))),
+            interpolation=cv2.INTER_AREA,
+        )
+        ok, encoded_small = cv2.imencode(".jpg", small, [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality])
+        thumbnail = encoded_small.tobytes() if ok else None
+        timings["thumbnail"] = _elapsed_ms(started)
+
+    if scale >= 1.0 and not grayscale and len(output) >= len(content):
+        output = content
+    return PreprocessedImage(
+        content=output,
+        content_type="image/jpeg" if output is not content else content_type or "image/jpeg",
+        width=width,
+        height=height,
+        phash=phash,
+        thumbnail=thumbnail,
+        timings=timings,
+    )
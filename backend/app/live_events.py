@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, AsyncIterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "live_events_pending"
+# Sentinel queued in place of the backlog when a subscriber falls too far behind.
+_DROPPED = object()
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue
+    business_date: Optional[date]
+    dropped: bool = field(default=False)
+
+
+class ReservationBroadcaster:
+    """
+    Fan committed reservation changes out to SSE subscribers.
+
+    ``publish`` may be called from any thread (sync routes run in the threadpool);
+    delivery hops onto each subscriber's event loop. Every subscriber has a bounded
+    queue: one that fills up is cut off with a ``dropped`` frame instead of letting
+    the backlog grow, and the client is expected to reconnect and refetch.
+    """
+
+    def __init__(self, *, queue_size: int) -> None:
+        self._queue_size = max(1, queue_size)
+        self._lock = threading.Lock()
+        self._subscribers: set[_Subscriber] = set()
+        self._dropped = 0
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self, business_date: Optional[date]) -> _Subscriber:
+        subscriber = _Subscriber(
+            loop=asyncio.get_running_loop(),
+            queue=asyncio.Queue(maxsize=self._queue_size),
+            business_date=business_date,
+        )
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, events: list[tuple[str, date, dict[str, Any]]]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            matching = [
+                (kind, payload)
+                for kind, business_date, payload in events
+                if subscriber.business_date is None or subscriber.business_date == business_date
+            ]
+            if matching:
+                try:
+                    subscriber.loop.call_soon_threadsafe(self._offer, subscriber, matching)
+                except RuntimeError:  # loop already closed
+                    self.unsubscribe(subscriber)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"subscribers": len(self._subscribers), "dropped": self._dropped}
+
+    def _offer(self, subscriber: _Subscriber, events: list[tuple[str, dict[str, Any]]]) -> None:
+        if subscriber.dropped:
+            return
+        for item in events:
+            try:
+                subscriber.queue.put_nowait(item)
+            except asyncio.QueueFull:
+                subscriber.dropped = True
+                while not subscriber.queue.empty():
+                    subscriber.queue.get_nowait()
+                subscriber.queue.put_nowait(_DROPPED)
+                self.unsubscribe(subscriber)
+                with self._lock:
+                    self._dropped += 1
+                return
+
+
+broadcaster = ReservationBroadcaster(queue_size=get_settings().sse_client_queue_size)
+
+
+def _frame(kind: str, payload: Any) -> str:
+    return f"event: {kind}\ndata: {json.dumps(payload, ensure_ascii=False, separators=(',', ':'))}\n\n"
+
+
+async def event_stream(
+    subscriber: _Subscriber, *, heartbeat_seconds: float, is_disconnected
+) -> AsyncIterator[str]:
+    """Yield SSE frames for ``subscriber`` until the client leaves or is dropped."""
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            try:
+                item = await asyncio.wait_for(subscriber.queue.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                if await is_disconnected():
+                    return
+                yield ": heartbeat\n\n"
+                continue
+            if item is _DROPPED:
+                yield _frame("dropped", {"reason": "slow consumer"})
+                return
+            kind, payload = item
+            yield _frame(kind, payload)
+    finally:
+        broadcaster.unsubscribe(subscriber)
+
+
+def stage_event(session: Session, kind: str, business_date: date, payload: dict[str, Any]) -> None:
+    """Stage an event for broadcast after commit; a no-op while nobody is subscribed."""
+    if broadcaster.has_subscribers():
+        session.info.setdefault(_PENDING_KEY, []).append((kind, business_date, payload))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    events = session.info.pop(_PENDING_KEY, None)
+    if events:
+        broadcaster.publish(events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
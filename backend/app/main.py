@@ -4,11 +4,14 @@ import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import inspect, text
-
-from . import crud, models, routers
+from . import crud, migrations, models, routers
 from .config import get_settings
 from .database import SessionLocal, engine
+from .recognition_cache import get_recognition_cache
+from .recognition_jobs import RecognitionJobQueue
+from .recognition_limiter import RecognitionLimiter
+from .status_sweeper import ReservationStatusSweeper
+from .upstream import UpstreamClients
 
 
 def create_app() -> FastAPI:
@@ -28,6 +31,11 @@ def create_app() -> FastAPI:
             allow_headers=["*"],
         )
 
+    if settings.database_async:
+        # Registered first so its async handlers win over the sync ones on the same paths.
+        from .routers import reservations_async
+
+        app.include_router(reservations_async.router)
     app.include_router(routers.health.router)
     app.include_router(routers.reservations.router)
     app.include_router(routers.admin.router)
@@ -42,20 +50,48 @@ def create_app() -> FastAPI:
         # In case of optional import issues – fail softly during startup
         pass
 
+    status_sweeper = ReservationStatusSweeper(SessionLocal)
+    app.state.status_sweeper = status_sweeper
+    upstream_clients = UpstreamClients(settings)
+    app.state.upstream_clients = upstream_clients
+    recognition_jobs = RecognitionJobQueue(
+        workers=settings.recognition_job_workers,
+        max_pending=settings.recognition_job_queue_size,
+        retention_seconds=settings.recognition_job_retention_seconds,
+        callback_hosts=settings.recognition_job_callback_hosts,
+        callback_connections=settings.recognition_job_callback_connections,
+    )
+    app.state.recognition_jobs = recognition_jobs
+    recognition_limiter = RecognitionLimiter(
+        max_concurrent=settings.recognition_max_concurrent,
+        max_waiting=settings.recognition_max_waiting,
+        wait_budget_seconds=settings.recognition_wait_budget_seconds,
+        threads=settings.recognition_threads,
+    )
+    app.state.recognition_limiter = recognition_limiter
+
+    @app.on_event("startup")
+    async def _start_upstream_clients() -> None:
+        upstream_clients.start()
+        recognition_jobs.start()
+
+    @app.on_event("shutdown")
+    async def _close_upstream_clients() -> None:
+        await recognition_jobs.stop()
+        await upstream_clients.aclose()
+        recognition_limiter.shutdown()
+
     @app.on_event("startup")
     def _startup() -> None:
         models.Base.metadata.create_all(bind=engine)
-        with engine.begin() as connection:
-            inspector = inspect(connection)
-            columns = {column["name"] for column in inspector.get_columns("reservations")}
-            if "contact_email" not in columns:
-                connection.execute(
-                    text("ALTER TABLE reservations ADD COLUMN contact_email VARCHAR(255)")
-                )
-        with SessionLocal() as session:
-            crud.migrate_reservation_times_to_utc(session)
-            crud.ensure_reservation_slots(session)
-            session.commit()
+        migrations.run_migrations(SessionLocal)
+        # Catch up on transitions missed while the app was down, then follow the clock.
+        status_sweeper.sweep()
+        status_sweeper.start()
+        if settings.recognition_cache_enabled:
+            loaded = get_recognition_cache().load()
+            if loaded:
+                logger.info("Loaded %d cached plate recognition(s).", loaded)
         if settings.auto_seed_sessions:
             with SessionLocal() as session:
                 crud.ensure_base_sessions(
@@ -64,4 +100,10 @@ def create_app() -> FastAPI:
                 )
             logger.info("Auto-seeded default charging sessions.")
 
+    @app.on_event("shutdown")
+    def _shutdown() -> None:
+        status_sweeper.stop()
+        if settings.recognition_cache_enabled:
+            get_recognition_cache().save()
+
     return app
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy import inspect, select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from . import crud
+from .models import SchemaMigration
+from .time_utils import UTC
+
+logger = logging.getLogger(__name__)
+
+# A migration step receives the watermark recorded by the previous chunk (None on
+# the first call) and returns the next watermark, or None once it has finished.
+MigrationStep = Callable[[Session, Optional[str]], Optional[str]]
+
+
+@dataclass(frozen=True)
+class Migration:
+    name: str
+    step: MigrationStep
+
+
+MIGRATIONS: list[Migration] = []
+
+
+def register(name: str) -> Callable[[MigrationStep], MigrationStep]:
+    def decorator(step: MigrationStep) -> MigrationStep:
+        MIGRATIONS.append(Migration(name=name, step=step))
+        return step
+
+    return decorator
+
+
+@register("0001_reservations_contact_email")
+def _add_contact_email(session: Session, watermark: Optional[str]) -> Optional[str]:
+    connection = session.connection()
+    columns = {column["name"] for column in inspect(connection).get_columns("reservations")}
+    if "contact_email" not in columns:
+        connection.execute(text("ALTER TABLE reservations ADD COLUMN contact_email VARCHAR(255)"))
+    return None
+
+
+@register("0002_reservation_times_utc")
+def _reservation_times_utc(session: Session, watermark: Optional[str]) -> Optional[str]:
+    return crud.migrate_reservation_times_to_utc(session, after_id=watermark)
+
+
+@register("0003_reservation_slots_backfill")
+def _reservation_slots_backfill(session: Session, watermark: Optional[str]) -> Optional[str]:
+    return crud.ensure_reservation_slots(session, after_id=watermark)
+
+
+@register("0004_reservations_status_index")
+def _reservations_status_index(session: Session, watermark: Optional[str]) -> Optional[str]:
+    session.connection().execute(
+        text("CREATE INDEX IF NOT EXISTS ix_reservations_status ON reservations (status)")
+    )
+    return None
+
+
+@register("0005_reservations_composite_indexes")
+def _reservations_composite_indexes(session: Session, watermark: Optional[str]) -> Optional[str]:
+    connection = session.connection()
+    connection.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_reservations_plate_status_window "
+            "ON reservations (plate_normalized, status, start_time, end_time)"
+        )
+    )
+    connection.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_reservations_contact_email_lower "
+            "ON reservations (lower(contact_email))"
+        )
+    )
+    return None
+
+
+@register("0006_reservations_status_end_index")
+def _reservations_status_end_index(session: Session, watermark: Optional[str]) -> Optional[str]:
+    session.connection().execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_reservations_status_end "
+            "ON reservations (status, end_time)"
+        )
+    )
+    return None
+
+
+def run_migrations(session_factory: sessionmaker) -> None:
+    """
+    Apply pending migrations in registration order. Each chunk commits together with
+    its watermark, so an interrupted run resumes where it stopped and finished
+    migrations are skipped on later boots.
+    """
+    with session_factory() as session:
+        records = {record.name: record for record in session.scalars(select(SchemaMigration))}
+
+    for migration in MIGRATIONS:
+        record = records.get(migration.name)
+        if record is not None and record.applied_at is not None:
+            continue
+        watermark = record.watermark if record is not None else None
+        chunks = 0
+        while True:
+            with session_factory() as session:
+                next_watermark = migration.step(session, watermark)
+                record = session.get(SchemaMigration, migration.name)
+                if record is None:
+                    record = SchemaMigration(name=migration.name)
+                    session.add(record)
+                record.watermark = next_watermark
+                if next_watermark is None:
+                    record.applied_at = datetime.now(UTC)
+                session.commit()
+            chunks += 1
+            if next_watermark is None:
+                break
+            watermark = next_watermark
+        logger.info("Applied migration %s (%d chunk(s)).", migration.name, chunks)
@@ -6,10 +6,13 @@ from uuid import uuid4
 
 from sqlalchemy import (
     Column,
+    Date,
     DateTime,
     Enum as SAEnum,
     ForeignKey,
+    Index,
     Integer,
+    JSON,
     String,
     UniqueConstraint,
     func,
@@ -26,6 +29,15 @@ class ReservationStatus(str, Enum):
     CANCELLED = "CANCELLED"
 
 
+# Statuses that hold a slot. Listed explicitly (rather than ``!= CANCELLED``) so the
+# predicate can seek through ix_reservations_plate_status_window.
+LIVE_STATUSES = (
+    ReservationStatus.CONFIRMED,
+    ReservationStatus.IN_PROGRESS,
+    ReservationStatus.COMPLETED,
+)
+
+
 class ChargingSession(Base):
     __tablename__ = "charging_sessions"
 
@@ -41,7 +53,18 @@ class ChargingSession(Base):
 class Reservation(Base):
     __tablename__ = "reservations"
     __table_args__ = (
+        # Also serves the (session_id, start_time) lookups of the by-date views.
         UniqueConstraint("session_id", "start_time", name="uq_reservation_session_start"),
+        # Plate conflict and match queries: plate equality, live statuses, then the window.
+        Index(
+            "ix_reservations_plate_status_window",
+            "plate_normalized",
+            "status",
+            "start_time",
+            "end_time",
+        ),
+        # Status sweeper: only not-yet-advanced rows around "now" are visited.
+        Index("ix_reservations_status_end", "status", "end_time"),
     )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
@@ -50,7 +73,12 @@ class Reservation(Base):
     plate_normalized = Column(String(32), nullable=False, index=True)
     start_time = Column(DateTime(timezone=True), nullable=False, index=True)
     end_time = Column(DateTime(timezone=True), nullable=False, index=True)
-    status = Column(SAEnum(ReservationStatus, name="reservation_status"), nullable=False, default=ReservationStatus.CONFIRMED)
+    status = Column(
+        SAEnum(ReservationStatus, name="reservation_status"),
+        nullable=False,
+        default=ReservationStatus.CONFIRMED,
+        index=True,
+    )
     contact_email = Column(String(255), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
@@ -69,24 +97,9 @@ class Reservation(Base):
             f"contact_email={self.contact_email!r})"
         )
 
-    @property
-    def derived_status(self) -> ReservationStatus:
-        now = datetime.now(timezone.utc)
-        if self.status == ReservationStatus.CANCELLED:
-            return ReservationStatus.CANCELLED
-
-        start = self.start_time
-        end = self.end_time
-        if start.tzinfo is None:
-            start = start.replace(tzinfo=timezone.utc)
-        if end.tzinfo is None:
-            end = end.replace(tzinfo=timezone.utc)
 
-        if now < start:
-            return ReservationStatus.CONFIRMED
-        if start <= now < end:
-            return ReservationStatus.IN_PROGRESS
-        return ReservationStatus.COMPLETED
+# ``/api/reservations/my`` matches e-mails case-insensitively.
+Index("ix_reservations_contact_email_lower", func.lower(Reservation.contact_email))
 
 
 class ReservationSlot(Base):
@@ -110,3 +123,60 @@ class ReservationSlot(Base):
             f"ReservationSlot(id={self.id!r}, reservation_id={self.reservation_id!r}, "
             f"session_id={self.session_id!r}, slot_start={self.slot_start!r})"
         )
+
+
+class SchemaMigration(Base):
+    __tablename__ = "schema_migrations"
+
+    name = Column(String(100), primary_key=True)
+    watermark = Column(String(64), nullable=True)
+    applied_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"SchemaMigration(name={self.name!r}, watermark={self.watermark!r}, "
+            f"applied_at={self.applied_at!r})"
+        )
+
+
+class ScheduleVersion(Base):
+    """Change counter per business day, bumped in the same transaction as every write."""
+
+    __tablename__ = "schedule_versions"
+
+    business_date = Column(Date, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"ScheduleVersion(business_date={self.business_date!r}, version={self.version!r})"
+
+
+class ReservationChange(Base):
+    """Append-only log of reservation inserts, deletes and status changes."""
+
+    __tablename__ = "reservation_changes"
+    __table_args__ = (
+        Index("ix_reservation_changes_date_seq", "business_date", "seq"),
+        # AUTOINCREMENT on SQLite: never reuse a sequence number after compaction.
+        {"sqlite_autoincrement": True},
+    )
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(16), nullable=False)
+    reservation_id = Column(String(36), nullable=False)
+    session_id = Column(Integer, nullable=False)
+    business_date = Column(Date, nullable=False)
+    status = Column(SAEnum(ReservationStatus, name="reservation_status"), nullable=False)
+    payload = Column(JSON, nullable=True)
+    changed_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"ReservationChange(seq={self.seq!r}, kind={self.kind!r}, "
+            f"reservation_id={self.reservation_id!r}, status={self.status!r})"
+        )
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, event, select
+from sqlalchemy.orm import Session
+
+from .config import get_settings
+from .models import LIVE_STATUSES, Reservation
+from .plate_fuzzy import BKTree
+from .time_utils import business_day_bounds_utc, business_today, ensure_utc
+
+_PENDING_KEY = "plate_cache_pending"
+
+
+def plate_match_cache_enabled() -> bool:
+    return get_settings().plate_match_cache_enabled
+
+
+def _detached_copy(reservation: Reservation) -> Reservation:
+    """Copy the columns needed for matching into a transient, session-free instance."""
+    return Reservation(
+        id=reservation.id,
+        session_id=reservation.session_id,
+        plate=reservation.plate,
+        plate_normalized=reservation.plate_normalized,
+        start_time=ensure_utc(reservation.start_time),
+        end_time=ensure_utc(reservation.end_time),
+        status=reservation.status,
+        contact_email=reservation.contact_email,
+    )
+
+
+class _PlateIntervals:
+    __slots__ = ("starts", "entries")
+
+    def __init__(self, entries: list[Reservation]) -> None:
+        self.entries = sorted(entries, key=lambda reservation: reservation.start_time)
+        self.starts = [reservation.start_time for reservation in self.entries]
+
+    def find(self, moment: datetime) -> Optional[Reservation]:
+        # Reservations of one plate never overlap, so only the latest one starting
+        # at or before ``moment`` can contain it.
+        idx = bisect.bisect_right(self.starts, moment)
+        if idx == 0:
+            return None
+        candidate = self.entries[idx - 1]
+        return candidate if candidate.end_time > moment else None
+
+
+class PlateMatchCache:
+    """
+    In-memory index of non-cancelled reservations from yesterday through tomorrow
+    (business days), keyed by normalized plate.
+
+    The whole window is loaded on first use and again whenever the business day
+    changes. Committed creates/deletes mark their plates stale; a stale plate is
+    reloaded with a single indexed query on its next lookup.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._day: date | None = None
+        self._window: tuple[datetime, datetime] | None = None
+        self._plates: dict[str, _PlateIntervals] = {}
+        self._stale: set[str] = set()
+        self._tree = BKTree()
+        self._epoch = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._day = None
+            self._window = None
+            self._plates = {}
+            self._stale.clear()
+            self._tree = BKTree()
+            self._epoch += 1
+
+    def invalidate(self, plates: Iterable[str]) -> None:
+        with self._lock:
+            for plate in plates:
+                self._stale.add(plate)
+                # The tree may hold plates that no longer have reservations; every
+                # candidate is checked against its intervals anyway.
+                self._tree.add(plate)
+            self._epoch += 1
+
+    def lookup(
+        self, session: Session, *, plate: str, when: datetime
+    ) -> tuple[bool, Optional[Reservation]]:
+        """
+        Return ``(covered, reservation)``. ``covered`` is False when ``when`` lies
+        outside the cached window and the caller has to ask the database.
+        """
+        today = business_today()
+        with self._lock:
+            fresh = self._day == today
+            window = self._window
+        if not fresh:
+            window, plates = self._rebuild(session, today)
+            if not (window[0] <= when < window[1]):
+                return False, None
+            intervals = plates.get(plate)
+            return True, intervals.find(when) if intervals else None
+        if not (window[0] <= when < window[1]):
+            return False, None
+
+        with self._lock:
+            stale = plate in self._stale
+            intervals = self._plates.get(plate)
+            epoch = self._epoch
+        if stale:
+            intervals = _PlateIntervals(self._load(session, window, plate=plate))
+            with self._lock:
+                if self._epoch == epoch and self._window == window:
+                    self._stale.discard(plate)
+                    if intervals.entries:
+                        self._plates[plate] = intervals
+                    else:
+                        self._plates.pop(plate, None)
+        if intervals is None:
+            return True, None
+        return True, intervals.find(when)
+
+    def fuzzy_lookup(
+        self, session: Session, *, plate: str, when: datetime, max_units: int
+    ) -> tuple[bool, Optional[Reservation], Optional[int]]:
+        """
+        Like ``lookup`` but, when the exact plate has no active reservation, try the
+        closest plates within ``max_units`` (see ``plate_fuzzy``) in distance order.
+        A tie between two active candidates counts as no match.
+        Returns ``(covered, reservation, distance_units)``.
+        """
+        covered, reservation = self.lookup(session, plate=plate, when=when)
+        if not covered:
+            return False, None, None
+        if reservation is not None:
+            return True, reservation, 0
+        with self._lock:
+            candidates = self._tree.search(plate, max_units)
+        best: tuple[int, Reservation] | None = None
+        for units, candidate in candidates:
+            if units == 0:
+                continue
+            if best is not None and units > best[0]:
+                break
+            _, reservation = self.lookup(session, plate=candidate, when=when)
+            if reservation is None:
+                continue
+            if best is not None:
+                # Two plates are equally close: refuse to guess.
+                return True, None, None
+            best = (units, reservation)
+        if best is None:
+            return True, None, None
+        return True, best[1], best[0]
+
+    def _rebuild(
+        self, session: Session, today: date
+    ) -> tuple[tuple[datetime, datetime], dict[str, _PlateIntervals]]:
+        window = (
+            business_day_bounds_utc(today - timedelta(days=1))[0],
+            business_day_bounds_utc(today + timedelta(days=1))[1],
+        )
+        with self._lock:
+            epoch = self._epoch
+        grouped: dict[str, list[Reservation]] = {}
+        for reservation in self._load(session, window):
+            grouped.setdefault(reservation.plate_normalized, []).append(reservation)
+        plates = {plate: _PlateIntervals(entries) for plate, entries in grouped.items()}
+        with self._lock:
+            if self._epoch == epoch:
+                self._day = today
+                self._window = window
+                self._plates = plates
+                self._stale.clear()
+                self._tree = BKTree(plates)
+                self._epoch += 1
+        return window, plates
+
+    @staticmethod
+    def _load(
+        session: Session, window: tuple[datetime, datetime], *, plate: str | None = None
+    ) -> list[Reservation]:
+        conditions = [
+            Reservation.status.in_(LIVE_STATUSES),
+            Reservation.start_time < window[1],
+            Reservation.end_time > window[0],
+        ]
+        if plate is not None:
+            conditions.append(Reservation.plate_normalized == plate)
+        stmt = select(Reservation).where(and_(*conditions))
+        return [_detached_copy(reservation) for reservation in session.scalars(stmt)]
+
+
+plate_match_cache = PlateMatchCache()
+
+
+def record_plate_change(session: Session, *, plate: str) -> None:
+    """Stage a plate whose reservations changed; its cache entry goes stale after commit."""
+    if plate_match_cache_enabled():
+        session.info.setdefault(_PENDING_KEY, set()).add(plate)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    plates = session.info.pop(_PENDING_KEY, None)
+    if plates:
+        plate_match_cache.invalidate(plates)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
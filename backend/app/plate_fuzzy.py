@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable, Optional
+
+# Distances are kept in integer half-edits so the BK-tree can bucket children by
+# exact distance. A likely OCR confusion costs half an edit, anything else a full one.
+CONFUSION_COST = 1
+EDIT_COST = 2
+
+_DIGIT_CONFUSIONS = {
+    frozenset(pair)
+    for pair in ("08", "06", "09", "17", "27", "35", "38", "56", "68", "89")
+}
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+
+def _jamo(char: str) -> Optional[tuple[int, int, int]]:
+    """Split a precomposed Hangul syllable into (initial, medial, final) indices."""
+    code = ord(char)
+    if not _HANGUL_BASE <= code <= _HANGUL_LAST:
+        return None
+    offset = code - _HANGUL_BASE
+    return offset // 588, (offset % 588) // 28, offset % 28
+
+
+@lru_cache(maxsize=8192)
+def substitution_cost(left: str, right: str) -> int:
+    """
+    Cost of reading ``left`` as ``right``. Digits from the confusion table and
+    Hangul syllables that keep their final consonant and share either the initial
+    consonant or the vowel (e.g. 두/무, 고/구) count as half an edit.
+    """
+    if left == right:
+        return 0
+    if frozenset((left, right)) in _DIGIT_CONFUSIONS:
+        return CONFUSION_COST
+    left_jamo, right_jamo = _jamo(left), _jamo(right)
+    if left_jamo and right_jamo and left_jamo[2] == right_jamo[2]:
+        if left_jamo[0] == right_jamo[0] or left_jamo[1] == right_jamo[1]:
+            return CONFUSION_COST
+    return EDIT_COST
+
+
+def plate_distance_units(left: str, right: str) -> int:
+    """Weighted Levenshtein distance in half-edits; a metric, so BK-tree pruning is exact."""
+    if left == right:
+        return 0
+    previous = [idx * EDIT_COST for idx in range(len(right) + 1)]
+    for i, left_char in enumerate(left, start=1):
+        current = [i * EDIT_COST]
+        for j, right_char in enumerate(right, start=1):
+            current.append(
+                min(
+                    previous[j] + EDIT_COST,
+                    current[j - 1] + EDIT_COST,
+                    previous[j - 1] + substitution_cost(left_char, right_char),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def plate_distance(left: str, right: str) -> float:
+    return plate_distance_units(left, right) / EDIT_COST
+
+
+class BKTree:
+    """Burkhard-Keller tree over normalized plates using ``plate_distance_units``."""
+
+    def __init__(self, plates: Iterable[str] = ()) -> None:
+        self._root: Optional[tuple[str, dict[int, tuple]]] = None
+        self._size = 0
+        for plate in plates:
+            self.add(plate)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, plate: str) -> None:
+        if self._root is None:
+            self._root = (plate, {})
+            self._size = 1
+            return
+        node = self._root
+        while True:
+            distance = plate_distance_units(plate, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (plate, {})
+                self._size += 1
+                return
+            node = child
+
+    def search(self, plate: str, max_units: int) -> list[tuple[int, str]]:
+        """Return ``(distance_units, plate)`` pairs within ``max_units``, closest first."""
+        if self._root is None:
+            return []
+        found: list[tuple[int, str]] = []
+        stack = [self._root]
+        while stack:
+            value, children = stack.pop()
+            distance = plate_distance_units(plate, value)
+            if distance <= max_units:
+                found.append((distance, value))
+            low, high = distance - max_units, distance + max_units
+            stack.extend(child for key, child in children.items() if low <= key <= high)
+        found.sort()
+        return found
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from .config import get_settings
+from .image_preprocess import IMAGE_DECODING_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+
+def content_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclass
+class CachedRecognition:
+    """A recognition response as it was returned to the client."""
+
+    body: bytes
+    media_type: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(eq=False)
+class _Entry:
+    variant: str
+    digest: str
+    phash: Optional[int]
+    result: CachedRecognition
+    stored_at: float
+
+
+class RecognitionCache:
+    """
+    LRU + TTL cache of plate recognition results for repeated camera frames.
+
+    Entries are found by the SHA-256 of the upload first (before any decoding), then
+    by the nearest dHash within ``max_distance`` bits, so re-encoded or slightly
+    changed frames of the same parked car reuse the earlier result. ``variant``
+    separates results produced under a different mode/model/prompt. When ``path``
+    is set, entries are loaded from and saved to that JSON file so they survive a
+    restart within the TTL.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        max_distance: int,
+        path: str | None = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._max_distance = max_distance
+        self._path = Path(path) if path else None
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits_exact = 0
+        self._hits_similar = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def lookup_exact(self, variant: str, digest: str) -> Optional[CachedRecognition]:
+        """Return the entry stored for exactly these bytes, without counting a miss."""
+        with self._lock:
+            self._expire(time.time())
+            entry = self._entries.get(self._key(variant, digest))
+            if entry is None:
+                return None
+            self._entries.move_to_end(self._key(variant, digest))
+            self._hits_exact += 1
+            return entry.result
+
+    def lookup_similar(self, variant: str, phash: Optional[int]) -> Optional[CachedRecognition]:
+        """Return the nearest entry by perceptual hash; a ``None`` result counts as a miss."""
+        with self._lock:
+            self._expire(time.time())
+            entry = self._nearest(variant, phash) if phash is not None else None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(self._key(entry.variant, entry.digest))
+            self._hits_similar += 1
+            return entry.result
+
+    def store(
+        self, variant: str, digest: str, phash: Optional[int], result: CachedRecognition
+    ) -> None:
+        key = self._key(variant, digest)
+        with self._lock:
+            self._entries[key] = _Entry(variant, digest, phash, result, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits_exact + self._hits_similar + self._misses
+            hits = self._hits_exact + self._hits_similar
+            return {
+                "size": len(self._entries),
+                "maxEntries": self._max_entries,
+                "hitsExact": self._hits_exact,
+                "hitsSimilar": self._hits_similar,
+                "misses": self._misses,
+                "hitRatio": round(hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "perceptualHash": IMAGE_DECODING_AVAILABLE,
+            }
+
+    def load(self) -> int:
+        """Load persisted entries that are still within the TTL; return how many."""
+        if self._path is None or not self._path.exists():
+            return 0
+        try:
+            rows = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable recognition cache %s: %s", self._path, exc)
+            return 0
+        now = time.time()
+        with self._lock:
+            for row in rows:
+                if now - row["storedAt"] >= self._ttl:
+                    continue
+                result = CachedRecognition(
+                    body=base64.b64decode(row["body"]),
+                    media_type=row["mediaType"],
+                    headers=row.get("headers", {}),
+                )
+                phash = int(row["phash"], 16) if row.get("phash") else None
+                key = self._key(row["variant"], row["digest"])
+                self._entries[key] = _Entry(
+                    row["variant"], row["digest"], phash, result, row["storedAt"]
+                )
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            return len(self._entries)
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+        with self._lock:
+            self._expire(time.time())
+            rows = [
+                {
+                    "variant": entry.variant,
+                    "digest": entry.digest,
+                    "phash": format(entry.phash, "x") if entry.phash is not None else None,
+                    "body": base64.b64encode(entry.result.body).decode("ascii"),
+                    "mediaType": entry.result.media_type,
+                    "headers": entry.result.headers,
+                    "storedAt": entry.stored_at,
+                }
+                for entry in self._entries.values()
+            ]
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(rows), encoding="utf-8")
+        os.replace(tmp_path, self._path)
+
+    @staticmethod
+    def _key(variant: str, digest: str) -> str:
+        return f"{variant}:{digest}"
+
+    def _expire(self, now: float) -> None:
+        # Insertion order is LRU order, not age order, so check every entry.
+        stale = [key for key, entry in self._entries.items() if now - entry.stored_at >= self._ttl]
+        for key in stale:
+            del self._entries[key]
+        self._expirations += len(stale)
+
+    def _nearest(self, variant: str, phash: int) -> Optional[_Entry]:
+        best: Optional[_Entry] = None
+        best_distance = self._max_distance + 1
+        for entry in self._entries.values():
+            if entry.phash is None or entry.variant != variant:
+                continue
+            distance = (entry.phash ^ phash).bit_count()
+            if distance < best_distance:
+                best, best_distance = entry, distance
+        return best
+
+
+@lru_cache(1)
+def get_recognition_cache() -> RecognitionCache:
+    settings = get_settings()
+    return RecognitionCache(
+        max_entries=settings.recognition_cache_size,
+        ttl_seconds=settings.recognition_cache_ttl_seconds,
+        max_distance=settings.recognition_cache_max_distance,
+        path=settings.recognition_cache_path or None,
+    )
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import json
+import logging
+import socket
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+import httpx
+from fastapi import HTTPException, Request, Response
+
+from .schemas import RecognitionJobResponse
+from .time_utils import UTC
+
+logger = logging.getLogger(__name__)
+
+JobRunner = Callable[[], Awaitable[Response]]
+
+CALLBACK_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+
+@dataclass(eq=False)
+class RecognitionJob:
+    id: str
+    run: Optional[JobRunner]
+    callback_url: Optional[str] = None
+    status: str = "queued"
+    result: Any = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+    timings: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in {"succeeded", "failed"}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "statusCode": self.status_code,
+            "serverTiming": self.timings,
+            "createdAt": self.created_at,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+        }
+
+
+class RecognitionJobQueueFull(Exception):
+    pass
+
+
+class CallbackURLRejected(ValueError):
+    pass
+
+
+async def check_callback_url(url: str, allowed_hosts: Sequence[str]) -> None:
+    """
+    Refuse callback targets the server should not be made to call.
+
+    With ``allowed_hosts`` the host must be listed. Otherwise every address the
+    host resolves to must be public: loopback, private, link-local (cloud metadata)
+    and other reserved ranges are refused.
+    """
+    parsed = httpx.URL(url)
+    if parsed.scheme not in {"http", "https"} or not parsed.host:
+        raise CallbackURLRejected("callbackUrl must be an http(s) URL.")
+    host = parsed.host.lower()
+    if allowed_hosts:
+        if host not in allowed_hosts:
+            raise CallbackURLRejected("callbackUrl host is not allowed.")
+        return
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, parsed.port or (443 if parsed.scheme == "https" else 80), type=socket.SOCK_STREAM
+        )
+    except socket.gaierror as exc:
+        raise CallbackURLRejected("callbackUrl host cannot be resolved.") from exc
+    for info in infos:
+        address = ipaddress.ip_address(info[4][0].split("%", 1)[0])
+        if not address.is_global or address.is_multicast:
+            raise CallbackURLRejected("callbackUrl must point at a public address.")
+
+
+class RecognitionJobQueue:
+    """
+    Run plate recognitions in the background on a fixed number of worker tasks.
+
+    ``submit`` returns immediately with a queued job; at most ``max_pending`` jobs
+    wait at once, beyond which submission is refused. Finished jobs are kept for
+    ``retention_seconds`` so clients can fetch (or long-poll) the result, and, when
+    the job has a callback URL, the job document is POSTed there on completion.
+    Callbacks go through their own connection pool of ``callback_connections``, so
+    slow receivers cannot hold recognition upstream connections, and the target is
+    checked again right before delivery.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        max_pending: int,
+        retention_seconds: float,
+        callback_hosts: Sequence[str] = (),
+        callback_connections: int = 4,
+    ) -> None:
+        self._worker_count = workers
+        self._max_pending = max_pending
+        self._retention = retention_seconds
+        self._callback_hosts = list(callback_hosts)
+        self._callback_connections = max(1, callback_connections)
+        self._callback_client: httpx.AsyncClient | None = None
+        self._jobs: dict[str, RecognitionJob] = {}
+        self._queue: asyncio.Queue[RecognitionJob] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._background: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_pending)
+        loop = asyncio.get_running_loop()
+        self._workers = [
+            loop.create_task(self._work(), name=f"recognition-job-{idx}")
+            for idx in range(self._worker_count)
+        ]
+
+    async def stop(self) -> None:
+        tasks = [*self._workers, *self._background]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._background.clear()
+        self._queue = None
+        if self._callback_client is not None:
+            await self._callback_client.aclose()
+            self._callback_client = None
+
+    async def check_callback_url(self, url: str) -> None:
+        await check_callback_url(url, self._callback_hosts)
+
+    def submit(self, run: JobRunner, *, callback_url: Optional[str] = None) -> RecognitionJob:
+        if self._queue is None:
+            raise RuntimeError("Recognition job queue is not running.")
+        self._prune()
+        job = RecognitionJob(id=uuid.uuid4().hex, run=run, callback_url=callback_url)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull as exc:
+            raise RecognitionJobQueueFull() from exc
+        self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[RecognitionJob]:
+        return self._jobs.get(job_id)
+
+    async def wait(self, job: RecognitionJob, timeout: float) -> RecognitionJob:
+        if not job.finished and timeout > 0:
+            try:
+                await asyncio.wait_for(job.done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return job
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self._retention
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at is not None and job.finished_at.timestamp() < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def _work(self) -> None:
+        assert self._queue is not None
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._execute(job)
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, job: RecognitionJob) -> None:
+        job.status = "running"
+        job.started_at = datetime.now(UTC)
+        run, job.run = job.run, None  # drop the upload bytes once the job has started
+        try:
+            response = await run()
+        except HTTPException as exc:
+            job.status, job.status_code, job.error = "failed", exc.status_code, str(exc.detail)
+        except Exception as exc:  # noqa: BLE001 - reported on the job, not raised
+            logger.exception("Recognition job %s failed.", job.id)
+            job.status, job.status_code, job.error = "failed", 500, str(exc)
+        else:
+            job.status_code = response.status_code
+            job.timings = response.headers.get("server-timing")
+            job.result = decode_body(response.body)
+            job.status = "succeeded" if response.status_code < 400 else "failed"
+        job.finished_at = datetime.now(UTC)
+        job.done.set()
+        if job.callback_url:
+            task = asyncio.get_running_loop().create_task(self._deliver(job))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def _deliver(self, job: RecognitionJob) -> None:
+        # Same document as GET /api/license-plates/jobs/{id}.
+        payload = RecognitionJobResponse(**job.to_dict()).model_dump(mode="json", by_alias=True)
+        try:
+            # Resolve again: the name may point somewhere else by now.
+            await self.check_callback_url(job.callback_url)
+            response = await self._callback_http().post(job.callback_url, json=payload)
+            response.raise_for_status()
+        except (CallbackURLRejected, httpx.HTTPError) as exc:
+            logger.warning("Recognition job %s callback failed: %s", job.id, exc)
+
+    def _callback_http(self) -> httpx.AsyncClient:
+        if self._callback_client is None:
+            self._callback_client = httpx.AsyncClient(
+                timeout=CALLBACK_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=self._callback_connections,
+                    max_keepalive_connections=self._callback_connections,
+                ),
+                follow_redirects=False,
+            )
+        return self._callback_client
+
+
+def decode_body(body: bytes) -> Any:
+    """Recognition responses are JSON in practice; anything else is kept as text."""
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body.decode("utf-8", errors="replace")
+
+
+def get_recognition_jobs(request: Request) -> RecognitionJobQueue:
+    return request.app.state.recognition_jobs
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from fastapi import Request
+
+T = TypeVar("T")
+
+# Wait-time samples kept for the average / p95 in ``stats()``.
+WAIT_SAMPLES = 512
+
+
+class RecognitionOverloaded(Exception):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"Recognition is overloaded; retry after {retry_after}s.")
+        self.retry_after = retry_after
+
+
+class RecognitionLimiter:
+    """
+    Admission control for plate recognition, kept apart from the request threadpool.
+
+    At most ``max_concurrent`` recognitions run at once; up to ``max_waiting`` more
+    wait for a slot in arrival order, none longer than ``wait_budget_seconds``. A
+    new request is refused straight away when the wait queue is full or its oldest
+    entry has already waited past the budget (it would only wait longer still), so
+    a burst of slow upstream calls turns into quick 503s instead of piling up.
+    CPU-bound image work runs on a private pool of ``threads`` threads rather than
+    the default executor.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int,
+        max_waiting: int,
+        wait_budget_seconds: float,
+        threads: int,
+    ) -> None:
+        self._max_concurrent = max(1, max_concurrent)
+        self._max_waiting = max(0, max_waiting)
+        self._wait_budget = wait_budget_seconds
+        self._threads = max(1, threads)
+        self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        self._executor: ThreadPoolExecutor | None = None
+        # Enqueue time per waiting interactive request, in arrival order.
+        self._waiting: dict[object, float] = {}
+        self._jobs_waiting = 0
+        self._active = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._wait_samples: deque[float] = deque(maxlen=WAIT_SAMPLES)
+
+    async def acquire(self, *, shed: bool = True) -> float:
+        """
+        Wait for a recognition slot and return the seconds spent waiting.
+
+        With ``shed`` (interactive requests) raise ``RecognitionOverloaded`` instead
+        of queueing behind a backlog or waiting past the budget; background jobs
+        pass ``shed=False`` and wait as long as it takes. Job waiters are counted
+        apart from the interactive queue, so a job backlog (at most one waiter per
+        job worker) never makes interactive requests look overdue.
+        """
+        enqueued = time.monotonic()
+        if not shed:
+            self._jobs_waiting += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self._jobs_waiting -= 1
+            return self._admitted_after(enqueued)
+
+        self._admit(enqueued)
+        token = object()
+        self._waiting[token] = enqueued
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self._wait_budget)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            raise RecognitionOverloaded(retry_after=self._retry_after()) from None
+        finally:
+            del self._waiting[token]
+        return self._admitted_after(enqueued)
+
+    def _admitted_after(self, enqueued: float) -> float:
+        waited = time.monotonic() - enqueued
+        self._wait_samples.append(waited * 1000)
+        self._admitted += 1
+        self._active += 1
+        return waited
+
+    def release(self) -> None:
+        self._active -= 1
+        self._semaphore.release()
+
+    async def run_in_thread(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._threads, thread_name_prefix="recognition"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        samples = sorted(self._wait_samples)
+        oldest = next(iter(self._waiting.values()), None)
+        return {
+            "maxConcurrent": self._max_concurrent,
+            "maxWaiting": self._max_waiting,
+            "waitBudgetMs": round(self._wait_budget * 1000, 1),
+            "threads": self._threads,
+            "active": self._active,
+            "waiting": len(self._waiting),
+            "jobsWaiting": self._jobs_waiting,
+            "oldestWaitMs": round((now - oldest) * 1000, 1) if oldest is not None else 0.0,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "avgWaitMs": round(sum(samples) / len(samples), 1) if samples else 0.0,
+            "p95WaitMs": round(samples[int(len(samples) * 0.95)], 1) if samples else 0.0,
+        }
+
+    def _admit(self, now: float) -> None:
+        if not self._semaphore.locked():
+            return
+        oldest = next(iter(self._waiting.values()), None)
+        if len(self._waiting) < self._max_waiting and (
+            oldest is None or now - oldest <= self._wait_budget
+        ):
+            return
+        self._rejected += 1
+        raise RecognitionOverloaded(retry_after=self._retry_after())
+
+    def _retry_after(self) -> int:
+        return max(1, math.ceil(self._wait_budget))
+
+
+def get_recognition_limiter(request: Request) -> RecognitionLimiter:
+    return request.app.state.recognition_limiter
@@ -2,27 +2,33 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from .. import crud
 from ..config import get_settings
 from ..database import get_db
+from ..models import ReservationStatus
+from ..recognition_cache import get_recognition_cache
+from ..recognition_limiter import RecognitionLimiter, get_recognition_limiter
 from ..schemas import (
     AdminLoginRequest,
     AdminLoginResponse,
+    RecognitionCacheStatsResponse,
+    RecognitionLoadStatsResponse,
     ReservationDeleteResponse,
-    SessionReservations,
     SessionsResponse,
+    WriteQueueStatsResponse,
 )
-from .reservations import to_reservation_public
+from ..write_coordinator import get_write_coordinator
+from .reservations import build_sessions_response
 
 settings = get_settings()
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
 
-def verify_admin_token(authorization: str = Header(..., alias="Authorization")) -> str:
+async def verify_admin_token(authorization: str = Header(..., alias="Authorization")) -> str:
     scheme, _, token = authorization.partition(" ")
     if scheme.lower() != "bearer" or token != settings.admin_token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 관리자 토큰입니다.")
@@ -43,23 +49,55 @@ def admin_login(payload: AdminLoginRequest) -> AdminLoginResponse:
 )
 def admin_reservations_by_session(
     target_date: date = Query(..., alias="date", description="조회 날짜 (YYYY-MM-DD)"),
+    status_filter: ReservationStatus | None = Query(None, alias="status", description="예약 상태 필터"),
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
     _: str = Depends(verify_admin_token),
     db: Session = Depends(get_db),
-) -> SessionsResponse:
-    sessions = crud.list_sessions(db)
-    result: list[SessionReservations] = []
-    for session_obj in sessions:
-        reservations = crud.reservations_by_session_and_date(
-            db, session_id=session_obj.id, date_value=target_date
-        )
-        result.append(
-            SessionReservations(
-                sessionId=session_obj.id,
-                name=session_obj.name,
-                reservations=[to_reservation_public(res) for res in reservations],
-            )
-        )
-    return SessionsResponse(sessions=result)
+) -> SessionsResponse | Response:
+    return build_sessions_response(
+        db, target_date, status_filter=status_filter, if_none_match=if_none_match
+    )
+
+
+@router.get(
+    "/write-queue",
+    response_model=WriteQueueStatsResponse,
+    summary="예약 쓰기 큐 상태",
+)
+def write_queue_stats(_: str = Depends(verify_admin_token)) -> WriteQueueStatsResponse:
+    return WriteQueueStatsResponse(**get_write_coordinator().stats())
+
+
+@router.get(
+    "/recognition-cache",
+    response_model=RecognitionCacheStatsResponse,
+    summary="번호판 인식 캐시 상태",
+)
+def recognition_cache_stats(_: str = Depends(verify_admin_token)) -> RecognitionCacheStatsResponse:
+    return RecognitionCacheStatsResponse(**get_recognition_cache().stats())
+
+
+@router.delete(
+    "/recognition-cache",
+    response_model=RecognitionCacheStatsResponse,
+    summary="번호판 인식 캐시 비우기",
+)
+def clear_recognition_cache(_: str = Depends(verify_admin_token)) -> RecognitionCacheStatsResponse:
+    cache = get_recognition_cache()
+    cache.clear()
+    return RecognitionCacheStatsResponse(**cache.stats())
+
+
+@router.get(
+    "/recognition-load",
+    response_model=RecognitionLoadStatsResponse,
+    summary="번호판 인식 대기열 상태",
+)
+async def recognition_load_stats(
+    _: str = Depends(verify_admin_token),
+    limiter: RecognitionLimiter = Depends(get_recognition_limiter),
+) -> RecognitionLoadStatsResponse:
+    return RecognitionLoadStatsResponse(**limiter.stats())
 
 
 @router.delete(
@@ -2,19 +2,54 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
 import mimetypes
+import re
+import time
 from typing import Any
 
 import httpx
-from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
 from fastapi.responses import JSONResponse
-from openai import OpenAI, OpenAIError
+from openai import OpenAIError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from .. import crud
 from ..config import get_settings
+from ..database import get_db
+from ..image_preprocess import PreprocessedImage, perceptual_hash, preprocess_image
+from ..recognition_cache import CachedRecognition, content_digest, get_recognition_cache
+from ..recognition_jobs import (
+    CallbackURLRejected,
+    RecognitionJobQueue,
+    RecognitionJobQueueFull,
+    decode_body,
+    get_recognition_jobs,
+)
+from ..recognition_limiter import RecognitionLimiter, RecognitionOverloaded, get_recognition_limiter
+from ..schemas import PlateMatchRequest, PlateRecognizeMatchResponse, RecognitionJobResponse
+from ..upstream import UpstreamClients, get_upstream_clients
+from .reservations import plate_match_response
 
 
 router = APIRouter(tags=["plates"])
 
+# Upper bound for GET /api/license-plates/jobs/{id}?wait=...
+MAX_JOB_WAIT_SECONDS = 30.0
+# Optional region name, 2-3 digits, one Hangul syllable, 4 digits (12가3456, 서울12가3456).
+KOREAN_PLATE_RE = re.compile(r"^(?:[가-힣]{2})?\d{2,3}[가-힣]\d{4}$")
+
 
 def _recognize_url(full: str) -> str:
     return full
@@ -30,86 +65,122 @@ def _image_to_data_url(content: bytes, content_type: str | None) -> str:
     return f"data:{mime};base64,{encoded}"
 
 
-async def _recognize_with_openai(image: UploadFile, settings) -> JSONResponse:
-    content = await image.read()
-    if not content:
-        raise HTTPException(status_code=400, detail="Image file is required.")
-    if not settings.openai_api_key:
-        raise HTTPException(status_code=500, detail="OPENAI_API_KEY is not configured.")
+def is_valid_plate(text: str) -> bool:
+    """True when ``text`` reads as a Korean plate, e.g. ``12가3456`` or ``서울123가4567``."""
+    return KOREAN_PLATE_RE.match(crud.normalize_plate(text).replace("-", "")) is not None
 
-    data_url = _image_to_data_url(content, image.content_type)
-    prompt = settings.plate_openai_prompt
 
-    def _call_openai() -> tuple[str, str]:
-        client = OpenAI(api_key=settings.openai_api_key)
-        response = client.responses.create(
-            model=settings.plate_openai_model,
+async def _call_openai(
+    data_url: str, settings, upstream: UpstreamClients, *, model: str, detail: str | None = None
+) -> tuple[str, str]:
+    image_part: dict[str, Any] = {"type": "input_image", "image_url": data_url}
+    if detail is not None:
+        image_part["detail"] = detail
+    try:
+        response = await upstream.openai.responses.create(
+            model=model,
             input=[
                 {
                     "role": "user",
                     "content": [
-                        {"type": "input_text", "text": prompt},
-                        {"type": "input_image", "image_url": data_url},
+                        {"type": "input_text", "text": settings.plate_openai_prompt},
+                        image_part,
                     ],
                 }
             ],
         )
-        text_output = (response.output_text or "").strip()
-        return text_output, response.output_text or ""
-
-    try:
-        plate_text, raw_output = await asyncio.to_thread(_call_openai)
     except OpenAIError as exc:
         raise HTTPException(status_code=502, detail=f"OpenAI error: {exc}") from exc
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=502, detail=f"OpenAI error: {exc}") from exc
-    finally:
-        await image.close()
+    text_output = (response.output_text or "").strip()
+    return text_output, response.output_text or ""
 
+
+async def _recognize_with_openai(
+    content: bytes, content_type: str | None, settings, upstream: UpstreamClients
+) -> JSONResponse:
+    if not settings.openai_api_key:
+        raise HTTPException(status_code=500, detail="OPENAI_API_KEY is not configured.")
+
+    data_url = _image_to_data_url(content, content_type)
+    plate_text, raw_output = await _call_openai(
+        data_url, settings, upstream, model=settings.plate_openai_model
+    )
     return JSONResponse({"plate": plate_text, "raw": raw_output})
 
 
+async def _recognize_tiered(
+    prepared: PreprocessedImage, settings, upstream: UpstreamClients
+) -> JSONResponse:
+    """
+    Try the cheapest request first and escalate only when the answer is not a plate:
+    the thumbnail at low detail, then the full preprocessed image at high detail,
+    then (if configured) the same image on PLATE_OPENAI_ESCALATION_MODEL.
+    """
+    if not settings.openai_api_key:
+        raise HTTPException(status_code=500, detail="OPENAI_API_KEY is not configured.")
+
+    full_url = _image_to_data_url(prepared.content, prepared.content_type)
+    tiers: list[tuple[str, str, str]] = []
+    if prepared.thumbnail is not None:
+        thumbnail_url = _image_to_data_url(prepared.thumbnail, "image/jpeg")
+        tiers.append((thumbnail_url, settings.plate_openai_model, "low"))
+    tiers.append((full_url, settings.plate_openai_model, "high"))
+    escalation_model = settings.plate_openai_escalation_model
+    if escalation_model and escalation_model != settings.plate_openai_model:
+        tiers.append((full_url, escalation_model, "high"))
+
+    for tier, (data_url, model, detail) in enumerate(tiers, start=1):
+        started = time.perf_counter()
+        plate_text, raw_output = await _call_openai(
+            data_url, settings, upstream, model=model, detail=detail
+        )
+        prepared.timings[f"tier{tier}"] = (time.perf_counter() - started) * 1000
+        valid = is_valid_plate(plate_text)
+        if valid:
+            break
+    return JSONResponse({"plate": plate_text, "raw": raw_output, "tier": tier, "valid": valid})
+
+
 async def _proxy_recognition(
-    image: UploadFile,
+    content: bytes,
+    filename: str | None,
+    content_type: str | None,
     settings,
-) -> Any:
+    upstream: UpstreamClients,
+) -> Response:
     try:
         url = _recognize_url(settings.plate_service_endpoint)
-        content = await image.read()
-        if not content:
-            raise HTTPException(status_code=400, detail="Image file is required.")
-
-        timeout = httpx.Timeout(60.0, connect=10.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            files = {
-                "image": (
-                    image.filename or "upload.jpg",
-                    content,
-                    image.content_type or "image/jpeg",
-                )
-            }
-            resp = await client.post(url, files=files)
-            if resp.status_code >= 400:
-                # Bubble up LP service errors as 502 to the frontend
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY,
-                    detail=f"LP service error: status {resp.status_code}",
-                )
-            upstream_media_type = resp.headers.get("content-type", "").lower()
-            if "charset" not in upstream_media_type:
-                media_type = "application/json; charset=utf-8"
-            else:
-                media_type = resp.headers.get("content-type")
-            return Response(
-                content=resp.content,
-                status_code=resp.status_code,
-                media_type=media_type,
-                headers={
-                    key: value
-                    for key, value in resp.headers.items()
-                    if key.lower() in {"cache-control", "etag"}
-                },
+        files = {
+            "image": (
+                filename or "upload.jpg",
+                content,
+                content_type or "image/jpeg",
+            )
+        }
+        resp = await upstream.http.post(url, files=files)
+        if resp.status_code >= 400:
+            # Bubble up LP service errors as 502 to the frontend
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"LP service error: status {resp.status_code}",
             )
+        upstream_media_type = resp.headers.get("content-type", "").lower()
+        if "charset" not in upstream_media_type:
+            media_type = "application/json; charset=utf-8"
+        else:
+            media_type = resp.headers.get("content-type")
+        return Response(
+            content=resp.content,
+            status_code=resp.status_code,
+            media_type=media_type,
+            headers={
+                key: value
+                for key, value in resp.headers.items()
+                if key.lower() in {"cache-control", "etag"}
+            },
+        )
     except HTTPException:
         raise
     except asyncio.TimeoutError as exc:  # pragma: no cover
@@ -118,8 +189,161 @@ async def _proxy_recognition(
         raise HTTPException(
             status_code=502, detail=f"LP service unreachable: {exc.__class__.__name__}"
         ) from exc
+
+
+def _recognition_variant(settings) -> str:
+    """Results from a different mode, model, prompt, upstream or preprocessing are never reused."""
+    prompt_digest = hashlib.sha256(settings.plate_openai_prompt.encode("utf-8")).hexdigest()[:12]
+    preprocess = (
+        f"{settings.plate_preprocess_max_edge}/{int(settings.plate_preprocess_grayscale)}"
+        f"/{settings.plate_preprocess_jpeg_quality}"
+        if settings.plate_preprocess_enabled
+        else "raw"
+    )
+    return "|".join(
+        (
+            settings.plate_service_mode,
+            settings.plate_openai_model,
+            settings.plate_service_endpoint,
+            prompt_digest,
+            preprocess,
+            f"tiered/{_thumbnail_edge(settings)}/{settings.plate_openai_escalation_model}"
+            if _thumbnail_edge(settings)
+            else "single",
+        )
+    )
+
+
+def _thumbnail_edge(settings) -> int:
+    if settings.plate_service_mode == "gptapi" and settings.plate_recognition_tiered:
+        return settings.plate_tier1_max_edge
+    return 0
+
+
+async def _prepare_image(
+    content: bytes, content_type: str | None, settings, limiter: RecognitionLimiter
+) -> PreprocessedImage:
+    if settings.plate_preprocess_enabled:
+        return await limiter.run_in_thread(
+            preprocess_image,
+            content,
+            content_type,
+            max_edge=settings.plate_preprocess_max_edge,
+            grayscale=settings.plate_preprocess_grayscale,
+            jpeg_quality=settings.plate_preprocess_jpeg_quality,
+            thumbnail_edge=_thumbnail_edge(settings),
+        )
+    phash = None
+    if settings.recognition_cache_enabled:
+        phash = await limiter.run_in_thread(perceptual_hash, content)
+    return PreprocessedImage(content=content, content_type=content_type or "image/jpeg", phash=phash)
+
+
+async def _run_recognition(
+    prepared: PreprocessedImage, filename: str | None, settings, upstream: UpstreamClients
+) -> Response:
+    if settings.plate_service_mode == "gptapi":
+        if settings.plate_recognition_tiered:
+            return await _recognize_tiered(prepared, settings, upstream)
+        return await _recognize_with_openai(
+            prepared.content, prepared.content_type, settings, upstream
+        )
+    return await _proxy_recognition(
+        prepared.content, filename, prepared.content_type, settings, upstream
+    )
+
+
+def _cached_response(cached: CachedRecognition, outcome: str) -> Response:
+    return Response(
+        content=cached.body,
+        media_type=cached.media_type,
+        headers={**cached.headers, "X-Recognition-Cache": outcome},
+    )
+
+
+def _cacheable(response: Response) -> bool:
+    # A tiered reading that never passed the format check is not worth reusing:
+    # a similar frame should get its own chance to escalate.
+    if not 200 <= response.status_code < 300:
+        return False
+    result = decode_body(response.body)
+    return not (isinstance(result, dict) and result.get("valid") is False)
+
+
+async def _read_upload(image: UploadFile) -> bytes:
+    try:
+        content = await image.read()
     finally:
         await image.close()
+    if not content:
+        raise HTTPException(status_code=400, detail="Image file is required.")
+    return content
+
+
+async def recognize_content(
+    content: bytes,
+    filename: str | None,
+    content_type: str | None,
+    settings,
+    upstream: UpstreamClients,
+    limiter: RecognitionLimiter,
+    *,
+    shed: bool = True,
+) -> Response:
+    """
+    Run an uploaded image through cache, preprocessing and the configured upstream.
+
+    Exact cache hits are answered without a recognition slot; everything else waits
+    for one, or gets 503 + Retry-After when ``shed`` and recognition is backed up.
+    """
+    cache = get_recognition_cache() if settings.recognition_cache_enabled else None
+    variant = _recognition_variant(settings)
+    digest = content_digest(content)
+    if cache is not None:
+        cached = cache.lookup_exact(variant, digest)
+        if cached is not None:
+            return _cached_response(cached, "exact")
+
+    try:
+        waited = await limiter.acquire(shed=shed)
+    except RecognitionOverloaded as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Plate recognition is overloaded.",
+            headers={"Retry-After": str(exc.retry_after)},
+        ) from exc
+    try:
+        prepared = await _prepare_image(content, content_type, settings, limiter)
+        prepared.timings = {"queue": waited * 1000, **prepared.timings}
+        if cache is not None:
+            cached = cache.lookup_similar(variant, prepared.phash)
+            if cached is not None:
+                return _cached_response(cached, "similar")
+
+        started = time.perf_counter()
+        response = await _run_recognition(prepared, filename, settings, upstream)
+        prepared.timings["upstream"] = (time.perf_counter() - started) * 1000
+    finally:
+        limiter.release()
+    if cache is not None and _cacheable(response):
+        cache.store(
+            variant,
+            digest,
+            prepared.phash,
+            CachedRecognition(
+                body=bytes(response.body),
+                media_type=response.media_type or "application/json",
+                headers={
+                    key: value
+                    for key, value in response.headers.items()
+                    if key.lower() in {"cache-control", "etag"}
+                },
+            ),
+        )
+    if cache is not None:
+        response.headers["X-Recognition-Cache"] = "miss"
+    response.headers["Server-Timing"] = prepared.server_timing()
+    return response
 
 
 @router.post(
@@ -129,10 +353,13 @@ async def _proxy_recognition(
 async def recognize_plate_proxy(
     image: UploadFile = File(..., description="Plate image file"),
     settings=Depends(get_settings),
+    upstream: UpstreamClients = Depends(get_upstream_clients),
+    limiter: RecognitionLimiter = Depends(get_recognition_limiter),
 ) -> Any:
-    if settings.plate_service_mode == "gptapi":
-        return await _recognize_with_openai(image=image, settings=settings)
-    return await _proxy_recognition(image=image, settings=settings)
+    content = await _read_upload(image)
+    return await recognize_content(
+        content, image.filename, image.content_type, settings, upstream, limiter
+    )
 
 
 @router.post(
@@ -142,7 +369,124 @@ async def recognize_plate_proxy(
 async def recognize_plate_legacy(
     image: UploadFile = File(..., description="Plate image file"),
     settings=Depends(get_settings),
+    upstream: UpstreamClients = Depends(get_upstream_clients),
+    limiter: RecognitionLimiter = Depends(get_recognition_limiter),
 ) -> Any:
-    if settings.plate_service_mode == "gptapi":
-        return await _recognize_with_openai(image=image, settings=settings)
-    return await _proxy_recognition(image=image, settings=settings)
+    content = await _read_upload(image)
+    return await recognize_content(
+        content, image.filename, image.content_type, settings, upstream, limiter
+    )
+
+
+@router.post(
+    "/api/license-plates/jobs",
+    response_model=RecognitionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue an image for background recognition",
+)
+async def create_recognition_job(
+    image: UploadFile = File(..., description="Plate image file"),
+    callback_url: str | None = Form(
+        None, alias="callbackUrl", description="POST the finished job here"
+    ),
+    settings=Depends(get_settings),
+    upstream: UpstreamClients = Depends(get_upstream_clients),
+    jobs: RecognitionJobQueue = Depends(get_recognition_jobs),
+    limiter: RecognitionLimiter = Depends(get_recognition_limiter),
+) -> RecognitionJobResponse:
+    if callback_url:
+        try:
+            await jobs.check_callback_url(callback_url)
+        except (CallbackURLRejected, httpx.InvalidURL) as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    content = await _read_upload(image)
+    filename, content_type = image.filename, image.content_type
+    try:
+        job = jobs.submit(
+            # The job queue is bounded already, so jobs wait for a slot instead of shedding.
+            lambda: recognize_content(
+                content, filename, content_type, settings, upstream, limiter, shed=False
+            ),
+            callback_url=callback_url,
+        )
+    except RecognitionJobQueueFull as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Recognition queue is full.",
+            headers={"Retry-After": "1"},
+        ) from exc
+    return RecognitionJobResponse(**job.to_dict())
+
+
+@router.get(
+    "/api/license-plates/jobs/{job_id}",
+    response_model=RecognitionJobResponse,
+    summary="Fetch a recognition job, optionally waiting for it to finish",
+)
+async def get_recognition_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=MAX_JOB_WAIT_SECONDS, description="Long-poll seconds"),
+    jobs: RecognitionJobQueue = Depends(get_recognition_jobs),
+) -> RecognitionJobResponse:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Recognition job not found.")
+    await jobs.wait(job, wait)
+    return RecognitionJobResponse(**job.to_dict())
+
+
+@router.post(
+    "/api/plates/recognize-match",
+    response_model=PlateRecognizeMatchResponse,
+    summary="Recognize a plate image and match it against active reservations",
+)
+async def recognize_and_match_plate(
+    response: Response,
+    image: UploadFile = File(..., description="Plate image file"),
+    timestamp: str = Form(..., description="Detection time (ISO 8601 or epoch)"),
+    fuzzy: bool = Form(False),
+    settings=Depends(get_settings),
+    upstream: UpstreamClients = Depends(get_upstream_clients),
+    limiter: RecognitionLimiter = Depends(get_recognition_limiter),
+    db: Session = Depends(get_db),
+) -> PlateRecognizeMatchResponse:
+    try:
+        when = PlateMatchRequest.parse_timestamp(timestamp)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    started = time.perf_counter()
+    content = await _read_upload(image)
+    recognized = await recognize_content(
+        content, image.filename, image.content_type, settings, upstream, limiter
+    )
+    timings = {"recognition": (time.perf_counter() - started) * 1000}
+    result = decode_body(recognized.body)
+    plate = result.get("plate") if isinstance(result, dict) else None
+    plate = plate.strip() if isinstance(plate, str) else None
+
+    match = None
+    if plate:
+        started = time.perf_counter()
+        distance = None
+        if fuzzy:
+            reservation, distance = await run_in_threadpool(
+                crud.find_active_reservation_by_plate_fuzzy, db, plate=plate, when=when
+            )
+        else:
+            reservation = await run_in_threadpool(
+                crud.find_active_reservation_by_plate, db, plate=plate, when=when
+            )
+        match = plate_match_response(plate, reservation, distance)
+        timings["match"] = (time.perf_counter() - started) * 1000
+
+    server_timing = [recognized.headers.get("server-timing")]
+    server_timing += [f"{stage};dur={duration:.1f}" for stage, duration in timings.items()]
+    response.headers["Server-Timing"] = ", ".join(filter(None, server_timing))
+    if "x-recognition-cache" in recognized.headers:
+        response.headers["X-Recognition-Cache"] = recognized.headers["x-recognition-cache"]
+    return PlateRecognizeMatchResponse(
+        recognition=result,
+        plate=plate or None,
+        match=match,
+        timings_ms={stage: round(duration, 3) for stage, duration in timings.items()},
+    )
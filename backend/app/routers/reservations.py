@@ -2,29 +2,45 @@ from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
-from .. import crud
+from .. import change_log, crud, fast_json, live_events
+from ..config import get_settings
 from ..database import get_db
+from ..fast_json import FastJSONResponse, fast_json_enabled
 from ..models import ChargingSession, Reservation, ReservationStatus
 from ..schemas import (
+    AvailabilityRange,
+    AvailabilityResponse,
+    PlateMatchBatchRequest,
+    PlateMatchBatchResponse,
     PlateMatchRequest,
     PlateMatchResponse,
     PlateVerificationRequest,
     PlateVerificationResponse,
     ReservationCreate,
     ReservationBatchCreate,
+    ReservationChangeEntry,
+    ReservationChangesResponse,
     ReservationDeleteResponse,
     ReservationPublic,
+    SessionAvailability,
     SessionReservations,
     SessionsResponse,
 )
+from ..slot_index import SLOT_INTERVAL, free_ranges, slots_in_day
 from ..time_utils import (
     UTC,
+    business_day_bounds_utc,
+    business_today,
     combine_business_datetime,
+    ensure_utc,
     to_business_local,
 )
+from ..write_coordinator import get_write_coordinator
 
 router = APIRouter(prefix="/api", tags=["reservations"])
 
@@ -41,27 +57,182 @@ def to_reservation_public(reservation: Reservation) -> ReservationPublic:
         date=start_local.date(),
         startTime=start_local.time().replace(second=0, microsecond=0, tzinfo=None),
         endTime=end_local.time().replace(second=0, microsecond=0, tzinfo=None),
-        status=reservation.derived_status,
+        status=reservation.status,
         contactEmail=reservation.contact_email,
     )
 
 
-@router.get("/sessions", response_model=list[SessionReservations], summary="충전 세션 목록")
-def list_sessions(db: Session = Depends(get_db)) -> list[SessionReservations]:
+def schedule_etag(target_date: date, version: int) -> str:
+    return f'"{target_date.isoformat()}-{version}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _require_charging_session(db: Session, session_id: int) -> None:
+    if db.get(ChargingSession, session_id) is None:
+        raise HTTPException(status_code=404, detail='해당 세션을 찾을 수 없습니다.')
+
+
+def sessions_response_headers(etag: str, change_seq: int) -> dict[str, str]:
+    # X-Change-Seq is the cursor for /api/reservations/changes; callers read it
+    # before the body so no delta is missed.
+    return {"ETag": etag, "Cache-Control": "no-cache", "X-Change-Seq": str(change_seq)}
+
+
+def not_modified(if_none_match: str | None, headers: dict[str, str]) -> Response | None:
+    if _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def render_sessions_response(
+    sessions: list[ChargingSession],
+    grouped: dict[int, list[Reservation]],
+    headers: dict[str, str],
+) -> Response:
+    if fast_json_enabled():
+        response = fast_json.sessions_response(sessions, grouped)
+        response.headers.update(headers)
+        return response
+    payload = SessionsResponse(
+        sessions=[
+            SessionReservations(
+                sessionId=session_obj.id,
+                name=session_obj.name,
+                reservations=[
+                    to_reservation_public(res) for res in grouped.get(session_obj.id, [])
+                ],
+            )
+            for session_obj in sessions
+        ]
+    )
+    return JSONResponse(jsonable_encoder(payload, by_alias=True), headers=headers)
+
+
+def build_sessions_response(
+    db: Session,
+    target_date: date,
+    *,
+    status_filter: ReservationStatus | None = None,
+    if_none_match: str | None = None,
+) -> Response:
+    """
+    Day schedule for every session. The ETag is the day's schedule version, read
+    before the reservations so it can never be newer than the body; a matching
+    ``If-None-Match`` is answered with 304 without querying reservations.
+    ``X-Change-Seq`` is the change log position to pass as ``since`` for deltas.
+    """
+    headers = sessions_response_headers(
+        schedule_etag(target_date, crud.schedule_version(db, date_value=target_date)),
+        change_log.latest_change_seq(db),
+    )
+    cached = not_modified(if_none_match, headers)
+    if cached is not None:
+        return cached
     sessions = crud.list_sessions(db)
+    grouped = crud.reservations_by_date_grouped(db, date_value=target_date, status=status_filter)
+    return render_sessions_response(sessions, grouped, headers)
+
+
+@router.get("/sessions", response_model=list[SessionReservations], summary="충전 세션 목록")
+def list_sessions(
+    from_date: date | None = Query(None, alias="from", description="조회 시작 날짜 (기본: 오늘)"),
+    days: int = Query(7, ge=1, le=31, description="조회 일수"),
+    limit: int | None = Query(None, ge=1, le=100, description="세션 페이지 크기"),
+    offset: int = Query(0, ge=0, description="세션 페이지 시작 위치"),
+    status_filter: ReservationStatus | None = Query(None, alias="status", description="예약 상태 필터"),
+    db: Session = Depends(get_db),
+) -> list[SessionReservations]:
+    first_day = from_date or business_today()
+    window_start, _ = business_day_bounds_utc(first_day)
+    _, window_end = business_day_bounds_utc(first_day + timedelta(days=days - 1))
+
+    sessions = crud.list_sessions(db, limit=limit, offset=offset)
+    grouped = crud.reservations_grouped_by_session(
+        db,
+        start=window_start,
+        end=window_end,
+        session_ids=[session_obj.id for session_obj in sessions],
+        status=status_filter,
+    )
     return [
         SessionReservations(
-            sessionId=session.id,
-            name=session.name,
+            sessionId=session_obj.id,
+            name=session_obj.name,
             reservations=[
                 to_reservation_public(reservation)
-                for reservation in sorted(session.reservations, key=lambda r: r.start_time)
+                for reservation in grouped.get(session_obj.id, [])
             ],
         )
-        for session in sessions
+        for session_obj in sessions
     ]
 
 
+@router.get(
+    "/sessions/availability",
+    response_model=AvailabilityResponse,
+    summary="날짜별 세션 빈 시간대",
+)
+def sessions_availability(
+    target_date: date = Query(..., alias="date", description="조회할 날짜 (YYYY-MM-DD)"),
+    from_time: str | None = Query(None, alias="from", description="시작 시각 (HH:MM)"),
+    to_time: str | None = Query(None, alias="to", description="종료 시각 (HH:MM, 24:00 허용)"),
+    db: Session = Depends(get_db),
+) -> AvailabilityResponse:
+    day_start, _ = business_day_bounds_utc(target_date)
+    day_slots = slots_in_day(target_date)
+
+    def _slot_position(value: str | None, default: int) -> int:
+        if value is None or not value.strip():
+            return default
+        text = value.strip()
+        if text == "24:00":
+            return day_slots
+        try:
+            parsed = datetime.strptime(text, "%H:%M").time()
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="Invalid time format.") from exc
+        if parsed.minute not in (0, 30):
+            raise HTTPException(status_code=400, detail="조회는 30분 단위로만 가능합니다.")
+        moment = combine_business_datetime(target_date, parsed).astimezone(UTC)
+        return int((moment - day_start) / SLOT_INTERVAL)
+
+    def _label(position: int) -> str:
+        if position >= day_slots:
+            return "24:00"
+        return to_business_local(day_start + position * SLOT_INTERVAL).strftime("%H:%M")
+
+    first = _slot_position(from_time, 0)
+    last = _slot_position(to_time, day_slots)
+    if last <= first:
+        raise HTTPException(status_code=400, detail="종료 시간이 시작 시간보다 빠릅니다.")
+
+    sessions = crud.list_sessions(db)
+    bitmaps = crud.slot_bitmaps_by_date(
+        db, session_ids=[session_obj.id for session_obj in sessions], date_value=target_date
+    )
+    return AvailabilityResponse(
+        date=target_date,
+        slotMinutes=SLOT_MINUTES,
+        sessions=[
+            SessionAvailability(
+                sessionId=session_obj.id,
+                name=session_obj.name,
+                free=[
+                    AvailabilityRange(startTime=_label(start), endTime=_label(stop))
+                    for start, stop in free_ranges(bitmaps[session_obj.id], first=first, last=last)
+                ],
+            )
+            for session_obj in sessions
+        ],
+    )
+
+
 @router.get(
     "/reservations/by-session",
     response_model=SessionsResponse,
@@ -69,22 +240,83 @@ def list_sessions(db: Session = Depends(get_db)) -> list[SessionReservations]:
 )
 def list_reservations_by_session(
     target_date: date = Query(..., alias="date", description="조회할 날짜 (YYYY-MM-DD)"),
+    status_filter: ReservationStatus | None = Query(None, alias="status", description="예약 상태 필터"),
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
     db: Session = Depends(get_db),
-) -> SessionsResponse:
-    sessions = crud.list_sessions(db)
-    payload: list[SessionReservations] = []
-    for session_obj in sessions:
-        reservations = crud.reservations_by_session_and_date(
-            db, session_id=session_obj.id, date_value=target_date
+) -> SessionsResponse | Response:
+    return build_sessions_response(
+        db, target_date, status_filter=status_filter, if_none_match=if_none_match
+    )
+
+
+@router.get("/reservations/stream", summary="예약 변경 실시간 스트림 (SSE)")
+async def stream_reservations(
+    request: Request,
+    target_date: date | None = Query(None, alias="date", description="구독할 날짜 (기본: 전체)"),
+) -> StreamingResponse:
+    """
+    Server-Sent Events for committed changes: ``created`` / ``deleted`` carry the
+    reservation, ``status`` carries ``{id, sessionId, date, status}``. Comment
+    heartbeats keep idle connections open; a ``dropped`` event means the client fell
+    behind and should reconnect and refetch.
+    """
+    subscriber = live_events.broadcaster.subscribe(target_date)
+    return StreamingResponse(
+        live_events.event_stream(
+            subscriber,
+            heartbeat_seconds=get_settings().sse_heartbeat_seconds,
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/reservations/changes",
+    response_model=ReservationChangesResponse,
+    summary="예약 변경 이력 (증분 동기화)",
+)
+def list_reservation_changes(
+    since: int = Query(0, ge=0, description="마지막으로 받은 변경 번호 (X-Change-Seq / lastSeq)"),
+    target_date: date | None = Query(None, alias="date", description="날짜 필터 (YYYY-MM-DD)"),
+    limit: int = Query(500, ge=1, le=5000, description="최대 항목 수"),
+    db: Session = Depends(get_db),
+) -> ReservationChangesResponse:
+    # Writers are serialized on SQLite, so sequence numbers become visible in order
+    # and everything up to ``latest`` is final.
+    latest = change_log.latest_change_seq(db)
+    oldest = change_log.oldest_change_seq(db)
+    if since > latest or (oldest is not None and since < oldest - 1):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="변경 이력이 정리되었습니다. 전체 예약 현황을 다시 조회하세요.",
         )
-        payload.append(
-            SessionReservations(
-                sessionId=session_obj.id,
-                name=session_obj.name,
-                reservations=[to_reservation_public(res) for res in reservations],
-            )
+    changes = [
+        change
+        for change in change_log.changes_since(
+            db, since=since, limit=limit, business_date=target_date
         )
-    return SessionsResponse(sessions=payload)
+        if change.seq <= latest
+    ]
+    has_more = len(changes) == limit
+    return ReservationChangesResponse(
+        changes=[
+            ReservationChangeEntry(
+                seq=change.seq,
+                kind=change.kind,
+                reservationId=change.reservation_id,
+                sessionId=change.session_id,
+                date=change.business_date,
+                status=change.status,
+                reservation=change.payload,
+                changedAt=ensure_utc(change.changed_at),
+            )
+            for change in changes
+        ],
+        lastSeq=changes[-1].seq if has_more else latest,
+        hasMore=has_more,
+    )
 
 
 @router.post(
@@ -93,14 +325,10 @@ def list_reservations_by_session(
     status_code=status.HTTP_201_CREATED,
     summary="예약 생성",
 )
-def create_reservation(
-    payload: ReservationCreate,
-    db: Session = Depends(get_db),
-) -> ReservationPublic:
-    session_obj: ChargingSession | None = db.get(ChargingSession, payload.session_id)
-    if session_obj is None:
-        raise HTTPException(status_code=404, detail='해당 세션을 찾을 수 없습니다.')
-
+def create_reservation(payload: ReservationCreate) -> ReservationPublic:
+    # No request-scoped DB session here: a connection held while waiting in the write
+    # queue would starve the group leader of the pool. The session lookup runs on
+    # the coordinator's session instead.
     start_local = combine_business_datetime(payload.date, payload.start_time)
     end_local = combine_business_datetime(payload.date, payload.end_time)
     if end_local <= start_local and payload.end_time == time(0, 0):
@@ -122,20 +350,23 @@ def create_reservation(
     start_dt = start_local.astimezone(UTC)
     end_dt = end_local.astimezone(UTC)
 
-    try:
+    def _create(write_session: Session) -> ReservationPublic:
+        _require_charging_session(write_session, payload.session_id)
         reservation = crud.create_reservation(
-            db,
-            session_id=session_obj.id,
+            write_session,
+            session_id=payload.session_id,
             plate=payload.plate,
             start_time=start_dt,
             end_time=end_dt,
             contact_email=payload.contact_email,
         )
+        return to_reservation_public(reservation)
+
+    try:
+        return get_write_coordinator().submit(payload.session_id, _create)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    return to_reservation_public(reservation)
-
 
 @router.post(
     "/reservations/batch",
@@ -143,52 +374,43 @@ def create_reservation(
     status_code=status.HTTP_201_CREATED,
     summary="다수 1시간 예약 생성",
 )
-def create_reservations_batch(
-    payload: ReservationBatchCreate,
-    db: Session = Depends(get_db),
-) -> list[ReservationPublic]:
-    session_obj: ChargingSession | None = db.get(ChargingSession, payload.session_id)
-    if session_obj is None:
-        raise HTTPException(status_code=404, detail="?? ??? ?? ? ????.")
+def create_reservations_batch(payload: ReservationBatchCreate) -> list[ReservationPublic]:
+    # Same as create_reservation: the session lookup runs on the coordinator's session.
     if not payload.start_times:
-        raise HTTPException(status_code=400, detail="startTimes? ?? ????.")
+        raise HTTPException(status_code=400, detail="startTimes가 비어 있습니다.")
 
     duration_minutes = 60
 
     def _is_valid_slot(dt: datetime) -> bool:
         return dt.minute in (0, 30) and dt.second == 0 and dt.microsecond == 0
 
-    created: list[Reservation] = []
+    windows: list[tuple[datetime, datetime]] = []
+    for start_time_value in sorted(payload.start_times):
+        start_local = combine_business_datetime(payload.date, start_time_value)
+        end_local = start_local + timedelta(minutes=duration_minutes)
+
+        if end_local <= start_local:
+            raise HTTPException(status_code=400, detail='종료 시간이 시작 시간보다 빠릅니다.')
+        if not _is_valid_slot(start_local) or not _is_valid_slot(end_local):
+            raise HTTPException(status_code=400, detail='예약은 30분 단위로만 가능합니다.')
+
+        windows.append((start_local.astimezone(UTC), end_local.astimezone(UTC)))
+
+    def _create(write_session: Session) -> list[ReservationPublic]:
+        _require_charging_session(write_session, payload.session_id)
+        created = crud.create_reservations_bulk(
+            write_session,
+            session_id=payload.session_id,
+            plate=payload.plate,
+            windows=windows,
+            contact_email=payload.contact_email,
+        )
+        return [to_reservation_public(reservation) for reservation in created]
+
     try:
-        for start_time_value in sorted(payload.start_times):
-            start_local = combine_business_datetime(payload.date, start_time_value)
-            end_local = start_local + timedelta(minutes=duration_minutes)
-
-            if end_local <= start_local:
-                raise HTTPException(status_code=400, detail="?? ??? ?? ???? ????.")
-            if not _is_valid_slot(start_local) or not _is_valid_slot(end_local):
-                raise HTTPException(status_code=400, detail="??? 30? ???? ?????.")
-
-            start_dt = start_local.astimezone(UTC)
-            end_dt = end_local.astimezone(UTC)
-
-            reservation = crud.create_reservation(
-                db,
-                session_id=session_obj.id,
-                plate=payload.plate,
-                start_time=start_dt,
-                end_time=end_dt,
-                contact_email=payload.contact_email,
-            )
-            created.append(reservation)
-    except HTTPException:
-        db.rollback()
-        raise
+        return get_write_coordinator().submit(payload.session_id, _create)
     except ValueError as exc:
-        db.rollback()
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-    return [to_reservation_public(reservation) for reservation in created]
 @router.post(
     "/plates/verify",
     response_model=PlateVerificationResponse,
@@ -233,16 +455,58 @@ def match_detected_plate(
     payload: PlateMatchRequest,
     db: Session = Depends(get_db),
 ) -> PlateMatchResponse:
+    if payload.fuzzy:
+        reservation, distance = crud.find_active_reservation_by_plate_fuzzy(
+            db, plate=payload.plate, when=payload.timestamp
+        )
+        return plate_match_response(payload.plate, reservation, distance)
+
     reservation = crud.find_active_reservation_by_plate(
         db, plate=payload.plate, when=payload.timestamp
     )
-    if reservation:
-        return PlateMatchResponse(
-            plate=payload.plate,
-            match=True,
-            reservation=to_reservation_public(reservation),
-        )
-    return PlateMatchResponse(plate=payload.plate, match=False)
+    return plate_match_response(payload.plate, reservation)
+
+
+@router.post(
+    "/plates/match/batch",
+    response_model=PlateMatchBatchResponse,
+    summary="여러 차량 번호 후보를 한 번에 예약과 매칭",
+)
+def match_detected_plates(
+    payload: PlateMatchBatchRequest,
+    db: Session = Depends(get_db),
+) -> PlateMatchBatchResponse:
+    reservations = crud.find_active_reservations_by_plates(
+        db, candidates=[(item.plate, item.timestamp) for item in payload.candidates]
+    )
+    return plate_match_batch_response(payload, reservations)
+
+
+def plate_match_response(
+    plate: str, reservation: Reservation | None, distance: float | None = None
+) -> PlateMatchResponse:
+    if reservation is None:
+        return PlateMatchResponse(plate=plate, match=False)
+    return PlateMatchResponse(
+        plate=plate,
+        match=True,
+        reservation=to_reservation_public(reservation),
+        distance=distance,
+    )
+
+
+def plate_match_batch_response(
+    payload: PlateMatchBatchRequest, reservations: list[Reservation | None]
+) -> PlateMatchBatchResponse:
+    results = [
+        plate_match_response(item.plate, reservation)
+        for item, reservation in zip(payload.candidates, reservations)
+    ]
+    matched_index = next((idx for idx, result in enumerate(results) if result.match), None)
+    return PlateMatchBatchResponse(
+        match=matched_index is not None, matched_index=matched_index, results=results
+    )
+
 
 @router.get(
     "/reservations/my",
@@ -252,14 +516,25 @@ def match_detected_plate(
 def my_reservations(
     email: str | None = Query(None, description="예약 등록 이메일"),
     plate: str | None = Query(None, description="차량 번호"),
+    status_filter: ReservationStatus | None = Query(None, alias="status", description="예약 상태 필터"),
     db: Session = Depends(get_db),
-) -> list[ReservationPublic]:
+) -> list[ReservationPublic] | FastJSONResponse:
     if not email and not plate:
         raise HTTPException(status_code=400, detail="email 또는 plate를 제공해야 합니다.")
     try:
-        reservations = crud.reservations_for_user(db, email=email, plate=plate)
+        reservations = crud.reservations_for_user(
+            db, email=email, plate=plate, status=status_filter
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return reservation_list_response(reservations)
+
+
+def reservation_list_response(
+    reservations: list[Reservation],
+) -> list[ReservationPublic] | FastJSONResponse:
+    if fast_json_enabled():
+        return fast_json.reservations_response(reservations)
     return [to_reservation_public(reservation) for reservation in reservations]
 
 
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import crud_async
+from ..database import get_async_db
+from ..fast_json import FastJSONResponse
+from ..models import ReservationStatus
+from ..schemas import (
+    PlateMatchBatchRequest,
+    PlateMatchBatchResponse,
+    PlateMatchRequest,
+    PlateMatchResponse,
+    ReservationPublic,
+    SessionsResponse,
+)
+from .admin import verify_admin_token
+from .reservations import (
+    not_modified,
+    plate_match_batch_response,
+    plate_match_response,
+    render_sessions_response,
+    reservation_list_response,
+    schedule_etag,
+    sessions_response_headers,
+)
+
+# Async handlers for the hot read endpoints, mounted ahead of the sync routers when
+# DATABASE_ASYNC=1 so they take over the same paths. Responses are built by the
+# same helpers as the sync handlers, so both modes are byte-for-byte identical.
+router = APIRouter(prefix="/api", tags=["reservations"])
+
+
+async def _sessions_response(
+    db: AsyncSession,
+    target_date: date,
+    status_filter: ReservationStatus | None,
+    if_none_match: str | None,
+) -> Response:
+    version = await crud_async.schedule_version(db, date_value=target_date)
+    headers = sessions_response_headers(
+        schedule_etag(target_date, version), await crud_async.latest_change_seq(db)
+    )
+    cached = not_modified(if_none_match, headers)
+    if cached is not None:
+        return cached
+    sessions = await crud_async.list_sessions(db)
+    grouped = await crud_async.reservations_by_date_grouped(
+        db, date_value=target_date, status=status_filter
+    )
+    return render_sessions_response(sessions, grouped, headers)
+
+
+@router.get(
+    "/reservations/by-session",
+    response_model=SessionsResponse,
+    summary="날짜별 세션 예약 현황",
+)
+async def list_reservations_by_session(
+    target_date: date = Query(..., alias="date", description="조회할 날짜 (YYYY-MM-DD)"),
+    status_filter: ReservationStatus | None = Query(None, alias="status", description="예약 상태 필터"),
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
+    db: AsyncSession = Depends(get_async_db),
+) -> SessionsResponse | Response:
+    return await _sessions_response(db, target_date, status_filter, if_none_match)
+
+
+@router.get(
+    "/admin/reservations/by-session",
+    response_model=SessionsResponse,
+    summary="관리자용 세션 예약 조회",
+    tags=["admin"],
+)
+async def admin_reservations_by_session(
+    target_date: date = Query(..., alias="date", description="조회 날짜 (YYYY-MM-DD)"),
+    status_filter: ReservationStatus | None = Query(None, alias="status", description="예약 상태 필터"),
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
+    _: str = Depends(verify_admin_token),
+    db: AsyncSession = Depends(get_async_db),
+) -> SessionsResponse | Response:
+    return await _sessions_response(db, target_date, status_filter, if_none_match)
+
+
+@router.post(
+    "/plates/match",
+    response_model=PlateMatchResponse,
+    summary="탐지된 차량 번호와 예약 매칭",
+)
+async def match_detected_plate(
+    payload: PlateMatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> PlateMatchResponse:
+    if payload.fuzzy:
+        reservation, distance = await crud_async.find_active_reservation_by_plate_fuzzy(
+            db, plate=payload.plate, when=payload.timestamp
+        )
+        return plate_match_response(payload.plate, reservation, distance)
+
+    reservation = await crud_async.find_active_reservation_by_plate(
+        db, plate=payload.plate, when=payload.timestamp
+    )
+    return plate_match_response(payload.plate, reservation)
+
+
+@router.post(
+    "/plates/match/batch",
+    response_model=PlateMatchBatchResponse,
+    summary="여러 차량 번호 후보를 한 번에 예약과 매칭",
+)
+async def match_detected_plates(
+    payload: PlateMatchBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> PlateMatchBatchResponse:
+    reservations = await crud_async.find_active_reservations_by_plates(
+        db, candidates=[(item.plate, item.timestamp) for item in payload.candidates]
+    )
+    return plate_match_batch_response(payload, reservations)
+
+
+@router.get(
+    "/reservations/my",
+    response_model=list[ReservationPublic],
+    summary="사용자 예약 목록 조회",
+)
+async def my_reservations(
+    email: str | None = Query(None, description="예약 등록 이메일"),
+    plate: str | None = Query(None, description="차량 번호"),
+    status_filter: ReservationStatus | None = Query(None, alias="status", description="예약 상태 필터"),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[ReservationPublic] | FastJSONResponse:
+    if not email and not plate:
+        raise HTTPException(status_code=400, detail="email 또는 plate를 제공해야 합니다.")
+    try:
+        reservations = await crud_async.reservations_for_user(
+            db, email=email, plate=plate, status=status_filter
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return reservation_list_response(reservations)
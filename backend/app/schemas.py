@@ -155,6 +155,50 @@ class SessionsResponse(BaseModel):
     sessions: list[SessionReservations]
 
 
+class ReservationChangeEntry(BaseModel):
+    seq: int
+    kind: str
+    reservation_id: str = Field(..., alias="reservationId")
+    session_id: int = Field(..., alias="sessionId")
+    date: date
+    status: ReservationStatus
+    reservation: Optional[ReservationPublic] = None
+    changed_at: datetime = Field(..., alias="changedAt")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class ReservationChangesResponse(BaseModel):
+    changes: list[ReservationChangeEntry]
+    last_seq: int = Field(..., alias="lastSeq")
+    has_more: bool = Field(..., alias="hasMore")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class AvailabilityRange(BaseModel):
+    start_time: str = Field(..., alias="startTime")
+    end_time: str = Field(..., alias="endTime")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class SessionAvailability(BaseModel):
+    session_id: int = Field(..., alias="sessionId")
+    name: str
+    free: list[AvailabilityRange]
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class AvailabilityResponse(BaseModel):
+    date: date
+    slot_minutes: int = Field(..., alias="slotMinutes")
+    sessions: list[SessionAvailability]
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class ReservationDeleteResponse(BaseModel):
     ok: bool = True
 
@@ -207,7 +251,7 @@ class PlateVerificationResponse(BaseModel):
     conflictingReservation: Optional[ReservationPublic] = None
 
 
-class PlateMatchRequest(BaseModel):
+class PlateMatchCandidate(BaseModel):
     plate: str
     timestamp: datetime
 
@@ -234,10 +278,37 @@ class PlateMatchRequest(BaseModel):
         raise ValueError("timestamp 형식을 해석할 수 없습니다.")
 
 
+class PlateMatchRequest(PlateMatchCandidate):
+    fuzzy: bool = False
+
+
+class PlateMatchBatchRequest(BaseModel):
+    # In priority order; the first candidate that matches wins.
+    candidates: list[PlateMatchCandidate] = Field(min_length=1, max_length=16)
+
+
 class PlateMatchResponse(BaseModel):
     plate: str
     match: bool
     reservation: Optional[ReservationPublic] = None
+    distance: Optional[float] = None
+
+
+class PlateMatchBatchResponse(BaseModel):
+    match: bool
+    matched_index: Optional[int] = Field(default=None, alias="matchedIndex")
+    results: list[PlateMatchResponse]
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class PlateRecognizeMatchResponse(BaseModel):
+    recognition: Any = None
+    plate: Optional[str] = None
+    match: Optional[PlateMatchResponse] = None
+    timings_ms: dict[str, float] = Field(default_factory=dict, alias="timingsMs")
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class AdminLoginRequest(BaseModel):
@@ -252,6 +323,62 @@ class AdminLoginResponse(BaseModel):
     admin: dict[str, str]
 
 
+class WriteQueueStatsResponse(BaseModel):
+    depth: dict[int, int]
+    submitted: int
+    groups: int
+    retries: int
+    avg_wait_ms: float = Field(..., alias="avgWaitMs")
+    max_wait_ms: float = Field(..., alias="maxWaitMs")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class RecognitionCacheStatsResponse(BaseModel):
+    size: int
+    max_entries: int = Field(..., alias="maxEntries")
+    hits_exact: int = Field(..., alias="hitsExact")
+    hits_similar: int = Field(..., alias="hitsSimilar")
+    misses: int
+    hit_ratio: float = Field(..., alias="hitRatio")
+    evictions: int
+    expirations: int
+    perceptual_hash: bool = Field(..., alias="perceptualHash")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class RecognitionLoadStatsResponse(BaseModel):
+    max_concurrent: int = Field(..., alias="maxConcurrent")
+    max_waiting: int = Field(..., alias="maxWaiting")
+    wait_budget_ms: float = Field(..., alias="waitBudgetMs")
+    threads: int
+    active: int
+    waiting: int
+    jobs_waiting: int = Field(..., alias="jobsWaiting")
+    oldest_wait_ms: float = Field(..., alias="oldestWaitMs")
+    admitted: int
+    rejected: int
+    avg_wait_ms: float = Field(..., alias="avgWaitMs")
+    p95_wait_ms: float = Field(..., alias="p95WaitMs")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class RecognitionJobResponse(BaseModel):
+    id: str
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    status_code: Optional[int] = Field(None, alias="statusCode")
+    server_timing: Optional[str] = Field(None, alias="serverTiming")
+    created_at: datetime = Field(..., alias="createdAt")
+    started_at: Optional[datetime] = Field(None, alias="startedAt")
+    finished_at: Optional[datetime] = Field(None, alias="finishedAt")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class UserLoginRequest(BaseModel):
     email: str
     password: str
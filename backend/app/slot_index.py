@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy import and_, event, select
+from sqlalchemy.orm import Session
+
+from .config import get_settings
+from .models import ReservationSlot
+from .time_utils import business_day_bounds_utc, ensure_utc, to_business_local
+
+SLOT_INTERVAL = timedelta(minutes=30)
+_PENDING_KEY = "slot_index_pending"
+
+SlotKey = tuple[int, date]
+
+
+def slot_index_enabled() -> bool:
+    return get_settings().slot_index_enabled
+
+
+def _slot_position(slot_start: datetime) -> tuple[date, int]:
+    """Return the business day a slot belongs to and its bit position within that day."""
+    slot_utc = ensure_utc(slot_start)
+    business_date = to_business_local(slot_utc).date()
+    day_start, _ = business_day_bounds_utc(business_date)
+    return business_date, int((slot_utc - day_start) / SLOT_INTERVAL)
+
+
+def masks_for_slots(session_id: int, slot_starts: Iterable[datetime]) -> dict[SlotKey, int]:
+    """Group slot start datetimes into per-(session, business day) bitmasks."""
+    masks: dict[SlotKey, int] = defaultdict(int)
+    for slot_start in slot_starts:
+        business_date, position = _slot_position(slot_start)
+        masks[(session_id, business_date)] |= 1 << position
+    return dict(masks)
+
+
+class SlotIndex:
+    """
+    Process-local bitmap of occupied 30-minute slots per (session_id, business day).
+
+    Bitmaps are loaded lazily from ``reservation_slots`` and only reflect committed
+    data: writes are staged on the SQLAlchemy session and applied after commit.
+    The ``uq_session_slot`` constraint stays authoritative, so a stale bitmap can
+    only let a conflicting insert reach the database, where it is rejected.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._bitmaps: dict[SlotKey, int] = {}
+        self._epoch = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bitmaps.clear()
+            self._epoch += 1
+
+    def invalidate(self, keys: Iterable[SlotKey]) -> None:
+        with self._lock:
+            for key in keys:
+                self._bitmaps.pop(key, None)
+            self._epoch += 1
+
+    def occupied(self, session: Session, key: SlotKey) -> int:
+        """Return the occupied bitmap for ``key`` as seen by ``session``."""
+        session_id, business_date = key
+        return self.occupied_for_day(session, session_ids=[session_id], business_date=business_date)[
+            session_id
+        ]
+
+    def occupied_for_day(
+        self, session: Session, *, session_ids: Iterable[int], business_date: date
+    ) -> dict[int, int]:
+        """Return occupied bitmaps for several sessions, loading missing ones in one query."""
+        session_ids = list(session_ids)
+        with self._lock:
+            cached = {
+                session_id: self._bitmaps[(session_id, business_date)]
+                for session_id in session_ids
+                if (session_id, business_date) in self._bitmaps
+            }
+            epoch = self._epoch
+        pending = _pending(session)
+        missing = [session_id for session_id in session_ids if session_id not in cached]
+        if missing:
+            loaded = load_bitmaps(session, session_ids=missing, business_date=business_date)
+            with self._lock:
+                # Only cache when nothing was applied meanwhile and the load could not
+                # have observed this session's own uncommitted rows.
+                if self._epoch == epoch:
+                    for session_id, bitmap in loaded.items():
+                        key = (session_id, business_date)
+                        if key not in pending["add"] and key not in pending["remove"]:
+                            self._bitmaps[key] = bitmap
+            cached.update(loaded)
+        return {
+            session_id: (bitmap & ~pending["remove"].get((session_id, business_date), 0))
+            | pending["add"].get((session_id, business_date), 0)
+            for session_id, bitmap in cached.items()
+        }
+
+    def has_conflict(self, session: Session, *, session_id: int, slot_starts: Iterable[datetime]) -> bool:
+        for key, mask in masks_for_slots(session_id, slot_starts).items():
+            if self.occupied(session, key) & mask:
+                return True
+        return False
+
+    def apply(self, *, add: dict[SlotKey, int], remove: dict[SlotKey, int]) -> None:
+        with self._lock:
+            for key, mask in remove.items():
+                if key in self._bitmaps:
+                    self._bitmaps[key] &= ~mask
+            for key, mask in add.items():
+                if key in self._bitmaps:
+                    self._bitmaps[key] |= mask
+            self._epoch += 1
+
+
+slot_index = SlotIndex()
+
+
+def load_bitmaps(session: Session, *, session_ids: Iterable[int], business_date: date) -> dict[int, int]:
+    """Build occupied bitmaps for the given sessions straight from ``reservation_slots``."""
+    bitmaps = {session_id: 0 for session_id in session_ids}
+    if not bitmaps:
+        return bitmaps
+    start, end = business_day_bounds_utc(business_date)
+    stmt = select(ReservationSlot.session_id, ReservationSlot.slot_start).where(
+        and_(
+            ReservationSlot.session_id.in_(list(bitmaps)),
+            ReservationSlot.slot_start >= start,
+            ReservationSlot.slot_start < end,
+        )
+    )
+    for session_id, slot_start in session.execute(stmt):
+        bitmaps[session_id] |= 1 << _slot_position(slot_start)[1]
+    return bitmaps
+
+
+def slots_in_day(business_date: date) -> int:
+    start, end = business_day_bounds_utc(business_date)
+    return int((end - start) / SLOT_INTERVAL)
+
+
+def free_ranges(bitmap: int, *, first: int, last: int) -> list[tuple[int, int]]:
+    """Return ``[start, stop)`` slot position ranges in ``[first, last)`` whose bits are clear."""
+    ranges: list[tuple[int, int]] = []
+    run_start: int | None = None
+    for position in range(first, last):
+        if bitmap >> position & 1:
+            if run_start is not None:
+                ranges.append((run_start, position))
+                run_start = None
+        elif run_start is None:
+            run_start = position
+    if run_start is not None:
+        ranges.append((run_start, last))
+    return ranges
+
+
+def _pending(session: Session) -> dict[str, dict[SlotKey, int]]:
+    return session.info.get(_PENDING_KEY) or {"add": {}, "remove": {}}
+
+
+def _stage(session: Session, kind: str, session_id: int, slot_starts: Iterable[datetime]) -> None:
+    pending = session.info.setdefault(_PENDING_KEY, {"add": {}, "remove": {}})
+    bucket = pending[kind]
+    for key, mask in masks_for_slots(session_id, slot_starts).items():
+        bucket[key] = bucket.get(key, 0) | mask
+        if kind == "remove" and key in pending["add"]:
+            # Inserted and deleted in the same transaction: the slot ends up free.
+            pending["add"][key] &= ~mask
+
+
+def record_add(session: Session, *, session_id: int, slot_starts: Iterable[datetime]) -> None:
+    """Stage newly inserted slots; they become visible in the index after commit."""
+    if slot_index_enabled():
+        _stage(session, "add", session_id, slot_starts)
+
+
+def record_remove(session: Session, *, session_id: int, slot_starts: Iterable[datetime]) -> None:
+    """Stage deleted slots; they are cleared from the index after commit."""
+    if slot_index_enabled():
+        _stage(session, "remove", session_id, slot_starts)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        slot_index.apply(add=pending["add"], remove=pending["remove"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
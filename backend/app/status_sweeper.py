@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from . import change_log, crud
+from .config import get_settings
+from .plate_cache import plate_match_cache
+from .time_utils import UTC, to_business_local
+
+logger = logging.getLogger(__name__)
+
+SLOT_INTERVAL = timedelta(minutes=crud.SLOT_INTERVAL_MINUTES)
+# Run just after each boundary so ``end_time <= now`` already holds for slots ending on it.
+BOUNDARY_SLACK_SECONDS = 0.5
+
+
+def next_slot_boundary(now: datetime) -> datetime:
+    """Return the first 30-minute slot boundary (business time) strictly after ``now``."""
+    local = to_business_local(now)
+    floored = local.replace(
+        minute=local.minute - local.minute % crud.SLOT_INTERVAL_MINUTES, second=0, microsecond=0
+    )
+    return (floored + SLOT_INTERVAL).astimezone(UTC)
+
+
+class ReservationStatusSweeper:
+    """
+    Keep ``reservations.status`` in step with the clock.
+
+    Reservations start and end on slot boundaries, so a sweep right after each
+    boundary is enough for the stored status to stay exact. ``sweep`` runs once
+    synchronously at startup (catching up on downtime), then a daemon thread sleeps
+    until the next boundary and sweeps again until ``stop`` is called. Each sweep
+    also compacts the change log past its retention horizon.
+    """
+
+    def __init__(self, session_factory: sessionmaker) -> None:
+        self._session_factory = session_factory
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def sweep(self, now: datetime | None = None) -> int:
+        now = now or datetime.now(UTC)
+        retention = timedelta(days=get_settings().change_log_retention_days)
+        with self._session_factory() as session:
+            changed = crud.sweep_reservation_statuses(session, now=now)
+            compacted = change_log.compact_changes(session, before=now - retention)
+            session.commit()
+        if compacted:
+            logger.info("Compacted %d reservation change(s).", compacted)
+        if changed:
+            # Cached match results carry a status snapshot; reload them lazily.
+            plate_match_cache.clear()
+            logger.info("Advanced %d reservation status(es).", changed)
+        return changed
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="reservation-status-sweeper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            now = datetime.now(UTC)
+            delay = (next_slot_boundary(now) - now).total_seconds() + BOUNDARY_SLACK_SECONDS
+            if self._stop.wait(delay):
+                return
+            try:
+                self.sweep()
+            except Exception:  # noqa: BLE001 - try again at the next boundary
+                logger.exception("Reservation status sweep failed.")
@@ -17,6 +17,11 @@ def business_timezone() -> ZoneInfo:
     return ZoneInfo(settings.business_timezone)
 
 
+def business_today() -> date:
+    """Return the current date in the business timezone."""
+    return datetime.now(UTC).astimezone(business_timezone()).date()
+
+
 def combine_business_datetime(date_value: date, time_value: time) -> datetime:
     """Combine date and time as a timezone-aware datetime in the business timezone."""
     naive_dt = datetime.combine(date_value, time_value.replace(tzinfo=None))
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import httpx
+from fastapi import Request
+
+from .config import Settings
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+try:  # HTTP/2 needs the optional h2 package (``httpx[http2]``).
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+class UpstreamClients:
+    """
+    Pooled clients for the plate recognition upstreams, shared for the app's lifetime.
+
+    One ``httpx.AsyncClient`` carries both the LP service proxy (``http`` mode) and
+    the OpenAI SDK (``gptapi`` mode), so TLS sessions and keep-alive connections are
+    reused across uploads instead of being set up per request. Clients are created
+    on first use; ``start`` optionally begins pinging the active upstream so an idle
+    connection stays open, and ``aclose`` releases the pool on shutdown.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self._settings = settings
+        self._http: httpx.AsyncClient | None = None
+        self._openai: AsyncOpenAI | None = None
+        self._warm_task: asyncio.Task | None = None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._http is None:
+            settings = self._settings
+            http2 = settings.upstream_http2 and HTTP2_AVAILABLE
+            if settings.upstream_http2 and not HTTP2_AVAILABLE:
+                logger.info("h2 is not installed; upstream clients use HTTP/1.1.")
+            self._http = httpx.AsyncClient(
+                timeout=UPSTREAM_TIMEOUT,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=settings.upstream_max_connections,
+                    max_keepalive_connections=settings.upstream_max_keepalive,
+                    keepalive_expiry=settings.upstream_keepalive_seconds,
+                ),
+            )
+        return self._http
+
+    @property
+    def openai(self) -> AsyncOpenAI:
+        if self._openai is None:
+            from openai import AsyncOpenAI
+
+            self._openai = AsyncOpenAI(
+                api_key=self._settings.openai_api_key, http_client=self.http
+            )
+        return self._openai
+
+    def warm_url(self) -> str:
+        if self._settings.plate_service_mode == "gptapi":
+            return str(self.openai.base_url)
+        return self._settings.plate_service_endpoint
+
+    def start(self) -> None:
+        interval = self._settings.upstream_warm_interval_seconds
+        if interval > 0 and self._warm_task is None:
+            self._warm_task = asyncio.get_running_loop().create_task(self._keep_warm(interval))
+
+    async def aclose(self) -> None:
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+            self._warm_task = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._openai = None
+
+    async def _keep_warm(self, interval: float) -> None:
+        url = self.warm_url()
+        while True:
+            try:
+                # Any response keeps the pooled connection (and its TLS session) open.
+                await self.http.head(url, timeout=10.0)
+            except httpx.HTTPError as exc:
+                logger.debug("Upstream warm-up ping failed: %s", exc)
+            await asyncio.sleep(interval)
+
+
+def get_upstream_clients(request: Request) -> UpstreamClients:
+    return request.app.state.upstream_clients
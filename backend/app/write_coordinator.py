@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from .config import get_settings
+from .database import SessionLocal
+
+WriteFn = Callable[[Session], Any]
+
+RETRY_BASE_SECONDS = 0.02
+RETRY_MAX_SECONDS = 0.5
+
+
+@dataclass
+class _WriteRequest:
+    fn: WriteFn
+    enqueued_at: float = field(default_factory=time.monotonic)
+    future: Future = field(default_factory=Future)
+    # Set when the request is finished or its submitter should lead the next group.
+    turn: threading.Event = field(default_factory=threading.Event)
+
+
+def _is_busy_error(exc: OperationalError) -> bool:
+    message = str(exc.orig).lower()
+    return "locked" in message or "busy" in message
+
+
+class ReservationWriteCoordinator:
+    """
+    Serialize reservation writes per charging session and commit them in groups.
+
+    The first caller to find a session's queue idle becomes its leader: it takes
+    whatever has queued up (up to ``group_max`` requests), applies each request in
+    its own SAVEPOINT inside one transaction and commits once, then hands leadership
+    to the oldest request still queued and returns. A caller therefore waits for at
+    most the group ahead of it plus its own, however long the queue keeps filling.
+    Busy/locked errors roll back the group and retry it with jittered exponential
+    backoff.
+    """
+
+    def __init__(self, session_factory: sessionmaker, *, group_max: int, retry_attempts: int) -> None:
+        self._session_factory = session_factory
+        self._group_max = max(1, group_max)
+        self._retry_attempts = max(1, retry_attempts)
+        self._lock = threading.Lock()
+        self._queues: dict[int, deque[_WriteRequest]] = {}
+        self._active: set[int] = set()
+        self._submitted = 0
+        self._groups = 0
+        self._retries = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def submit(self, session_id: int, fn: WriteFn) -> Any:
+        """Run ``fn(session)`` in the session's write queue and return its result."""
+        request = _WriteRequest(fn=fn)
+        with self._lock:
+            self._queues.setdefault(session_id, deque()).append(request)
+            self._submitted += 1
+            lead = session_id not in self._active
+            if lead:
+                self._active.add(session_id)
+        if not lead:
+            request.turn.wait()
+        if not request.future.done():
+            self._lead_group(session_id)
+        return request.future.result()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            applied = self._submitted - sum(len(queue) for queue in self._queues.values())
+            return {
+                "depth": {
+                    session_id: len(queue) for session_id, queue in self._queues.items() if queue
+                },
+                "submitted": self._submitted,
+                "groups": self._groups,
+                "retries": self._retries,
+                "avgWaitMs": round(self._wait_total / applied * 1000, 3) if applied else 0.0,
+                "maxWaitMs": round(self._wait_max * 1000, 3),
+            }
+
+    def _lead_group(self, session_id: int) -> None:
+        """Apply one group from the head of the queue (which holds the caller's request)."""
+        with self._lock:
+            queue = self._queues[session_id]
+            group = [queue.popleft() for _ in range(min(len(queue), self._group_max))]
+            started = time.monotonic()
+            for request in group:
+                waited = started - request.enqueued_at
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+        try:
+            self._apply_group(group)
+        except Exception as exc:  # noqa: BLE001 - still wake the group and hand off
+            for request in group:
+                if not request.future.done():
+                    request.future.set_exception(exc)
+        finally:
+            for request in group:
+                request.turn.set()
+            with self._lock:
+                if queue:
+                    queue[0].turn.set()
+                else:
+                    # Drop the idle queue so ids that never match a session don't pile up.
+                    self._active.discard(session_id)
+                    del self._queues[session_id]
+
+    def _apply_group(self, group: list[_WriteRequest]) -> None:
+        for attempt in range(self._retry_attempts):
+            outcomes: list[tuple[bool, Any]] = []
+            session = self._session_factory()
+            try:
+                if session.get_bind().dialect.name == "sqlite":
+                    # Take the write lock up front so the group is one transaction and
+                    # contention surfaces here, where it can be retried.
+                    session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+                for request in group:
+                    try:
+                        with session.begin_nested():
+                            outcomes.append((True, request.fn(session)))
+                    except OperationalError:
+                        raise
+                    except Exception as exc:  # noqa: BLE001 - handed back to the caller
+                        outcomes.append((False, exc))
+                session.commit()
+            except OperationalError as exc:
+                session.rollback()
+                if not _is_busy_error(exc) or attempt + 1 >= self._retry_attempts:
+                    for request in group:
+                        request.future.set_exception(exc)
+                    return
+                with self._lock:
+                    self._retries += 1
+                delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2**attempt)
+                time.sleep(random.uniform(0, delay))
+                continue
+            except Exception as exc:  # noqa: BLE001
+                session.rollback()
+                for request in group:
+                    request.future.set_exception(exc)
+                return
+            finally:
+                session.close()
+
+            with self._lock:
+                self._groups += 1
+            for request, (ok, value) in zip(group, outcomes):
+                if ok:
+                    request.future.set_result(value)
+                else:
+                    request.future.set_exception(value)
+            return
+
+
+@lru_cache(1)
+def get_write_coordinator() -> ReservationWriteCoordinator:
+    settings = get_settings()
+    return ReservationWriteCoordinator(
+        SessionLocal,
+        group_max=settings.write_group_max,
+        retry_attempts=settings.write_retry_attempts,
+    )
@@ -158,6 +158,14 @@ def build_parser() -> argparse.ArgumentParser:
         default=os.getenv("PLATE_SERVICE_URL", "http://localhost:8000/api/license-plates"),
         help="License-plate recognition HTTP endpoint (default: PLATE_SERVICE_URL).",
     )
+    parser.add_argument(
+        "--recognize-match-url",
+        default=os.getenv("PLATE_RECOGNIZE_MATCH_URL"),
+        help=(
+            "Optional combined endpoint (e.g. http://localhost:8000/api/plates/recognize-match). "
+            "When set, primary recognition and matching happen in one request."
+        ),
+    )
     parser.add_argument(
         "--secondary-recognition-url",
         default=os.getenv("SECONDARY_RECOGNITION_URL"),
@@ -179,6 +187,15 @@ def build_parser() -> argparse.ArgumentParser:
         default=os.getenv("PLATE_MATCH_URL", "http://localhost:8000/api/plates/match"),
         help="Backend endpoint used to confirm whether the plate matches an active reservation.",
     )
+    parser.add_argument(
+        "--match-batch-url",
+        default=os.getenv("PLATE_MATCH_BATCH_URL"),
+        help=(
+            "Optional batch endpoint (e.g. http://localhost:8000/api/plates/match/batch). "
+            "When set, every plate candidate (secondary, primary, RTDB) is checked in one "
+            "request and the first match wins."
+        ),
+    )
     parser.add_argument(
         "--match-timeout",
         type=float,
@@ -567,6 +584,51 @@ def match_plate_http(
         return False, None, f"Invalid JSON response: {exc}"
 
 
+def match_plates_batch_http(
+    *,
+    url: str,
+    plates: List[str],
+    timestamp: datetime,
+    timeout: float,
+) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+    payload = {
+        "candidates": [{"plate": plate, "timestamp": timestamp.isoformat()} for plate in plates]
+    }
+    try:
+        response = requests.post(url, json=payload, timeout=max(1.0, timeout))
+        response.raise_for_status()
+        return True, response.json(), None
+    except requests.RequestException as exc:
+        return False, None, f"HTTP error: {exc}"
+    except ValueError as exc:
+        return False, None, f"Invalid JSON response: {exc}"
+
+
+def recognize_and_match_http(
+    *,
+    image_path: Path,
+    url: str,
+    timestamp: datetime,
+    timeout: float,
+) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+    files = {
+        "image": (
+            image_path.name,
+            _read_image_bytes(image_path),
+            "image/jpeg",
+        )
+    }
+    data = {"timestamp": timestamp.isoformat()}
+    try:
+        response = requests.post(url, files=files, data=data, timeout=max(1.0, timeout))
+        response.raise_for_status()
+        return True, response.json(), None
+    except requests.RequestException as exc:
+        return False, None, f"HTTP error: {exc}"
+    except ValueError as exc:
+        return False, None, f"Invalid JSON response: {exc}"
+
+
 def write_report(report_dir: Path, payload: Dict[str, Any]) -> Path:
     report_dir.mkdir(parents=True, exist_ok=True)
     stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S-%f")
@@ -696,7 +758,27 @@ def process_cycle(
     rtdb_plate: Optional[str] = None
     rtdb_payload: Any = None
 
-    if args.pipeline_mode in {"gpt", "both"}:
+    # Match result returned alongside the primary recognition by --recognize-match-url.
+    combined_match: Optional[Dict[str, Any]] = None
+
+    if args.pipeline_mode in {"gpt", "both"} and args.recognize_match_url:
+        primary_success, combined_data, primary_error = recognize_and_match_http(
+            image_path=output_path,
+            url=args.recognize_match_url,
+            timestamp=detected_timestamp,
+            timeout=args.recognition_timeout + args.match_timeout,
+        )
+        if primary_success and isinstance(combined_data, dict):
+            recognition = combined_data.get("recognition")
+            primary_data = recognition if isinstance(recognition, dict) else None
+            if isinstance(combined_data.get("match"), dict):
+                combined_match = combined_data["match"]
+        if primary_success:
+            plate = primary_data.get("plate") if isinstance(primary_data, dict) else None
+            print(f"[AI-primary] recognition succeeded: {plate or 'no plate field'}")
+        else:
+            print(f"[AI-primary] recognition failed: {primary_error or 'unknown error'}")
+    elif args.pipeline_mode in {"gpt", "both"}:
         primary_success, primary_data, primary_error = recognize_plate_http(
             image_path=output_path,
             url=args.recognition_url,
@@ -742,12 +824,13 @@ def process_cycle(
     primary_plate = _extract_plate(primary_data)
     rtdb_candidate = rtdb_plate if isinstance(rtdb_plate, str) and rtdb_plate.strip() else None
 
-    if secondary_plate:
-        recognized_plate = secondary_plate
-    elif primary_plate:
-        recognized_plate = primary_plate
-    elif rtdb_candidate:
-        recognized_plate = rtdb_candidate
+    # Candidates in priority order, without repeats.
+    plate_candidates: List[str] = []
+    for candidate in (secondary_plate, primary_plate, rtdb_candidate):
+        if candidate and candidate not in plate_candidates:
+            plate_candidates.append(candidate)
+    if plate_candidates:
+        recognized_plate = plate_candidates[0]
 
     match_success = False
     match_response: Optional[Dict[str, Any]] = None
@@ -757,13 +840,33 @@ def process_cycle(
     serial_trigger_sent: Optional[bool] = None
     serial_trigger_error: Optional[str] = None
 
+    # With several candidates, a "no" from the combined endpoint only covers the primary one.
+    batch_match = bool(args.match_batch_url) and len(plate_candidates) > 1
     if recognized_plate and args.pipeline_mode in {"gpt", "both"}:
-        match_success, match_response, match_error = match_plate_http(
-            url=args.match_url,
-            plate=recognized_plate,
-            timestamp=detected_timestamp,
-            timeout=args.match_timeout,
-        )
+        if (
+            combined_match is not None
+            and recognized_plate == primary_plate
+            and (combined_match.get("match") or not batch_match)
+        ):
+            # Already matched by the combined endpoint; skip the second round trip.
+            match_success, match_response, match_error = True, combined_match, None
+        elif batch_match:
+            match_success, match_response, match_error = match_plates_batch_http(
+                url=args.match_batch_url,
+                plates=plate_candidates,
+                timestamp=detected_timestamp,
+                timeout=args.match_timeout,
+            )
+            matched_index = (match_response or {}).get("matchedIndex")
+            if isinstance(matched_index, int) and 0 <= matched_index < len(plate_candidates):
+                recognized_plate = plate_candidates[matched_index]
+        else:
+            match_success, match_response, match_error = match_plate_http(
+                url=args.match_url,
+                plate=recognized_plate,
+                timestamp=detected_timestamp,
+                timeout=args.match_timeout,
+            )
         if match_success and isinstance(match_response, dict):
             match_result = bool(match_response.get("match"))
             print(f"[Backend] Plate match result: {'ok' if match_result else 'no'}")
@@ -808,6 +911,7 @@ def process_cycle(
         "storage_upload_path": storage_path,
         "storage_upload_url": storage_url,
         "recognition_url": args.recognition_url,
+        "recognize_match_url": args.recognize_match_url,
         "secondary_recognition_url": args.secondary_recognition_url,
         "pipeline_mode": args.pipeline_mode,
         "success": primary_success or secondary_success,
@@ -820,6 +924,7 @@ def process_cycle(
         "error_secondary": secondary_error,
         "detected_timestamp": detected_timestamp.isoformat(),
         "match_url": args.match_url,
+        "match_batch_url": args.match_batch_url,
         "match_success": match_success,
         "match_response": match_response,
         "match_error": match_error,
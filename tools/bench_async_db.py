@@ -0,0 +1,188 @@
+"""Compare the sync and async (DATABASE_ASYNC=1) database paths under concurrent load.
+
+Usage:
+  ./.venv/Scripts/python tools/bench_async_db.py
+  ./.venv/Scripts/python tools/bench_async_db.py --clients 400 --requests 4000
+
+Notes:
+  - Seeds a throwaway SQLite file (the real data/ev_charging.db is never touched) and
+    starts one uvicorn worker per mode against it, so both modes read identical data.
+  - Each mode is driven by --clients concurrent httpx.AsyncClient tasks alternating
+    GET /api/reservations/by-session and POST /api/plates/match.
+  - No If-None-Match is sent and the plate match cache is disabled, so every request hits SQL.
+  - Failed responses (e.g. connection pool timeouts under load) are counted, not timed.
+  - Requires uvicorn, httpx and (for the async mode) aiosqlite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+TMP_DIR = Path(tempfile.mkdtemp(prefix="ev-bench-"))
+DATABASE_URL = f"sqlite:///{(TMP_DIR / 'bench.db').as_posix()}"
+os.environ["DATABASE_URL"] = DATABASE_URL
+
+import httpx  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from backend.app import crud, migrations, models  # type: ignore  # noqa: E402
+from backend.app.database import SessionLocal, engine  # type: ignore  # noqa: E402
+
+SESSION_COUNT = 4
+BASE = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def seed(rows: int) -> list[str]:
+    models.Base.metadata.create_all(bind=engine)
+    migrations.run_migrations(SessionLocal)
+    plates = [f"{idx % 90 + 10}가{idx:04d}" for idx in range(rows)]
+    reservation_rows = []
+    for idx in range(rows):
+        start = BASE + timedelta(hours=idx // SESSION_COUNT)
+        reservation_rows.append(
+            {
+                "id": f"r{idx:08d}",
+                "session_id": idx % SESSION_COUNT + 1,
+                "plate": plates[idx],
+                "plate_normalized": plates[idx],
+                "start_time": start,
+                "end_time": start + timedelta(hours=1),
+                "status": models.ReservationStatus.CONFIRMED,
+            }
+        )
+    with SessionLocal() as session:
+        crud.ensure_base_sessions(session, names=[f"세션 {idx}" for idx in range(1, SESSION_COUNT + 1)])
+        session.execute(insert(models.Reservation), reservation_rows)
+        session.commit()
+    engine.dispose()
+    return plates
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, *, use_async: bool) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": DATABASE_URL,
+        "DATABASE_ASYNC": "1" if use_async else "0",
+        "PLATE_MATCH_CACHE_ENABLED": "0",
+        "AUTO_SEED_SESSIONS": "0",
+    }
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "backend.app:app",
+            "--port", str(port), "--log-level", "warning",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+
+
+async def wait_ready(base_url: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"server at {base_url} did not become ready")
+
+
+async def drive(base_url: str, plates: list[str], *, clients: int, total: int) -> dict[str, float]:
+    latencies: list[float] = []
+    failures = 0
+    counter = iter(range(total))
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal failures
+        for idx in counter:
+            began = time.perf_counter()
+            if idx % 2:
+                day = (BASE + timedelta(days=idx % 30)).date().isoformat()
+                response = await client.get("/api/reservations/by-session", params={"date": day})
+            else:
+                plate = plates[idx % len(plates)]
+                when = BASE + timedelta(hours=(idx % len(plates)) // SESSION_COUNT, minutes=10)
+                response = await client.post(
+                    "/api/plates/match", json={"plate": plate, "timestamp": when.isoformat()}
+                )
+            if response.is_success:
+                latencies.append(time.perf_counter() - began)
+            else:
+                failures += 1
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        began = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(clients)))
+        elapsed = time.perf_counter() - began
+
+    latencies.sort()
+    if not latencies:
+        raise RuntimeError(f"all {failures} request(s) failed")
+    return {
+        "requests": len(latencies),
+        "failures": failures,
+        "seconds": elapsed,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def run_mode(plates: list[str], args: argparse.Namespace, *, use_async: bool) -> dict[str, float]:
+    port = free_port()
+    server = start_server(port, use_async=use_async)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        asyncio.run(wait_ready(base_url))
+        asyncio.run(drive(base_url, plates, clients=args.clients, total=args.warmup))
+        return asyncio.run(drive(base_url, plates, clients=args.clients, total=args.requests))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main(args: argparse.Namespace) -> None:
+    plates = seed(args.rows)
+    for label, use_async in (("sync", False), ("async", True)):
+        stats = run_mode(plates, args, use_async=use_async)
+        print(
+            f"[{label:5}] {stats['requests']} requests in {stats['seconds']:.2f}s "
+            f"({stats['rps']:.0f} req/s), p50 {stats['p50_ms']:.1f} ms, p99 {stats['p99_ms']:.1f} ms, "
+            f"{stats['failures']} failed"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async database access.")
+    parser.add_argument("--rows", type=int, default=5000, help="Reservations to seed.")
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent clients.")
+    parser.add_argument("--requests", type=int, default=2000, help="Measured requests per mode.")
+    parser.add_argument("--warmup", type=int, default=200, help="Unmeasured requests per mode.")
+    return parser
+
+
+if __name__ == "__main__":
+    main(build_parser().parse_args())
@@ -0,0 +1,176 @@
+"""Check that a recognition burst does not slow down /api/plates/match.
+
+Usage:
+  ./.venv/Scripts/python tools/bench_recognition_load.py
+  ./.venv/Scripts/python tools/bench_recognition_load.py --flood 300 --latency-ms 2000 --probes 300
+
+Notes:
+  - Starts the stand-in LP service from bench_upstream_clients.py (answers after
+    --latency-ms) and one uvicorn worker pointed at it in http mode, on a
+    throwaway SQLite file. The recognition cache and preprocessing are off, so
+    every upload goes upstream.
+  - Each run first probes POST /api/plates/match sequentially while idle, then
+    again while --flood clients (in a separate process, honouring Retry-After)
+    keep POSTing /api/license-plates.
+  - "bounded" uses the default RECOGNITION_* admission settings; "unbounded" lifts
+    them so every upload is admitted, for comparison. Recognition outcomes are
+    counted by status code and the final GET /api/admin/recognition-load printed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import httpx  # noqa: E402
+
+from bench_upstream_clients import IMAGE, StandInUpstream, free_port, serve  # noqa: E402
+
+TMP_DIR = Path(tempfile.mkdtemp(prefix="ev-bench-"))
+ADMIN_HEADERS = {"Authorization": f"Bearer {os.getenv('ADMIN_TOKEN', 'admin-demo-token')}"}
+UNBOUNDED = {
+    "RECOGNITION_MAX_CONCURRENT": "1000000",
+    "RECOGNITION_MAX_WAITING": "1000000",
+    "RECOGNITION_WAIT_BUDGET_SECONDS": "1000000",
+}
+
+
+def start_server(port: int, upstream_url: str, *, bounded: bool) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{(TMP_DIR / f'bench-{port}.db').as_posix()}",
+        "PLATE_SERVICE_MODE": "http",
+        "PLATE_SERVICE_URL": upstream_url,
+        "RECOGNITION_CACHE_ENABLED": "0",
+        "PLATE_PREPROCESS_ENABLED": "0",
+        "UPSTREAM_MAX_CONNECTIONS": "1000",
+        "AUTO_SEED_SESSIONS": "1",
+        **({} if bounded else UNBOUNDED),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "backend.app:app",
+            "--port", str(port), "--log-level", "warning",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("server did not become ready")
+
+
+async def probe(client: httpx.AsyncClient, count: int) -> dict[str, float]:
+    latencies: list[float] = []
+    payload = {"plate": "12가3456", "timestamp": "2030-01-01T10:00:00+09:00"}
+    for _ in range(count):
+        began = time.perf_counter()
+        response = await client.post("/api/plates/match", json=payload)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - began)
+        await asyncio.sleep(0.01)
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def flood(base_url: str, clients: int, stop, outcomes) -> None:
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        while not stop.is_set():
+            try:
+                response = await client.post(
+                    "/api/license-plates", files={"image": ("frame.jpg", IMAGE, "image/jpeg")}
+                )
+                outcomes[response.status_code] += 1
+                if response.status_code == 503:
+                    await asyncio.sleep(float(response.headers.get("retry-after", "1")))
+            except httpx.HTTPError as exc:
+                outcomes[type(exc).__name__] += 1
+
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120.0) as client:
+        await asyncio.gather(*(client_loop(client) for _ in range(clients)))
+
+
+def flood_process(base_url: str, clients: int, stop, results) -> None:
+    outcomes: Counter = Counter()
+    asyncio.run(flood(base_url, clients, stop, outcomes))
+    results.put(dict(outcomes))
+
+
+async def run_mode(args: argparse.Namespace, upstream_url: str, *, bounded: bool) -> None:
+    port = free_port()
+    server = start_server(port, upstream_url, bounded=bounded)
+    base_url = f"http://127.0.0.1:{port}"
+    label = "bounded" if bounded else "unbounded"
+    stop, results = multiprocessing.Event(), multiprocessing.Queue()
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=120.0) as client:
+            await wait_ready(client)
+            await probe(client, 20)
+            idle = await probe(client, args.probes)
+
+            flooder = multiprocessing.Process(
+                target=flood_process, args=(base_url, args.flood, stop, results)
+            )
+            flooder.start()
+            await asyncio.sleep(args.latency_ms / 1000 + 1)
+            loaded = await probe(client, args.probes)
+            load = (await client.get("/api/admin/recognition-load", headers=ADMIN_HEADERS)).json()
+            stop.set()
+            outcomes = results.get(timeout=args.latency_ms / 1000 + 130)
+            flooder.join()
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    print(
+        f"[{label:9}] match idle p50 {idle['p50_ms']:.1f} ms / p99 {idle['p99_ms']:.1f} ms, "
+        f"under flood p50 {loaded['p50_ms']:.1f} ms / p99 {loaded['p99_ms']:.1f} ms"
+    )
+    print(f"            recognition outcomes {outcomes}")
+    print(f"            recognition-load {load}")
+
+
+def main(args: argparse.Namespace) -> None:
+    upstream_port = free_port()
+    serve(StandInUpstream(args.latency_ms / 1000), upstream_port)
+    upstream_url = f"http://127.0.0.1:{upstream_port}/v1/recognize"
+    for bounded in (True, False):
+        asyncio.run(run_mode(args, upstream_url, bounded=bounded))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Match latency under a recognition burst.")
+    parser.add_argument("--flood", type=int, default=200, help="Concurrent recognition clients.")
+    parser.add_argument("--latency-ms", type=float, default=1500.0, help="Stand-in upstream latency.")
+    parser.add_argument("--probes", type=int, default=200, help="Match requests per phase.")
+    return parser
+
+
+if __name__ == "__main__":
+    main(build_parser().parse_args())
@@ -0,0 +1,179 @@
+"""Compare the pessimistic and optimistic reservation insert paths.
+
+Usage:
+  ./.venv/Scripts/python tools/bench_reservation_insert.py
+  ./.venv/Scripts/python tools/bench_reservation_insert.py --count 2000 --conflict-ratio 0.1
+  ./.venv/Scripts/python tools/bench_reservation_insert.py --writers 8 --slot-index
+
+Notes:
+  - Runs against a throwaway SQLite file; the real data/ev_charging.db is never touched.
+  - The slot bitmap index is disabled unless --slot-index is given; the optimistic
+    path never uses it, so --slot-index shows the pessimistic default as deployed.
+  - --conflict-ratio re-books that share of already taken slots to exercise conflict decoding.
+  - --writers books from that many threads at once. SQLite serialises writers on one
+    database lock, so this measures lock queueing, not PostgreSQL row-lock contention.
+  - Reads are SELECTs; the optimistic path swaps two of them for SAVEPOINT/RELEASE, so
+    compare statements and latency, not reads alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+TMP_DIR = Path(tempfile.mkdtemp(prefix="ev-bench-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{(TMP_DIR / 'bench.db').as_posix()}"
+os.environ["SLOT_INDEX_ENABLED"] = "0"
+
+from sqlalchemy import delete, event  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from backend.app import crud, models  # type: ignore  # noqa: E402
+from backend.app.config import get_settings  # type: ignore  # noqa: E402
+from backend.app.database import SessionLocal, engine  # type: ignore  # noqa: E402
+
+SESSION_COUNT = 4
+
+
+def reset_tables() -> None:
+    with SessionLocal() as session:
+        session.execute(delete(models.ReservationSlot))
+        session.execute(delete(models.Reservation))
+        session.commit()
+
+
+def build_workload(count: int, conflict_ratio: float, seed: int) -> list[tuple[int, datetime]]:
+    base = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    fresh = [
+        (idx % SESSION_COUNT + 1, base + timedelta(hours=idx // SESSION_COUNT))
+        for idx in range(count)
+    ]
+    rng = random.Random(seed)
+    repeats = [rng.choice(fresh) for _ in range(int(count * conflict_ratio))]
+    workload = fresh + repeats
+    rng.shuffle(workload)
+    return workload
+
+
+def run_mode(
+    workload: list[tuple[int, datetime]], *, optimistic: bool, writers: int
+) -> dict[str, float]:
+    statements = reads = 0
+    created = conflicts = errors = 0
+    lock = threading.Lock()
+
+    def _count(_conn, _cursor, statement, *_args) -> None:
+        nonlocal statements, reads
+        with lock:
+            statements += 1
+            if statement.lstrip().upper().startswith("SELECT"):
+                reads += 1
+
+    def book(item: tuple[int, tuple[int, datetime]]) -> float:
+        nonlocal created, conflicts, errors
+        idx, (session_id, start) = item
+        began = time.perf_counter()
+        with SessionLocal() as session:
+            try:
+                crud.create_reservation(
+                    session,
+                    session_id=session_id,
+                    plate=f"{idx % 90 + 10}가{idx:04d}",
+                    start_time=start,
+                    end_time=start + timedelta(hours=1),
+                    optimistic=optimistic,
+                )
+                session.commit()
+                outcome = "created"
+            except ValueError:
+                session.rollback()
+                outcome = "conflicts"
+            except OperationalError:
+                session.rollback()
+                outcome = "errors"
+        with lock:
+            if outcome == "created":
+                created += 1
+            elif outcome == "conflicts":
+                conflicts += 1
+            else:
+                errors += 1
+        return time.perf_counter() - began
+
+    reset_tables()
+    event.listen(engine, "before_cursor_execute", _count)
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=writers) as pool:
+            latencies = sorted(pool.map(book, enumerate(workload)))
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    elapsed = time.perf_counter() - started
+    return {
+        "created": created,
+        "conflicts": conflicts,
+        "errors": errors,
+        "bookings_per_second": len(workload) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "statements_per_booking": statements / len(workload),
+        "reads_per_booking": reads / len(workload),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    get_settings().slot_index_enabled = args.slot_index
+    models.Base.metadata.create_all(bind=engine)
+    with SessionLocal() as session:
+        crud.ensure_base_sessions(session, names=[f"세션 {idx}" for idx in range(1, SESSION_COUNT + 1)])
+
+    workload = build_workload(args.count, args.conflict_ratio, args.seed)
+    print(
+        f"[bench] {len(workload)} bookings ({args.conflict_ratio:.0%} repeats), "
+        f"{args.writers} writer(s), slot index {'on' if args.slot_index else 'off'}, db={TMP_DIR}"
+    )
+    for label, optimistic in (("pessimistic", False), ("optimistic", True)):
+        result = run_mode(workload, optimistic=optimistic, writers=args.writers)
+        print(
+            f"[{label:>11}] created={result['created']} conflicts={result['conflicts']} "
+            f"errors={result['errors']} {result['bookings_per_second']:.0f} bookings/s, "
+            f"p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, "
+            f"{result['statements_per_booking']:.2f} statements/booking "
+            f"({result['reads_per_booking']:.2f} reads)"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark reservation insert strategies.")
+    parser.add_argument("--count", type=int, default=1000, help="Distinct bookings to create.")
+    parser.add_argument(
+        "--conflict-ratio",
+        type=float,
+        default=0.0,
+        help="Extra bookings (as a share of --count) that repeat a taken slot.",
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the workload.")
+    parser.add_argument("--writers", type=int, default=1, help="Concurrent booking threads.")
+    parser.add_argument(
+        "--slot-index",
+        action="store_true",
+        help="Keep the in-process slot bitmap on (the pessimistic path's default overlap check).",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    main(build_parser().parse_args())
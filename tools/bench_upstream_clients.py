@@ -0,0 +1,139 @@
+"""Measure per-request connection overhead against a stand-in recognition upstream.
+
+Usage:
+  ./.venv/Scripts/python tools/bench_upstream_clients.py
+  ./.venv/Scripts/python tools/bench_upstream_clients.py --requests 500 --concurrency 8 --latency-ms 20
+
+Notes:
+  - Starts a local stand-in LP service (uvicorn, plain HTTP) that answers like
+    PLATE_SERVICE_URL after --latency-ms and counts the TCP connections it accepted.
+  - "fresh" opens an httpx.AsyncClient per upload (the previous proxy behaviour);
+    "pooled" reuses backend.app.upstream.UpstreamClients, as the routers now do.
+  - Plain HTTP on loopback understates the gap: against a real upstream each fresh
+    connection also pays DNS, a TLS handshake and the network round trips.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+from backend.app.config import get_settings  # type: ignore  # noqa: E402
+from backend.app.upstream import UPSTREAM_TIMEOUT, UpstreamClients  # type: ignore  # noqa: E402
+
+IMAGE = b"\xff\xd8\xff\xe0" + bytes(40_000)
+
+
+class StandInUpstream:
+    """Minimal ASGI app answering every POST with a fixed recognition result."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.peers: set[tuple[str, int]] = set()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        self.peers.add(tuple(scope["client"]))
+        while (await receive()).get("more_body"):
+            pass
+        await asyncio.sleep(self.latency)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json; charset=utf-8")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b'{"plate": "12\\uac003456"}'})
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve(app: StandInUpstream, port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(app, port=port, log_level="warning", lifespan="off"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def run_mode(url: str, *, pooled: bool, total: int, concurrency: int) -> list[float]:
+    clients = UpstreamClients(get_settings())
+    latencies: list[float] = []
+    counter = iter(range(total))
+    files = {"image": ("upload.jpg", IMAGE, "image/jpeg")}
+
+    async def worker() -> None:
+        for _ in counter:
+            began = time.perf_counter()
+            if pooled:
+                response = await clients.http.post(url, files=files)
+            else:
+                async with httpx.AsyncClient(timeout=UPSTREAM_TIMEOUT) as client:
+                    response = await client.post(url, files=files)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - began)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        await clients.aclose()
+    return latencies
+
+
+def main(args: argparse.Namespace) -> None:
+    upstream = StandInUpstream(args.latency_ms / 1000)
+    port = free_port()
+    server = serve(upstream, port)
+    url = f"http://127.0.0.1:{port}/v1/recognize"
+    try:
+        for label, pooled in (("fresh", False), ("pooled", True)):
+            upstream.peers.clear()
+            asyncio.run(run_mode(url, pooled=pooled, total=args.warmup, concurrency=args.concurrency))
+            upstream.peers.clear()
+            began = time.perf_counter()
+            latencies = asyncio.run(
+                run_mode(url, pooled=pooled, total=args.requests, concurrency=args.concurrency)
+            )
+            elapsed = time.perf_counter() - began
+            latencies.sort()
+            overhead = statistics.mean(latencies) * 1000 - args.latency_ms
+            print(
+                f"[{label:6}] {len(latencies)} uploads in {elapsed:.2f}s, "
+                f"p50 {statistics.median(latencies) * 1000:.2f} ms, "
+                f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f} ms, "
+                f"overhead {overhead:.2f} ms/upload, {len(upstream.peers)} connection(s)"
+            )
+    finally:
+        server.should_exit = True
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark fresh vs pooled upstream clients.")
+    parser.add_argument("--requests", type=int, default=300, help="Measured uploads per mode.")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured uploads per mode.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent uploads.")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Stand-in processing time.")
+    return parser
+
+
+if __name__ == "__main__":
+    main(build_parser().parse_args())
@@ -0,0 +1,104 @@
+"""Check that a burst of reservation writes does not exhaust the connection pool.
+
+Usage:
+  ./.venv/Scripts/python tools/check_concurrent_reservations.py
+  ./.venv/Scripts/python tools/check_concurrent_reservations.py --creates 40 --batches 12
+
+Notes:
+  - Runs the app in-process on a throwaway SQLite file and fires --creates
+    POST /api/reservations and --batches POST /api/reservations/batch at once, all on
+    charging session 1 and each on its own free slot, so every one should be 201.
+  - The defaults exceed the engine's QueuePool (5 + 10 overflow). A route that holds a
+    connection while it waits in the write queue starves the group leader, and the
+    burst ends in 500s after the pool timeout (30 s).
+  - Exits 1 if any request is not 201.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+TMP_DIR = Path(tempfile.mkdtemp(prefix="ev-check-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{(TMP_DIR / 'check.db').as_posix()}"
+os.environ["AUTO_SEED_SESSIONS"] = "1"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.app.main import create_app  # type: ignore  # noqa: E402
+
+CREATE_DAY = "2030-01-02"
+BATCH_DAY = "2030-01-03"
+
+
+def slot(index: int) -> str:
+    return f"{index // 2:02d}:{30 * (index % 2):02d}"
+
+
+def requests_for(args: argparse.Namespace) -> list[tuple[str, dict]]:
+    if args.creates > 47 or args.batches > 12:
+        raise SystemExit("At most 47 creates and 12 batches fit in one day of session 1.")
+    burst = [
+        (
+            "/api/reservations",
+            {
+                "sessionId": 1,
+                "plate": f"{10 + index:02d}가{1000 + index}",
+                "date": CREATE_DAY,
+                "startTime": slot(index),
+                "endTime": slot(index + 1),
+            },
+        )
+        for index in range(args.creates)
+    ]
+    burst += [
+        (
+            "/api/reservations/batch",
+            {
+                "sessionId": 1,
+                "plate": f"{60 + index:02d}나{2000 + index}",
+                "date": BATCH_DAY,
+                "startTimes": [f"{2 * index:02d}:00", f"{2 * index + 1:02d}:00"],
+            },
+        )
+        for index in range(args.batches)
+    ]
+    return burst
+
+
+def main(args: argparse.Namespace) -> None:
+    burst = requests_for(args)
+    with TestClient(create_app(), raise_server_exceptions=False) as client:
+        began = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(burst)) as pool:
+            responses = list(pool.map(lambda item: client.post(item[0], json=item[1]), burst))
+        elapsed = time.perf_counter() - began
+
+    outcomes = Counter(response.status_code for response in responses)
+    print(f"[burst] {len(burst)} concurrent writes in {elapsed:.2f} s: {dict(outcomes)}")
+    failures = [response for response in responses if response.status_code != 201]
+    for response in failures[:3]:
+        print(f"  {response.status_code} {response.text[:200]}")
+    if failures:
+        raise SystemExit(1)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Concurrent reservation writes vs. the DB pool.")
+    parser.add_argument("--creates", type=int, default=30, help="Concurrent single creates.")
+    parser.add_argument("--batches", type=int, default=8, help="Concurrent batch creates.")
+    return parser
+
+
+if __name__ == "__main__":
+    main(build_parser().parse_args())
@@ -0,0 +1,233 @@
+"""Fail when a crud query falls back to a full table scan.
+
+Usage:
+  ./.venv/Scripts/python tools/check_query_plans.py
+  ./.venv/Scripts/python tools/check_query_plans.py --rows 20000 --verbose
+
+Notes:
+  - Seeds a throwaway SQLite file (the real data/ev_charging.db is never touched),
+    runs the startup migrations, then calls every query-issuing function in
+    backend/app/crud.py and backend/app/change_log.py while recording the SQL it emits.
+  - Each distinct SELECT/UPDATE/DELETE is replayed through EXPLAIN QUERY PLAN with
+    its recorded parameters. A step that SCANs a reservation table fails the run;
+    an index walk is accepted only when the statement is bounded by LIMIT.
+  - The slot index and plate match cache are disabled so every lookup reaches SQL.
+  - Exit status is 1 when any plan regressed, so this can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+TMP_DIR = Path(tempfile.mkdtemp(prefix="ev-plans-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{(TMP_DIR / 'plans.db').as_posix()}"
+os.environ["SLOT_INDEX_ENABLED"] = "0"
+os.environ["PLATE_MATCH_CACHE_ENABLED"] = "0"
+
+from sqlalchemy import event, insert  # noqa: E402
+
+from backend.app import change_log, crud, migrations, models  # type: ignore  # noqa: E402
+from backend.app.database import SessionLocal, engine  # type: ignore  # noqa: E402
+from backend.app.models import ReservationStatus  # type: ignore  # noqa: E402
+
+SESSION_COUNT = 4
+# Tables small enough (one row per charging session / migration) that a scan is fine.
+SMALL_TABLES = {"charging_sessions", "schema_migrations"}
+BASE = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+SCAN_RE = re.compile(r"^SCAN (\w+)(?: USING (?:COVERING )?INDEX (\w+))?")
+
+
+def seed(rows: int, seed_value: int) -> list[str]:
+    """Insert ``rows`` one-hour reservations spread over the sessions; return their plates."""
+    rng = random.Random(seed_value)
+    plates = [f"{idx % 90 + 10}가{idx:04d}" for idx in range(max(1, rows // 8))]
+    statuses = list(ReservationStatus)
+    reservation_rows: list[dict] = []
+    slot_rows: list[dict] = []
+    for idx in range(rows):
+        session_id = idx % SESSION_COUNT + 1
+        start = BASE + timedelta(hours=idx // SESSION_COUNT)
+        plate = plates[idx % len(plates)]
+        reservation_id = f"r{idx:08d}"
+        reservation_rows.append(
+            {
+                "id": reservation_id,
+                "session_id": session_id,
+                "plate": plate,
+                "plate_normalized": plate,
+                "start_time": start,
+                "end_time": start + timedelta(hours=1),
+                "status": rng.choice(statuses),
+                "contact_email": f"user{idx % 500}@example.com",
+            }
+        )
+        for offset in (0, 30):
+            slot_rows.append(
+                {
+                    "reservation_id": reservation_id,
+                    "session_id": session_id,
+                    "slot_start": start + timedelta(minutes=offset),
+                }
+            )
+    with SessionLocal() as session:
+        crud.ensure_base_sessions(session, names=[f"세션 {idx}" for idx in range(1, SESSION_COUNT + 1)])
+        session.execute(insert(models.Reservation), reservation_rows)
+        session.execute(insert(models.ReservationSlot), slot_rows)
+        session.commit()
+    with engine.connect() as connection:
+        connection.exec_driver_sql("ANALYZE")
+        connection.commit()
+    return plates
+
+
+def exercise(plates: list[str]) -> None:
+    """Call every query-issuing crud function at least once."""
+    day = BASE.date() + timedelta(days=3)
+    plate = plates[3]
+    when = BASE + timedelta(hours=40, minutes=15)
+    with SessionLocal() as session:
+        crud.list_sessions(session)
+        crud.list_sessions(session, limit=2, offset=1)
+        crud.reservations_by_date(session, date_value=day)
+        crud.reservations_by_session_and_date(session, session_id=2, date_value=day)
+        crud.reservations_by_date_grouped(session, date_value=day)
+        crud.reservations_by_date_grouped(session, date_value=day, status=ReservationStatus.CONFIRMED)
+        start, end = BASE + timedelta(days=2), BASE + timedelta(days=9)
+        crud.reservations_grouped_by_session(session, start=start, end=end, session_ids=[1, 2])
+        crud.slot_bitmaps_by_date(session, session_ids=[1, 2, 3], date_value=day)
+        crud.find_conflicting_plate_reservation(session, plate=plate, start=None, end=None)
+        crud.find_conflicting_plate_reservation(
+            session, plate=plate, start=when, end=when + timedelta(hours=1)
+        )
+        crud.find_active_reservation_by_plate(session, plate=plate, when=when)
+        crud.find_active_reservation_by_plate_fuzzy(session, plate=plate + "9", when=when)
+        crud.find_active_reservations_by_plates(
+            session, candidates=[(plate, when), ("01가0001", when), (plate + "9", when)]
+        )
+        crud.reservations_for_user(session, email="User7@example.com")
+        crud.reservations_for_user(session, plate=plate, status=ReservationStatus.COMPLETED)
+        crud.ensure_no_overlap(session, session_id=1, start=when, end=when + timedelta(hours=2))
+        crud.schedule_version(session, date_value=day)
+
+        far = BASE + timedelta(days=3650)
+        created = crud.create_reservation(
+            session, session_id=1, plate="01가0001", start_time=far, end_time=far + timedelta(hours=1)
+        )
+        crud.create_reservation(
+            session,
+            session_id=2,
+            plate="01가0002",
+            start_time=far,
+            end_time=far + timedelta(hours=1),
+            optimistic=True,
+        )
+        crud.create_reservations_bulk(
+            session,
+            session_id=3,
+            plate="01가0003",
+            windows=[(far, far + timedelta(hours=1)), (far + timedelta(hours=2), far + timedelta(hours=3))],
+        )
+        session.commit()
+        crud.delete_reservation(session, created.id)
+        crud.delete_reservation_for_user(
+            session, reservation_id="r00000001", email="user1@example.com"
+        )
+        crud.sweep_reservation_statuses(session, now=BASE + timedelta(days=5))
+        session.flush()
+        change_log.latest_change_seq(session)
+        change_log.oldest_change_seq(session)
+        change_log.changes_since(session, since=3, limit=100)
+        change_log.changes_since(session, since=3, limit=100, business_date=day)
+        change_log.compact_changes(session, before=BASE + timedelta(days=1))
+        session.rollback()
+
+        watermark = crud.migrate_reservation_times_to_utc(session, limit=200)
+        crud.migrate_reservation_times_to_utc(session, after_id=watermark, limit=200)
+        watermark = crud.ensure_reservation_slots(session, limit=200)
+        crud.ensure_reservation_slots(session, after_id=watermark, limit=200)
+        session.rollback()
+
+
+def capture(fn, *args) -> list[tuple[str, object]]:
+    captured: list[tuple[str, object]] = []
+
+    def _record(_conn, _cursor, statement, parameters, _context, executemany) -> None:
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if verb in {"SELECT", "UPDATE", "DELETE"} and not executemany:
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        fn(*args)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return captured
+
+
+def violations(plan: list[str], statement: str) -> list[str]:
+    bounded = " LIMIT " in statement.upper()
+    problems = []
+    for detail in plan:
+        match = SCAN_RE.match(detail)
+        if not match or match.group(1) in SMALL_TABLES:
+            continue
+        if match.group(2) and bounded:
+            continue
+        problems.append(detail)
+    return problems
+
+
+def main(args: argparse.Namespace) -> int:
+    models.Base.metadata.create_all(bind=engine)
+    migrations.run_migrations(SessionLocal)
+    plates = seed(args.rows, args.seed)
+    statements = capture(exercise, plates)
+
+    seen: set[str] = set()
+    failures = 0
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        for statement, parameters in statements:
+            if statement in seen:
+                continue
+            seen.add(statement)
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plan = [row[3] for row in cursor.fetchall()]
+            problems = violations(plan, statement)
+            if problems:
+                failures += 1
+            if problems or args.verbose:
+                label = "FULL SCAN" if problems else "ok"
+                print(f"[{label}] {' '.join(statement.split())}")
+                for detail in plan:
+                    print(f"    {detail}")
+    finally:
+        raw.close()
+
+    print(f"[plans] {len(seen)} distinct statements over {args.rows} reservations, {failures} full scan(s)")
+    return 1 if failures else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Check crud query plans for full table scans.")
+    parser.add_argument("--rows", type=int, default=5000, help="Reservations to seed.")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for statuses.")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan, not just failures.")
+    return parser
+
+
+if __name__ == "__main__":
+    sys.exit(main(build_parser().parse_args()))
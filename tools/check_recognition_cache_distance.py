@@ -0,0 +1,83 @@
+"""Pick RECOGNITION_CACHE_MAX_DISTANCE from labelled camera frames.
+
+Usage:
+  ./.venv/Scripts/python tools/check_recognition_cache_distance.py --frames captures/
+  ./.venv/Scripts/python tools/check_recognition_cache_distance.py --frames captures/ --max-bits 24
+
+Notes:
+  - --frames holds one sub-directory per car, named after its plate, with that car's
+    frames from the production camera (e.g. captures/12가3456/*.jpg). Include cars
+    that parked in the same bay; they are the pairs a "similar" hit can confuse.
+  - Uses the same dHash as the recognition cache (backend.app.image_preprocess), so
+    requires opencv-python.
+  - For each threshold it prints how many same-car pairs would be reused and how many
+    different-car pairs would wrongly hit. A wrong hit returns another car's plate, so
+    keep the setting below the first threshold with any.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.app.image_preprocess import IMAGE_DECODING_AVAILABLE, perceptual_hash  # type: ignore  # noqa: E402
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+
+
+def load_hashes(frames: Path) -> list[tuple[str, int]]:
+    hashes: list[tuple[str, int]] = []
+    for car_dir in sorted(path for path in frames.iterdir() if path.is_dir()):
+        for image_path in sorted(car_dir.iterdir()):
+            if image_path.suffix.lower() not in IMAGE_SUFFIXES:
+                continue
+            phash = perceptual_hash(image_path.read_bytes())
+            if phash is None:
+                print(f"[skip] {image_path}: not decodable")
+                continue
+            hashes.append((car_dir.name, phash))
+    return hashes
+
+
+def main(args: argparse.Namespace) -> None:
+    if not IMAGE_DECODING_AVAILABLE:
+        raise SystemExit("opencv-python is required to compute perceptual hashes.")
+    hashes = load_hashes(Path(args.frames))
+    same: list[int] = []
+    different: list[int] = []
+    for (left_plate, left), (right_plate, right) in itertools.combinations(hashes, 2):
+        (same if left_plate == right_plate else different).append((left ^ right).bit_count())
+    cars = len({plate for plate, _ in hashes})
+    print(f"[frames] {len(hashes)} frames of {cars} cars: {len(same)} same-car, {len(different)} different-car pairs")
+    if not same or not different:
+        raise SystemExit("Need at least two cars with two or more frames each.")
+
+    print(f"[distance] same-car max {max(same)} bits, different-car min {min(different)} bits")
+    safe = -1
+    for bits in range(args.max_bits + 1):
+        reused = sum(distance <= bits for distance in same)
+        wrong = sum(distance <= bits for distance in different)
+        if wrong == 0:
+            safe = bits
+        print(f"  {bits:>3} bits: reuse {reused / len(same):6.1%} of same-car pairs, {wrong} wrong-car hit(s)")
+    if safe < 0:
+        print("[result] different cars collide even at 0 bits; keep RECOGNITION_CACHE_MAX_DISTANCE=0")
+    else:
+        print(f"[result] largest threshold without a wrong-car hit: {safe} bits")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Measure dHash distances between labelled frames.")
+    parser.add_argument("--frames", required=True, help="Directory with one sub-directory per plate.")
+    parser.add_argument("--max-bits", type=int, default=16, help="Largest threshold to report.")
+    return parser
+
+
+if __name__ == "__main__":
+    main(build_parser().parse_args())
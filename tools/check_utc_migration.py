@@ -0,0 +1,125 @@
+"""Check that a unique conflict in the UTC backfill does not drop the rest of its chunk.
+
+Usage:
+  ./.venv/Scripts/python tools/check_utc_migration.py
+
+Notes:
+  - Builds a throwaway SQLite DB with three reservations in one migration chunk:
+    "a" already in UTC, "b" and "c" stored as +09:00 wall times. Converting "b" moves
+    one of its slots onto a slot of "a" (a conflict the chunk's start-time lookup
+    cannot see); "c" converts cleanly.
+  - The ORM's SQLite DateTime drops UTC offsets, so rows "b" and "c" are handed to it
+    as +09:00 values on load, standing in for legacy rows written with an offset.
+  - Runs one chunk of crud.migrate_reservation_times_to_utc and commits it, as the
+    migration runner does. Expects "c" converted, "b" skipped and left as stored,
+    and the returned watermark at the end of the chunk. Exits 1 otherwise.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+TMP_DIR = Path(tempfile.mkdtemp(prefix="ev-check-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{(TMP_DIR / 'check.db').as_posix()}"
+
+from sqlalchemy import event, text  # noqa: E402
+from sqlalchemy.orm.attributes import set_committed_value  # noqa: E402
+
+from backend.app import crud  # type: ignore  # noqa: E402
+from backend.app.database import SessionLocal, engine  # type: ignore  # noqa: E402
+from backend.app.models import Base, ChargingSession, Reservation, ReservationSlot  # type: ignore  # noqa: E402
+
+KST = timezone(timedelta(hours=9))
+OFFSET_IDS = {"b", "c"}
+DAY = datetime(2030, 1, 2)
+
+
+class StoredWithOffset(datetime):
+    """A legacy offset-aware value; compares by its text, as SQLite compares it."""
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, datetime) and str(self) == str(other)
+
+    __hash__ = datetime.__hash__
+
+
+def as_offset_aware(target, columns: tuple[str, ...], reservation_id: str) -> None:
+    if reservation_id not in OFFSET_IDS:
+        return
+    for column in columns:
+        value = target.__dict__.get(column)
+        if value is not None and value.tzinfo is None:
+            set_committed_value(target, column, StoredWithOffset.combine(value.date(), value.time(), KST))
+
+
+@event.listens_for(Reservation, "load")
+@event.listens_for(Reservation, "refresh")
+def _reservation_offsets(target, *_args) -> None:
+    as_offset_aware(target, ("start_time", "end_time", "created_at", "updated_at"), target.id)
+
+
+@event.listens_for(ReservationSlot, "load")
+@event.listens_for(ReservationSlot, "refresh")
+def _slot_offsets(target, *_args) -> None:
+    as_offset_aware(target, ("slot_start",), target.reservation_id)
+
+
+def seed() -> None:
+    Base.metadata.create_all(engine)
+    windows = {"a": (1, 0), "b": (10, 30), "c": (12, 0)}
+    with SessionLocal() as session:
+        session.add(ChargingSession(id=1, name="세션 1"))
+        for reservation_id, (hour, minute) in windows.items():
+            start = DAY.replace(hour=hour, minute=minute)
+            session.add(
+                Reservation(
+                    id=reservation_id,
+                    session_id=1,
+                    plate=f"12가345{len(reservation_id)}",
+                    plate_normalized=f"12가345{len(reservation_id)}",
+                    start_time=start,
+                    end_time=start + timedelta(hours=1),
+                )
+            )
+            for offset in (0, 30):
+                session.add(
+                    ReservationSlot(
+                        reservation_id=reservation_id,
+                        session_id=1,
+                        slot_start=start + timedelta(minutes=offset),
+                    )
+                )
+        session.commit()
+
+
+def stored_starts() -> dict[str, str]:
+    with engine.connect() as connection:
+        rows = connection.execute(text("SELECT id, start_time FROM reservations ORDER BY id"))
+        return {reservation_id: str(start)[:16] for reservation_id, start in rows}
+
+
+def main() -> None:
+    seed()
+    with SessionLocal() as session:
+        watermark = crud.migrate_reservation_times_to_utc(session, after_id=None)
+        session.commit()
+
+    starts = stored_starts()
+    expected = {"a": "2030-01-02 01:00", "b": "2030-01-02 10:30", "c": "2030-01-02 03:00"}
+    print(f"[migration] watermark {watermark!r}, stored starts {starts}")
+    if watermark != "c" or starts != expected:
+        print(f"[fail] expected watermark 'c' and starts {expected}")
+        raise SystemExit(1)
+    print("[ok] conflicting row skipped, rest of the chunk converted")
+
+
+if __name__ == "__main__":
+    main()
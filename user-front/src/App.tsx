@@ -28,7 +28,7 @@ import { KR_PLATE_REGEX } from "./utils/validation";
 import {
   createReservation,
   deleteReservation,
-  listReservationsBySession,
+  listSessionAvailability,
   login,
   lookupPlate,
   myReservations,
@@ -36,7 +36,7 @@ import {
   verifySlot,
   recognizePlate,
 } from "./api/client";
-import type { Reservation, SessionReservations } from "./api/types";
+import type { Reservation, SessionAvailability } from "./api/types";
 
 type WeatherInfo = {
   temp: number;
@@ -154,15 +154,30 @@ useEffect(() => {
 
         const responses = await Promise.all(
           range.map(async (iso) => {
-            const { sessions } = await listReservationsBySession(iso);
+            const { sessions } = await listSessionAvailability(iso);
             return { iso, sessions };
           })
         );
 
         if (cancelled) return;
 
+        const occupiedFromFree = (session: SessionAvailability | undefined) => {
+          const occupied = new Set<string>();
+          if (!session) return occupied;
+          SLOTS.forEach((slot) => occupied.add(slot));
+          session.free.forEach((range) => {
+            let current = toMinutes(range.startTime);
+            const end = toMinutes(range.endTime);
+            while (current < end) {
+              occupied.delete(fromMinutes(current));
+              current += 30;
+            }
+          });
+          return occupied;
+        };
+
         const strips: AvailabilityStrip[] = [];
-        let selectedSession: SessionReservations | undefined;
+        let selectedSession: SessionAvailability | undefined;
 
         responses.forEach(({ iso, sessions }) => {
           const session = sessions.find((item) => item.sessionId === sessionId);
@@ -170,15 +185,7 @@ useEffect(() => {
             selectedSession = session;
           }
 
-          const occupied = new Set<string>();
-          session?.reservations.forEach((reservation) => {
-            let current = toMinutes(reservation.startTime);
-            const end = toMinutes(reservation.endTime);
-            while (current < end) {
-              occupied.add(fromMinutes(current));
-              current += 30;
-            }
-          });
+          const occupied = occupiedFromFree(session);
 
           const free = Math.max(0, SLOTS.length - occupied.size);
           const freePct = Math.round((free / SLOTS.length) * 100);
@@ -196,15 +203,7 @@ useEffect(() => {
 
         setStripData(strips);
 
-        const nextOccupied = new Set<string>();
-        selectedSession?.reservations.forEach((reservation) => {
-          let current = toMinutes(reservation.startTime);
-          const end = toMinutes(reservation.endTime);
-          while (current < end) {
-            nextOccupied.add(fromMinutes(current));
-            current += 30;
-          }
-        });
+        const nextOccupied = occupiedFromFree(selectedSession);
         setOccupiedSet(nextOccupied);
 
         if (multiMode) {
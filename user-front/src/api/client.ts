@@ -1,4 +1,5 @@
 import {
+  AvailabilityResponse,
   CreateReservationPayload,
   LoginResponse,
   Reservation,
@@ -51,6 +52,14 @@ export async function listReservationsBySession(dateISO: string): Promise<Sessio
   return (await res.json()) as SessionsResponse;
 }
 
+export async function listSessionAvailability(dateISO: string): Promise<AvailabilityResponse> {
+  const res = await fetch(
+    `${API_BASE}/api/sessions/availability?date=${encodeURIComponent(dateISO)}`
+  );
+  if (!res.ok) throw new Error(await extractError(res));
+  return (await res.json()) as AvailabilityResponse;
+}
+
 export async function verifySlot(payload: VerifySlotPayload): Promise<VerifySlotResponse> {
   const res = await fetch(`${API_BASE}/api/plates/verify`, {
     method: "POST",
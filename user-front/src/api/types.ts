@@ -25,6 +25,23 @@ export interface SessionsResponse {
   sessions: SessionReservations[];
 }
 
+export interface AvailabilityRange {
+  startTime: string;
+  endTime: string;
+}
+
+export interface SessionAvailability {
+  sessionId: number;
+  name: string;
+  free: AvailabilityRange[];
+}
+
+export interface AvailabilityResponse {
+  date: string;
+  slotMinutes: number;
+  sessions: SessionAvailability[];
+}
+
 export interface LoginResponse {
   token: string;
   user: { email: string };